@@ -31,7 +31,7 @@ class ConvertResponse(BaseModel):
 
 
 @router.post("/convert/odt2md", response_model=ConvertResponse)
-async def convert_odt_to_md(request: ConvertRequest):
+def convert_odt_to_md(request: ConvertRequest):
     """
     Convert ODT file to Markdown.
 
@@ -51,7 +51,7 @@ async def convert_odt_to_md(request: ConvertRequest):
 
 
 @router.post("/convert/odt2html", response_model=ConvertResponse)
-async def convert_odt_to_html(request: ConvertRequest):
+def convert_odt_to_html(request: ConvertRequest):
     """
     Convert ODT file to HTML.
 
@@ -71,7 +71,7 @@ async def convert_odt_to_html(request: ConvertRequest):
 
 
 @router.post("/convert/docx2md", response_model=ConvertResponse)
-async def convert_docx_to_md(request: ConvertRequest):
+def convert_docx_to_md(request: ConvertRequest):
     """
     Convert DOCX file to Markdown.
 
@@ -91,7 +91,7 @@ async def convert_docx_to_md(request: ConvertRequest):
 
 
 @router.post("/convert/docx2html", response_model=ConvertResponse)
-async def convert_docx_to_html(request: ConvertRequest):
+def convert_docx_to_html(request: ConvertRequest):
     """
     Convert DOCX file to HTML.
 
@@ -111,7 +111,7 @@ async def convert_docx_to_html(request: ConvertRequest):
 
 
 @router.post("/convert/pdf2md", response_model=ConvertResponse)
-async def convert_pdf_to_md(request: ConvertRequest):
+def convert_pdf_to_md(request: ConvertRequest):
     """
     Convert PDF file to Markdown.
 
@@ -131,7 +131,7 @@ async def convert_pdf_to_md(request: ConvertRequest):
 
 
 @router.post("/convert/pdf2html", response_model=ConvertResponse)
-async def convert_pdf_to_html(request: ConvertRequest):
+def convert_pdf_to_html(request: ConvertRequest):
     """
     Convert PDF file to HTML.
 
@@ -535,9 +535,9 @@ async def convert_file(
                     FROM resume_detail
                     WHERE resume_id = :resume_id
                 """)
-                html_result = db.execute(html_query, {"resume_id": request.resume_id}).first()
+                resume_html = db.execute(html_query, {"resume_id": request.resume_id}).scalar()
 
-                if not html_result or not html_result.resume_html_rewrite:
+                if not resume_html:
                     logger.error(f"No HTML content found in database", resume_id=request.resume_id)
                     raise HTTPException(status_code=404,
                                       detail=f"No HTML content found for resume_id: {request.resume_id}")
@@ -547,7 +547,7 @@ async def convert_file(
 
                 # Write HTML content to disk
                 with open(input_path, 'w', encoding='utf-8') as f:
-                    f.write(html_result.resume_html_rewrite)
+                    f.write(resume_html)
 
                 logger.debug(f"HTML content written to disk", file_path=input_path)
 
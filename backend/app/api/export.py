@@ -1,19 +1,155 @@
 import os
 import csv
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from itertools import chain
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import text
+from sqlalchemy.engine import Connection
 
-from ..core.database import get_db
+from ..core.database import get_connection
 from ..core.config import settings
 from ..utils.logger import logger
 
 router = APIRouter()
 
+# Rows fetched per server-side cursor partition; only one partition is held in memory
+EXPORT_BATCH_SIZE = 1000
+
+# Export queries, built once so SQLAlchemy's compiled statement cache is reused
+_EXPORT_JOB_SQL = text("""
+    SELECT j.*, jd.job_desc, jd.job_qualification, jd.job_keyword
+    FROM job j
+    LEFT JOIN job_detail jd ON (j.job_id = jd.job_id)
+    WHERE j.job_id > 0
+    ORDER BY j.job_created DESC
+""")
+
+_EXPORT_CONTACT_SQL = text("""
+    SELECT * FROM contact
+    WHERE contact_id > 0
+    ORDER BY contact_created DESC
+""")
+
+_EXPORT_NOTE_SQL = text("""
+    SELECT * FROM note
+    WHERE note_id > 0
+    ORDER BY note_created DESC
+""")
+
+_EXPORT_CALENDAR_SQL = text("""
+    SELECT * FROM calendar
+    WHERE note_id > 0
+    ORDER BY start_date DESC
+""")
+
+_EXPORT_RESUME_SQL = text("""
+    SELECT * FROM resume r
+    LEFT JOIN resume_detail rd ON (r.resume_id = rd.resume_id)
+    WHERE r.resume_id > 0
+    ORDER BY r.is_baseline, r.resume_created DESC
+""")
+
+# Cached export date stamp: ["YYYY-MM-DD", epoch seconds of the next local midnight]
+_export_date_cache = ["", 0.0]
+
+
+def _export_date() -> str:
+    """
+    Get the current local date as YYYY-MM-DD for export filenames.
+
+    The formatted string is cached until the next local midnight, so most
+    calls cost a single time.time() comparison.
+    """
+    if time.time() >= _export_date_cache[1]:
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _export_date_cache[:] = [now.strftime("%Y-%m-%d"), next_midnight.timestamp()]
+    return _export_date_cache[0]
+
+
+def _format_csv_value(value):
+    """
+    Normalize a database value for CSV output.
+
+    PostgreSQL arrays (like job_keyword) become comma-separated strings
+    and None becomes an empty string; all other values pass through.
+    """
+    if isinstance(value, list):
+        return ', '.join(str(item) for item in value)
+    if value is None:
+        return ''
+    return value
+
+
+def _write_csv(file_path: str, column_names: list, partitions) -> int:
+    """
+    Write a header row and partitions of result rows to a CSV file.
+
+    Each partition is fed to csv.writer.writerows and flushed to disk before
+    the next one is fetched, so peak memory is bounded by one partition
+    rather than the whole result set.
+
+    Args:
+        file_path: Destination path of the CSV file
+        column_names: Header row
+        partitions: Iterable of row batches (tuples in column order)
+
+    Returns:
+        Number of data rows written
+    """
+    row_count = 0
+    with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(column_names)
+        for rows in partitions:
+            writer.writerows([_format_csv_value(value) for value in row] for row in rows)
+            csvfile.flush()
+            row_count += len(rows)
+    return row_count
+
+
+def _export_query_to_csv(conn: Connection, query, file_prefix: str):
+    """
+    Run an export query and stream its rows into a dated CSV file.
+
+    This is blocking database and file I/O, so handlers run it through
+    run_in_threadpool to keep the event loop free during long exports.
+
+    Args:
+        conn: Database connection
+        query: SQL query selecting the rows to export
+        file_prefix: Filename prefix, e.g. 'job_export'
+
+    Returns:
+        Tuple of (export_dir, filename, row_count), or None if the query
+        returned no rows
+    """
+    # Stream rows through a server-side cursor in fixed-size partitions
+    result = conn.execute(query, execution_options={"yield_per": EXPORT_BATCH_SIZE})
+    partitions = result.partitions(EXPORT_BATCH_SIZE)
+    first_batch = next(partitions, None)
+
+    if not first_batch:
+        return None
+
+    # Create export directory if it doesn't exist
+    export_dir = settings.export_dir
+    os.makedirs(export_dir, exist_ok=True)
+
+    # Generate filename with current date
+    filename = f"{file_prefix}-{_export_date()}.csv"
+    file_path = os.path.join(export_dir, filename)
+
+    # Write CSV file one partition at a time
+    row_count = _write_csv(file_path, list(result.keys()), chain([first_batch], partitions))
+
+    return export_dir, filename, row_count
+
 
 @router.get("/export/job", status_code=status.HTTP_200_OK)
-async def export_jobs(db: Session = Depends(get_db)):
+async def export_jobs(conn: Connection = Depends(get_connection)):
     """
     Export all job data to a CSV file.
 
@@ -26,64 +162,20 @@ async def export_jobs(db: Session = Depends(get_db)):
             - job_export_file: The filename of the exported CSV
     """
     try:
-        # Execute the query to get all job data
-        query = text("""
-            SELECT j.*, jd.job_desc, jd.job_qualification, jd.job_keyword
-            FROM job j
-            LEFT JOIN job_detail jd ON (j.job_id = jd.job_id)
-            WHERE j.job_id > 0
-            ORDER BY j.job_created DESC
-        """)
-
-        results = db.execute(query).fetchall()
-
-        if not results:
+        export = await run_in_threadpool(_export_query_to_csv, conn, _EXPORT_JOB_SQL, "job_export")
+
+        if export is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No job data found to export"
             )
 
-        # Create export directory if it doesn't exist
-        export_dir = settings.export_dir
-        os.makedirs(export_dir, exist_ok=True)
-
-        # Generate filename with current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        filename = f"job_export-{current_date}.csv"
+        export_dir, filename, row_count = export
         file_path = os.path.join(export_dir, filename)
 
-        # Get column names from the first result
-        column_names = list(results[0]._mapping.keys())
-
-        # Write CSV file
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header row
-            writer.writerow(column_names)
-
-            # Write data rows
-            for row in results:
-                row_data = []
-                for col_name in column_names:
-                    value = row._mapping[col_name]
-
-                    # Handle PostgreSQL arrays (like job_keyword)
-                    if isinstance(value, list):
-                        # Convert list to comma-separated string
-                        value = ', '.join(str(item) for item in value)
-
-                    # Handle None values
-                    if value is None:
-                        value = ''
-
-                    row_data.append(value)
-
-                writer.writerow(row_data)
-
         logger.info(f"Job data exported successfully",
                    file_path=file_path,
-                   row_count=len(results))
+                   row_count=row_count)
 
         return {
             "job_export_dir": export_dir,
@@ -101,7 +193,7 @@ async def export_jobs(db: Session = Depends(get_db)):
 
 
 @router.get("/export/contacts", status_code=status.HTTP_200_OK)
-async def export_contacts(db: Session = Depends(get_db)):
+async def export_contacts(conn: Connection = Depends(get_connection)):
     """
     Export all contact data to a CSV file.
 
@@ -114,61 +206,20 @@ async def export_contacts(db: Session = Depends(get_db)):
             - contact_export_file: The filename of the exported CSV
     """
     try:
-        # Execute the query to get all contact data
-        query = text("""
-            SELECT * FROM contact
-            WHERE contact_id > 0
-            ORDER BY contact_created DESC
-        """)
-
-        results = db.execute(query).fetchall()
+        export = await run_in_threadpool(_export_query_to_csv, conn, _EXPORT_CONTACT_SQL, "contact_export")
 
-        if not results:
+        if export is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No contact data found to export"
             )
 
-        # Create export directory if it doesn't exist
-        export_dir = settings.export_dir
-        os.makedirs(export_dir, exist_ok=True)
-
-        # Generate filename with current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        filename = f"contact_export-{current_date}.csv"
+        export_dir, filename, row_count = export
         file_path = os.path.join(export_dir, filename)
 
-        # Get column names from the first result
-        column_names = list(results[0]._mapping.keys())
-
-        # Write CSV file
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header row
-            writer.writerow(column_names)
-
-            # Write data rows
-            for row in results:
-                row_data = []
-                for col_name in column_names:
-                    value = row._mapping[col_name]
-
-                    # Handle PostgreSQL arrays
-                    if isinstance(value, list):
-                        value = ', '.join(str(item) for item in value)
-
-                    # Handle None values
-                    if value is None:
-                        value = ''
-
-                    row_data.append(value)
-
-                writer.writerow(row_data)
-
         logger.info(f"Contact data exported successfully",
                    file_path=file_path,
-                   row_count=len(results))
+                   row_count=row_count)
 
         return {
             "contact_export_dir": export_dir,
@@ -186,7 +237,7 @@ async def export_contacts(db: Session = Depends(get_db)):
 
 
 @router.get("/export/notes", status_code=status.HTTP_200_OK)
-async def export_notes(db: Session = Depends(get_db)):
+async def export_notes(conn: Connection = Depends(get_connection)):
     """
     Export all note data to a CSV file.
 
@@ -199,61 +250,20 @@ async def export_notes(db: Session = Depends(get_db)):
             - note_export_file: The filename of the exported CSV
     """
     try:
-        # Execute the query to get all note data
-        query = text("""
-            SELECT * FROM note
-            WHERE note_id > 0
-            ORDER BY note_created DESC
-        """)
-
-        results = db.execute(query).fetchall()
+        export = await run_in_threadpool(_export_query_to_csv, conn, _EXPORT_NOTE_SQL, "notes_export")
 
-        if not results:
+        if export is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No note data found to export"
             )
 
-        # Create export directory if it doesn't exist
-        export_dir = settings.export_dir
-        os.makedirs(export_dir, exist_ok=True)
-
-        # Generate filename with current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        filename = f"notes_export-{current_date}.csv"
+        export_dir, filename, row_count = export
         file_path = os.path.join(export_dir, filename)
 
-        # Get column names from the first result
-        column_names = list(results[0]._mapping.keys())
-
-        # Write CSV file
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header row
-            writer.writerow(column_names)
-
-            # Write data rows
-            for row in results:
-                row_data = []
-                for col_name in column_names:
-                    value = row._mapping[col_name]
-
-                    # Handle PostgreSQL arrays
-                    if isinstance(value, list):
-                        value = ', '.join(str(item) for item in value)
-
-                    # Handle None values
-                    if value is None:
-                        value = ''
-
-                    row_data.append(value)
-
-                writer.writerow(row_data)
-
         logger.info(f"Note data exported successfully",
                    file_path=file_path,
-                   row_count=len(results))
+                   row_count=row_count)
 
         return {
             "note_export_dir": export_dir,
@@ -271,7 +281,7 @@ async def export_notes(db: Session = Depends(get_db)):
 
 
 @router.get("/export/calendar", status_code=status.HTTP_200_OK)
-async def export_calendar(db: Session = Depends(get_db)):
+async def export_calendar(conn: Connection = Depends(get_connection)):
     """
     Export all calendar data to a CSV file.
 
@@ -284,61 +294,20 @@ async def export_calendar(db: Session = Depends(get_db)):
             - calendar_export_file: The filename of the exported CSV
     """
     try:
-        # Execute the query to get all calendar data
-        query = text("""
-            SELECT * FROM calendar
-            WHERE note_id > 0
-            ORDER BY start_date DESC
-        """)
-
-        results = db.execute(query).fetchall()
+        export = await run_in_threadpool(_export_query_to_csv, conn, _EXPORT_CALENDAR_SQL, "calendar_export")
 
-        if not results:
+        if export is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No calendar data found to export"
             )
 
-        # Create export directory if it doesn't exist
-        export_dir = settings.export_dir
-        os.makedirs(export_dir, exist_ok=True)
-
-        # Generate filename with current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        filename = f"calendar_export-{current_date}.csv"
+        export_dir, filename, row_count = export
         file_path = os.path.join(export_dir, filename)
 
-        # Get column names from the first result
-        column_names = list(results[0]._mapping.keys())
-
-        # Write CSV file
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header row
-            writer.writerow(column_names)
-
-            # Write data rows
-            for row in results:
-                row_data = []
-                for col_name in column_names:
-                    value = row._mapping[col_name]
-
-                    # Handle PostgreSQL arrays
-                    if isinstance(value, list):
-                        value = ', '.join(str(item) for item in value)
-
-                    # Handle None values
-                    if value is None:
-                        value = ''
-
-                    row_data.append(value)
-
-                writer.writerow(row_data)
-
         logger.info(f"Calendar data exported successfully",
                    file_path=file_path,
-                   row_count=len(results))
+                   row_count=row_count)
 
         return {
             "calendar_export_dir": export_dir,
@@ -356,7 +325,7 @@ async def export_calendar(db: Session = Depends(get_db)):
 
 
 @router.get("/export/resumes", status_code=status.HTTP_200_OK)
-async def export_resumes(db: Session = Depends(get_db)):
+async def export_resumes(conn: Connection = Depends(get_connection)):
     """
     Export all resume data to a CSV file.
 
@@ -369,62 +338,20 @@ async def export_resumes(db: Session = Depends(get_db)):
             - resume_export_file: The filename of the exported CSV
     """
     try:
-        # Execute the query to get all resume data
-        query = text("""
-            SELECT * FROM resume r
-            LEFT JOIN resume_detail rd ON (r.resume_id = rd.resume_id)
-            WHERE r.resume_id > 0
-            ORDER BY r.is_baseline, r.resume_created DESC
-        """)
-
-        results = db.execute(query).fetchall()
+        export = await run_in_threadpool(_export_query_to_csv, conn, _EXPORT_RESUME_SQL, "resumes_export")
 
-        if not results:
+        if export is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No resume data found to export"
             )
 
-        # Create export directory if it doesn't exist
-        export_dir = settings.export_dir
-        os.makedirs(export_dir, exist_ok=True)
-
-        # Generate filename with current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        filename = f"resumes_export-{current_date}.csv"
+        export_dir, filename, row_count = export
         file_path = os.path.join(export_dir, filename)
 
-        # Get column names from the first result
-        column_names = list(results[0]._mapping.keys())
-
-        # Write CSV file
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Write header row
-            writer.writerow(column_names)
-
-            # Write data rows
-            for row in results:
-                row_data = []
-                for col_name in column_names:
-                    value = row._mapping[col_name]
-
-                    # Handle PostgreSQL arrays
-                    if isinstance(value, list):
-                        value = ', '.join(str(item) for item in value)
-
-                    # Handle None values
-                    if value is None:
-                        value = ''
-
-                    row_data.append(value)
-
-                writer.writerow(row_data)
-
         logger.info(f"Resume data exported successfully",
                    file_path=file_path,
-                   row_count=len(results))
+                   row_count=row_count)
 
         return {
             "resume_export_dir": export_dir,
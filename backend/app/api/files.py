@@ -1,17 +1,81 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 import os
+from typing import Optional
 from ..core.config import settings
 from ..core.database import get_db
 from ..utils.logger import logger
-from ..utils.file_helpers import create_standardized_download_file
+from ..utils.file_helpers import create_standardized_download_file, get_logo_info
+from ..utils.http_helpers import etag_matches
 
 router = APIRouter()
 
+# Served files are personal documents: only the user's browser may store
+# them, and it must revalidate via ETag before each reuse
+FILE_CACHE_CONTROL = "private, no-cache"
+
+
+def _stat_etag(stat_result: os.stat_result) -> str:
+    """
+    Build a validator for a file from its modification time and size.
+
+    Args:
+        stat_result: Result of os.stat() for the file
+
+    Returns:
+        Quoted ETag string
+    """
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _file_etag(file_path: str) -> Optional[str]:
+    """
+    Build a validator for a file on disk.
+
+    Args:
+        file_path: Path to the file on disk
+
+    Returns:
+        Quoted ETag string, or None if the file could not be stat'ed
+    """
+    try:
+        return _stat_etag(os.stat(file_path))
+    except OSError:
+        return None
+
+
+def _cache_headers(etag: Optional[str]) -> dict:
+    """
+    Build the caching headers sent with a file response.
+
+    Args:
+        etag: ETag for the file, or None if unavailable
+
+    Returns:
+        Dictionary of response headers
+    """
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": FILE_CACHE_CONTROL}
+
+
+def _is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """
+    Check whether the client's cached copy matches the current file.
+
+    Args:
+        request: Incoming request carrying the If-None-Match header
+        etag: Current ETag for the file
+
+    Returns:
+        True if a 304 Not Modified response can be sent
+    """
+    return etag is not None and etag_matches(request, etag)
+
 
 @router.get("/files/cover_letters/{file_name}")
-async def download_cover_letter(file_name: str, db: Session = Depends(get_db)):
+async def download_cover_letter(file_name: str, request: Request, db: Session = Depends(get_db)):
     """
     Serve a cover letter file for download with standardized naming.
 
@@ -33,6 +97,10 @@ async def download_cover_letter(file_name: str, db: Session = Depends(get_db)):
                 detail=f"File not found: {file_name}"
             )
 
+        etag = _file_etag(file_path)
+        if _is_not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
         # Create standardized download file
         tmp_path, download_name, mime_type = create_standardized_download_file(
             source_file_path=file_path,
@@ -47,7 +115,8 @@ async def download_cover_letter(file_name: str, db: Session = Depends(get_db)):
         return FileResponse(
             path=tmp_path,
             media_type=mime_type,
-            filename=download_name
+            filename=download_name,
+            headers=_cache_headers(etag)
         )
 
     except HTTPException:
@@ -63,7 +132,7 @@ async def download_cover_letter(file_name: str, db: Session = Depends(get_db)):
 
 
 @router.get("/files/resumes/{file_name}")
-async def download_resume(file_name: str, db: Session = Depends(get_db)):
+async def download_resume(file_name: str, request: Request, db: Session = Depends(get_db)):
     """
     Serve a resume file for download with standardized naming.
 
@@ -85,6 +154,10 @@ async def download_resume(file_name: str, db: Session = Depends(get_db)):
                 detail=f"File not found: {file_name}"
             )
 
+        etag = _file_etag(file_path)
+        if _is_not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
         # Create standardized download file
         tmp_path, download_name, mime_type = create_standardized_download_file(
             source_file_path=file_path,
@@ -99,7 +172,8 @@ async def download_resume(file_name: str, db: Session = Depends(get_db)):
         return FileResponse(
             path=tmp_path,
             media_type=mime_type,
-            filename=download_name
+            filename=download_name,
+            headers=_cache_headers(etag)
         )
 
     except HTTPException:
@@ -115,7 +189,7 @@ async def download_resume(file_name: str, db: Session = Depends(get_db)):
 
 
 @router.get("/files/exports/{file_name}")
-async def download_export(file_name: str):
+async def download_export(file_name: str, request: Request):
     """
     Serve an export CSV file for download.
 
@@ -134,12 +208,17 @@ async def download_export(file_name: str):
                 detail=f"Export file not found: {file_name}"
             )
 
+        etag = _file_etag(file_path)
+        if _is_not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
         logger.info(f"Serving export file", file_name=file_name)
 
         return FileResponse(
             path=file_path,
             media_type='text/csv',
-            filename=file_name
+            filename=file_name,
+            headers=_cache_headers(etag)
         )
 
     except HTTPException:
@@ -155,7 +234,7 @@ async def download_export(file_name: str):
 
 
 @router.get("/files/logos/{file_name}")
-async def serve_logo(file_name: str):
+async def serve_logo(file_name: str, request: Request):
     """
     Serve a company logo file.
 
@@ -168,29 +247,25 @@ async def serve_logo(file_name: str):
     try:
         file_path = os.path.join(settings.logo_dir, file_name)
 
-        if not os.path.exists(file_path):
+        logo = get_logo_info(file_path)
+        if logo is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Logo file not found: {file_name}"
             )
 
-        # Determine mime type from file extension
-        extension = file_name.split('.')[-1].lower()
-        mime_type_map = {
-            'png': 'image/png',
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'gif': 'image/gif',
-            'svg': 'image/svg+xml',
-            'webp': 'image/webp'
-        }
-        mime_type = mime_type_map.get(extension, 'image/png')
+        stat_result, mime_type = logo
+        etag = _stat_etag(stat_result)
+        if _is_not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
 
         logger.info(f"Serving logo file", file_name=file_name, mime_type=mime_type)
 
         return FileResponse(
             path=file_path,
-            media_type=mime_type
+            media_type=mime_type,
+            stat_result=stat_result,
+            headers=_cache_headers(etag)
         )
 
     except HTTPException:
@@ -206,7 +281,7 @@ async def serve_logo(file_name: str):
 
 
 @router.get("/files/reports/{file_name}")
-async def download_report(file_name: str):
+async def download_report(file_name: str, request: Request):
     """
     Serve a company report file for download.
 
@@ -225,12 +300,17 @@ async def download_report(file_name: str):
                 detail=f"Report file not found: {file_name}"
             )
 
+        etag = _file_etag(file_path)
+        if _is_not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
         logger.info(f"Serving report file", file_name=file_name)
 
         return FileResponse(
             path=file_path,
             media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            filename=file_name
+            filename=file_name,
+            headers=_cache_headers(etag)
         )
 
     except HTTPException:
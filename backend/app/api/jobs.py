@@ -1,65 +1,158 @@
+import threading
+from decimal import Decimal
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-
-from ..core.database import get_db
-from ..models.models import Job, JobDetail
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+import orjson
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import text, update, func, select, lambda_stmt, bindparam, Integer
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+
+from ..core.database import get_db, SessionLocal
+from ..models.models import Job, JobDetail, Process
 from ..schemas.job import Job as JobSchema, JobCreate, JobUpdate, JobList, JobExtractRequest, JobExtractResponse, JobDetailCreate
 from ..utils.directory import create_job_directory
 from ..utils.ai_agent import AiAgent
 from ..utils.logger import logger
-from ..utils.job_helpers import calc_avg_score
+from ..utils.http_helpers import etag_response
+from ..utils.job_helpers import calc_avg_score, is_missing_job_error
 
 router = APIRouter()
 
+# Rows per server-side cursor partition when streaming the job list
+JOB_STREAM_BATCH_SIZE = 500
+
+_JOB_LIST_ADAPTER = TypeAdapter(List[JobSchema])
+
+# Active jobs with calendar data from the most recent appointment; the
+# detail variant also joins job_detail
+_GET_ALL_JOBS_SQL_TEMPLATE = """
+    SELECT c.calendar_id, c.start_date, c.start_time, j.*{detail_columns}
+    FROM job j
+        LEFT JOIN LATERAL (
+            SELECT start_date, start_time, calendar_id
+            FROM calendar c_inner
+            WHERE c_inner.job_id=j.job_id
+            ORDER BY start_date DESC
+            LIMIT 1
+        ) AS c ON TRUE
+        {detail_join}
+    WHERE j.job_active = true
+    ORDER BY j.last_activity DESC
+"""
+
+_GET_ALL_JOBS_SQL = text(_GET_ALL_JOBS_SQL_TEMPLATE.format(detail_columns="", detail_join=""))
+
+_GET_ALL_JOBS_DETAIL_SQL = text(_GET_ALL_JOBS_SQL_TEMPLATE.format(
+    detail_columns=", jd.job_desc, jd.job_qualification, jd.job_keyword",
+    detail_join="LEFT JOIN job_detail jd ON (jd.job_id = j.job_id)"
+))
+
+_GET_JOB_SQL = text("""
+    SELECT j.*, jd.job_desc, jd.job_qualification, jd.job_keyword
+    FROM job j
+    LEFT JOIN job_detail jd ON j.job_id = jd.job_id
+    WHERE j.job_id = :job_id AND j.job_active = true
+""").bindparams(bindparam("job_id", type_=Integer))
+
+# Dropdown query; lambda_stmt caches the constructed statement as well as its compiled SQL
+_JOB_LIST_STMT = lambda_stmt(
+    lambda: select(Job.job_id, Job.company, Job.job_title)
+    .where(Job.job_active == True)
+    .order_by(Job.last_activity.desc(), Job.date_applied.desc())
+)
+
+
+def _json_default(value):
+    """
+    Serialize the column types orjson does not handle natively.
+
+    numeric columns (average_score) come back from psycopg2 as Decimal.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
 
-@router.get("/jobs", response_model=List[JobSchema])
-async def get_all_jobs(db: Session = Depends(get_db)):
+@router.get("/jobs", response_model=List[JobSchema], response_model_exclude_unset=True)
+def get_all_jobs(include_detail: bool = False, db: Session = Depends(get_db)):
     """
     Get all active jobs ordered by last activity (newest first).
     Includes latest calendar appointment data if available.
+
+    Query params:
+    - include_detail: also return job_desc, job_qualification and job_keyword
+      from job_detail, joined in the same query (avoids one /job/{id} call per job)
+    """
+    logger.debug("Fetching all active jobs", include_detail=include_detail)
+
+    query = _GET_ALL_JOBS_DETAIL_SQL if include_detail else _GET_ALL_JOBS_SQL
+
+    # The body is streamed after this handler returns, and when get_db's
+    # teardown runs relative to that differs between FastAPI versions. The
+    # stream therefore opens and closes its own connection on the session's
+    # engine; the session itself never checks one out.
+    return StreamingResponse(_stream_jobs(db.get_bind(), query), media_type="application/json")
+
+
+def _stream_jobs(bind, query):
     """
-    logger.debug("Fetching all active jobs")
+    Run the job list query and serialize it as a JSON array, one partition
+    at a time.
+
+    Each partition is validated against JobSchema (from_attributes, straight
+    off the Row objects) and dumped to JSON by pydantic-core, so memory is
+    bounded by one partition rather than the whole list.
 
-    # Use raw SQL to include calendar data from most recent appointment
-    query = text("""
-        SELECT c.calendar_id, c.start_date, c.start_time, j.*
-        FROM job j
-            LEFT JOIN LATERAL (
-                SELECT start_date, start_time, calendar_id
-                FROM calendar c_inner
-                WHERE c_inner.job_id=j.job_id
-                ORDER BY start_date DESC
-                LIMIT 1
-            ) AS c ON TRUE
-        WHERE j.job_active = true
-        ORDER BY j.last_activity DESC
-    """)
+    The status line has already been sent when the query runs, so a database
+    error cannot become a 500. It is logged and re-raised, which aborts the
+    transfer instead of ending it as a complete-looking 200.
 
-    result = db.execute(query).fetchall()
+    Args:
+        bind: Engine to open the streaming connection on
+        query: Job list query
 
-    logger.log_database_operation("SELECT", "job")
-    logger.debug(f"Retrieved all jobs", count=len(result))
+    Yields:
+        Chunks of the JSON response body
+    """
+    count = 0
+    try:
+        with bind.connect() as conn:
+            result = conn.execution_options(yield_per=JOB_STREAM_BATCH_SIZE).execute(query)
+            logger.log_database_operation("SELECT", "job")
+
+            yield b"["
+            for rows in result.partitions(JOB_STREAM_BATCH_SIZE):
+                jobs = _JOB_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+                if count:
+                    yield b","
+                # Strip the brackets so partitions join into a single array
+                yield _JOB_LIST_ADAPTER.dump_json(jobs, exclude_unset=True)[1:-1]
+                count += len(rows)
+            yield b"]"
+    except Exception as e:
+        logger.error(f"Error streaming job list", rows_sent=count, error=str(e))
+        raise
 
-    # Convert rows to dicts
-    jobs = [dict(row._mapping) for row in result]
-    return jobs
+    logger.debug(f"Streamed all jobs", count=count)
 
 
 @router.delete("/job/{job_id}")
-async def delete_job(job_id: int, db: Session = Depends(get_db)):
+def delete_job(job_id: int, db: Session = Depends(get_db)):
     """
     Soft delete a job by setting job_active to false.
     """
     logger.info(f"Attempting to delete job", job_id=job_id)
 
-    job = db.query(Job).filter(Job.job_id == job_id).first()
-    if not job:
+    deleted = db.execute(
+        update(Job).where(Job.job_id == job_id).values(job_active=False).returning(Job.job_id)
+    ).first()
+    if not deleted:
         logger.warning(f"Job not found for deletion", job_id=job_id)
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job.job_active = False
     db.commit()
     logger.log_database_operation("DELETE", "jobs", job_id)
     logger.info(f"Job successfully deleted", job_id=job_id)
@@ -68,40 +161,37 @@ async def delete_job(job_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/job/list", response_model=List[JobList])
-async def get_job_list(db: Session = Depends(get_db)):
+def get_job_list(request: Request, db: Session = Depends(get_db)):
     """
     Get a list of jobs for dropdown selection.
+
+    Responds 304 when If-None-Match matches the body's ETag.
     """
     logger.debug("Fetching job list for dropdown")
 
-    jobs = db.query(Job.job_id, Job.company, Job.job_title).filter(
-        Job.job_active == True
-    ).order_by(
-        Job.last_activity.desc(),
-        Job.date_applied.desc()
-    ).all()
+    jobs = db.execute(_JOB_LIST_STMT).all()
 
     logger.log_database_operation("SELECT", "jobs")
     logger.debug(f"Job list retrieved", count=len(jobs))
-    return [{"job_id": job.job_id, "company": job.company, "job_title": job.job_title} for job in jobs]
+
+    # Returned as a Response so the three already-typed columns skip JobList
+    # validation; response_model is kept for the OpenAPI schema
+    response = ORJSONResponse([
+        {"job_id": job_id, "company": company, "job_title": job_title}
+        for job_id, company, job_title in jobs
+    ])
+    return etag_response(request, response)
 
 
 @router.get("/job/{job_id}")
-async def get_job(job_id: int, db: Session = Depends(get_db)):
+def get_job(job_id: int, request: Request, db: Session = Depends(get_db)):
     """
     Get a single job by ID with job_detail fields included.
+    Responds 304 when If-None-Match matches the body's ETag.
     """
     logger.debug(f"Fetching job", job_id=job_id)
 
-    # Use a SQL query to join job and job_detail tables
-    query = text("""
-        SELECT j.*, jd.job_desc, jd.job_qualification, jd.job_keyword
-        FROM job j
-        LEFT JOIN job_detail jd ON j.job_id = jd.job_id
-        WHERE j.job_id = :job_id AND j.job_active = true
-    """)
-
-    result = db.execute(query, {"job_id": job_id}).first()
+    result = db.execute(_GET_JOB_SQL, {"job_id": job_id}).first()
 
     if not result:
         logger.warning(f"Job not found", job_id=job_id)
@@ -110,13 +200,13 @@ async def get_job(job_id: int, db: Session = Depends(get_db)):
     logger.log_database_operation("SELECT", "jobs", job_id)
     logger.debug(f"Job retrieved successfully", job_id=job_id, company=result.company)
 
-    # Convert row to dict
-    job_dict = dict(result._mapping)
-    return job_dict
+    # orjson encodes the row's dates and arrays in C, with no jsonable_encoder pass
+    body = orjson.dumps(result._asdict(), default=_json_default)
+    return etag_response(request, Response(content=body, media_type="application/json"))
 
 
 @router.post("/job")
-async def create_or_update_job(job_data: JobUpdate, db: Session = Depends(get_db)):
+def create_or_update_job(job_data: JobUpdate, db: Session = Depends(get_db)):
     """
     Create a new job or update an existing one.
     """
@@ -137,21 +227,23 @@ async def create_or_update_job(job_data: JobUpdate, db: Session = Depends(get_db
                 detail="company, job_title, and job_status are required for new jobs"
             )
 
+    # Fields that were sent (job_desc and average_score are managed separately)
+    payload = job_data.model_dump(exclude_unset=True, exclude={'job_id', 'job_desc', 'average_score'})
+
     if job_data.job_id:
         # Update existing job
-        job = db.query(Job).filter(Job.job_id == job_data.job_id).first()
+        job = db.get(Job, job_data.job_id)
         if not job:
             logger.warning(f"Job not found for update", job_id=job_data.job_id)
             raise HTTPException(status_code=404, detail="Job not found")
 
         logger.debug(f"Updating existing job", job_id=job_data.job_id)
-        # Update fields that are provided (excluding job_desc and average_score which are managed separately)
-        update_data = job_data.dict(exclude_unset=True, exclude={'job_id', 'job_desc', 'average_score'})
-        for field, value in update_data.items():
+        # Update fields that are provided
+        for field, value in payload.items():
             setattr(job, field, value)
 
         # Update job directory if company or job_title changed
-        if 'company' in update_data or 'job_title' in update_data:
+        if 'company' in payload or 'job_title' in payload:
             old_directory = job.job_directory
             job.job_directory = create_job_directory(job.company, job.job_title)
             logger.debug(f"Updated job directory", old_directory=old_directory, new_directory=job.job_directory)
@@ -159,7 +251,7 @@ async def create_or_update_job(job_data: JobUpdate, db: Session = Depends(get_db
     else:
         # Create new job
         logger.debug(f"Creating new job", company=job_data.company, job_title=job_data.job_title)
-        job_dict = job_data.dict(exclude={'job_id', 'job_desc', 'average_score'}, exclude_unset=True, exclude_none=True)
+        job_dict = {field: value for field, value in payload.items() if value is not None}
 
         # Create job directory
         job_directory = create_job_directory(job_dict['company'], job_dict['job_title'])
@@ -169,35 +261,36 @@ async def create_or_update_job(job_data: JobUpdate, db: Session = Depends(get_db
         job = Job(**job_dict)
         db.add(job)
 
-    db.commit()
-    db.refresh(job)
+    # Everything below runs in one transaction; flush assigns job_id for new jobs
+    db.flush()
+    job_id = job.job_id
+    company = job.company
 
     # Handle job_desc in job_detail table
     if job_desc is not None:
-        job_detail = db.query(JobDetail).filter(JobDetail.job_id == job.job_id).first()
-        if job_detail:
-            # Update existing job_detail
-            job_detail.job_desc = job_desc
-            logger.debug(f"Updated job_detail for job", job_id=job.job_id)
-        else:
-            # Create new job_detail
-            job_detail = JobDetail(job_id=job.job_id, job_desc=job_desc)
-            db.add(job_detail)
-            logger.debug(f"Created job_detail for job", job_id=job.job_id)
-        db.commit()
+        detail_upsert = insert(JobDetail).values(job_id=job_id, job_desc=job_desc)
+        db.execute(detail_upsert.on_conflict_do_update(
+            index_elements=[JobDetail.job_id],
+            set_={"job_desc": detail_upsert.excluded.job_desc}
+        ))
+        logger.debug(f"Upserted job_detail for job", job_id=job_id)
+
+    # Update average score (for new jobs, sets it to interest_level; for updates, recalculates if interest_level changed).
+    # Calendar outcome scores are the only other input and are handled by the calendar endpoints.
+    if not is_update or 'interest_level' in payload:
+        calc_avg_score(db, job_id, commit=False)
+        logger.debug(f"{'Recalculated' if is_update else 'Calculated'} average score for job", job_id=job_id)
 
-    # Update average score (for new jobs, sets it to interest_level; for updates, recalculates if interest_level changed)
-    calc_avg_score(db, job.job_id)
-    logger.debug(f"{'Recalculated' if is_update else 'Calculated'} average score for job", job_id=job.job_id)
+    db.commit()
 
-    logger.log_database_operation("UPDATE" if is_update else "INSERT", "jobs", job.job_id)
-    logger.info(f"Job {action}d successfully", job_id=job.job_id, company=job.company)
+    logger.log_database_operation("UPDATE" if is_update else "INSERT", "jobs", job_id)
+    logger.info(f"Job {action}d successfully", job_id=job_id, company=company)
 
-    return {"status": "success", "job_id": job.job_id}
+    return {"status": "success", "job_id": job_id}
 
 
 @router.post("/job/extract", response_model=JobExtractResponse)
-async def extract_job_data(
+def extract_job_data(
     extract_request: JobExtractRequest,
     db: Session = Depends(get_db)
 ):
@@ -220,22 +313,14 @@ async def extract_job_data(
     logger.info(f"Extracting job data", job_id=extract_request.job_id)
 
     try:
-        # Verify that the job exists
-        job = db.query(Job).filter(Job.job_id == extract_request.job_id).first()
+        # Verify that the job exists, loading its job_detail in the same query
+        job = db.get(Job, extract_request.job_id, options=[joinedload(Job.detail)])
         if not job:
             logger.warning(f"Job not found for extraction", job_id=extract_request.job_id)
             raise HTTPException(status_code=404, detail="Job not found")
 
-        # Check if job_detail already has qualifications and keywords
-        check_query = text("""
-            SELECT jd.job_qualification, jd.job_keyword
-            FROM job j
-            JOIN job_detail jd ON (j.job_id = jd.job_id)
-            WHERE j.job_id = :job_id
-        """)
-        existing_data = db.execute(check_query, {"job_id": extract_request.job_id}).first()
-
         # If both qualification and keywords exist, return cached data
+        existing_data = job.detail
         if existing_data and existing_data.job_qualification and existing_data.job_keyword:
             logger.info(f"Using cached job qualification and keywords", job_id=extract_request.job_id)
             return JobExtractResponse(
@@ -271,8 +356,70 @@ async def extract_job_data(
         )
 
 
+@router.post("/job/extract/process", status_code=status.HTTP_202_ACCEPTED)
+def extract_job_data_process(
+    extract_request: JobExtractRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Initiate AI extraction of job qualifications and keywords.
+
+    Returns 202 Accepted with process_id immediately and runs the extraction
+    in a background thread, so the request does not wait on OpenAI. Poll
+    /v1/poll/{process_id}, then read the results from /v1/job/{job_id}.
+
+    JSON body:
+    - job_id: ID of the job to analyze
+
+    Returns:
+        202 status with process_id for polling
+    """
+    logger.info(f"Initiating job extraction process", job_id=extract_request.job_id)
+
+    job = db.get(Job, extract_request.job_id, options=[joinedload(Job.detail)])
+    if not job:
+        logger.warning(f"Job not found for extraction", job_id=extract_request.job_id)
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Already extracted: record the process as completed without calling the AI
+    existing_data = job.detail
+    is_cached = bool(existing_data and existing_data.job_qualification and existing_data.job_keyword)
+
+    process = Process(
+        endpoint_called='/v1/job/extract/process',
+        running_method='job_extraction_process',
+        running_class='AiAgent',
+        completed=func.current_timestamp() if is_cached else None
+    )
+    db.add(process)
+    db.commit()
+
+    process_id = process.process_id
+    logger.info(f"Created process record", job_id=extract_request.job_id, process_id=process_id, cached=is_cached)
+
+    if is_cached:
+        return {"process_id": process_id}
+
+    job_id = extract_request.job_id
+
+    # The thread must NOT use the request-scoped database session
+    def run_extraction():
+        thread_db = SessionLocal()
+        try:
+            AiAgent(thread_db).job_extraction_process(job_id, process_id)
+        finally:
+            thread_db.close()
+
+    thread = threading.Thread(target=run_extraction, daemon=True)
+    thread.start()
+
+    logger.info(f"Started background job extraction process", job_id=job_id, process_id=process_id)
+
+    return {"process_id": process_id}
+
+
 @router.post("/job/detail")
-async def create_or_update_job_detail(
+def create_or_update_job_detail(
     detail_data: JobDetailCreate,
     db: Session = Depends(get_db)
 ):
@@ -292,51 +439,33 @@ async def create_or_update_job_detail(
     """
     logger.info(f"Creating/updating job detail", job_id=detail_data.job_id)
 
-    # Verify that the job exists
-    job = db.query(Job).filter(Job.job_id == detail_data.job_id).first()
-    if not job:
+    # Insert the detail row, or update only the provided fields if it exists.
+    # A missing job surfaces as a foreign key violation instead of a pre-check.
+    update_data = detail_data.model_dump(exclude={'job_id'}, exclude_unset=True)
+    detail_upsert = insert(JobDetail).values(
+        job_id=detail_data.job_id,
+        job_desc=detail_data.job_desc,
+        job_qualification=detail_data.job_qualification,
+        job_keyword=detail_data.job_keyword
+    )
+    set_fields = {field: detail_upsert.excluded[field] for field in update_data} or {"job_id": detail_upsert.excluded.job_id}
+    detail_upsert = detail_upsert.on_conflict_do_update(
+        index_elements=[JobDetail.job_id],
+        set_=set_fields
+    )
+
+    try:
+        db.execute(detail_upsert)
+    except IntegrityError as e:
+        db.rollback()
+        if not is_missing_job_error(e):
+            raise
         logger.warning(f"Job not found for job detail", job_id=detail_data.job_id)
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Check if a detail record already exists for this job_id
-    existing_detail = db.query(JobDetail).filter(
-        JobDetail.job_id == detail_data.job_id
-    ).first()
-
-    if existing_detail:
-        # Update existing record
-        logger.debug(f"Updating existing job detail", job_id=detail_data.job_id)
-
-        # Update only the fields that are provided (not None)
-        update_data = detail_data.dict(exclude={'job_id'}, exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(existing_detail, field, value)
-
-        db.commit()
-        db.refresh(existing_detail)
-
-        logger.log_database_operation("UPDATE", "job_detail", existing_detail.job_id)
-        logger.info(f"Job detail updated successfully", job_id=existing_detail.job_id)
-
-        return {"status": "success", "job_id": existing_detail.job_id}
-
-    else:
-        # Insert new record
-        logger.debug(f"Creating new job detail", job_id=detail_data.job_id)
-
-        new_detail = JobDetail(
-            job_id=detail_data.job_id,
-            job_desc=detail_data.job_desc,
-            job_qualification=detail_data.job_qualification,
-            job_keyword=detail_data.job_keyword
-        )
-
-        db.add(new_detail)
-        db.commit()
-        db.refresh(new_detail)
+    db.commit()
 
-        logger.log_database_operation("INSERT", "job_detail", new_detail.job_id)
-        logger.info(f"Job detail created successfully", job_id=new_detail.job_id)
+    logger.log_database_operation("UPSERT", "job_detail", detail_data.job_id)
+    logger.info(f"Job detail saved successfully", job_id=detail_data.job_id)
 
-        return {"status": "success", "job_id": new_detail.job_id}
\ No newline at end of file
+    return {"status": "success", "job_id": detail_data.job_id}
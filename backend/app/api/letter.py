@@ -1,42 +1,154 @@
 import os
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import re
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, bindparam, Integer, DateTime
 
 from ..core.database import get_db
 from ..core.config import settings
 from ..models.models import CoverLetter as CoverLetterModel
-from ..schemas.letter import Letter, LetterCreate, LetterUpdate, LetterListItem
+from ..schemas.letter import Letter, LetterCreate, LetterUpdate, LetterListItem, LetterSave, LetterWriteRequest, LetterConvertRequest
 from ..utils.logger import logger
 from ..utils.ai_agent import AiAgent
 from ..utils.conversion import Conversion
+from ..utils.http_helpers import etag_response
 from ..utils.job_helpers import update_job_activity
 
 router = APIRouter()
 
+# Characters replaced with '_' in generated file names: invalid on common
+# filesystems, plus spaces
+_FILE_NAME_INVALID_CHARS = re.compile(r'[/\\:*?"<>| ]')
+
+# Concurrent pandoc conversions per worker; more would just contend for CPU
+_pandoc_slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+# Cover letter queries, built once so SQLAlchemy's compiled statement cache is reused
+_GET_LETTER_SQL = text("""
+    SELECT cover_id, resume_id, job_id, letter_length, letter_tone,
+           instruction, letter_content, file_name, letter_created
+    FROM cover_letter
+    WHERE cover_id = :cover_id
+""").bindparams(bindparam("cover_id", type_=Integer))
+
+_GET_LETTER_LIST_SQL = text("""
+    SELECT cl.letter_tone, cl.letter_length, cl.letter_created,
+           cl.cover_id, cl.file_name, cl.job_id, cl.resume_id,
+           j.company, j.job_title
+    FROM cover_letter cl
+    JOIN job j ON (cl.job_id = j.job_id)
+    WHERE cl.cover_id > 0 AND cl.letter_active = true
+      AND (:before IS NULL OR (cl.letter_created, cl.cover_id) < (:before, :before_id))
+    ORDER BY cl.letter_created DESC, cl.cover_id DESC
+    LIMIT :limit
+""").bindparams(
+    bindparam("before", type_=DateTime),
+    bindparam("before_id", type_=Integer),
+    bindparam("limit", type_=Integer)
+)
+
+_UPDATE_LETTER_SQL = text("""
+    UPDATE cover_letter
+    SET resume_id = :resume_id,
+        job_id = :job_id,
+        letter_length = :letter_length,
+        letter_tone = :letter_tone,
+        instruction = :instruction,
+        letter_content = :letter_content,
+        file_name = :file_name
+    WHERE cover_id = :cover_id
+""")
+
+_INSERT_LETTER_SQL = text("""
+    WITH ins AS (
+        INSERT INTO cover_letter (
+            resume_id, job_id, letter_length, letter_tone,
+            instruction, letter_content, file_name
+        ) VALUES (
+            :resume_id, :job_id, :letter_length, :letter_tone,
+            :instruction, :letter_content, :file_name
+        )
+        RETURNING cover_id, job_id
+    ), upd AS (
+        UPDATE job
+        SET cover_id = ins.cover_id,
+            last_activity = CURRENT_DATE
+        FROM ins
+        WHERE job.job_id = ins.job_id
+    )
+    SELECT cover_id FROM ins
+""")
+
+_DEACTIVATE_LETTER_SQL = text("""
+    UPDATE cover_letter
+    SET letter_active = false
+    WHERE cover_id = :cover_id
+    RETURNING cover_id
+""").bindparams(bindparam("cover_id", type_=Integer))
+
+# personal holds a single row; LIMIT 1 keeps the join to one row per letter.
+# job_detail and resume_detail are joined on their primary keys, so the
+# resume table itself is not needed
+_GET_LETTER_PROMPT_DATA_SQL = text("""
+    SELECT cl.letter_tone, cl.letter_length, cl.instruction, jd.job_desc,
+           j.company, j.job_title, rd.resume_md_rewrite,
+           p.first_name, p.last_name, p.city, p.state, p.email, p.phone
+    FROM cover_letter cl
+    JOIN job j ON (cl.job_id = j.job_id)
+    JOIN job_detail jd ON (cl.job_id = jd.job_id)
+    JOIN resume_detail rd ON (cl.resume_id = rd.resume_id)
+    CROSS JOIN LATERAL (
+        SELECT first_name, last_name, city, state, email, phone
+        FROM personal
+        LIMIT 1
+    ) p
+    WHERE cl.cover_id = :cover_id
+""").bindparams(bindparam("cover_id", type_=Integer))
+
+_UPDATE_LETTER_CONTENT_SQL = text("""
+    UPDATE cover_letter
+    SET letter_content = :letter_content
+    WHERE cover_id = :cover_id
+""")
+
+_GET_LETTER_CONVERT_DATA_SQL = text("""
+    SELECT cl.letter_content, cl.file_name, j.company, j.job_title
+    FROM cover_letter cl
+    JOIN job j ON (cl.job_id = j.job_id)
+    WHERE cl.cover_id = :cover_id
+""").bindparams(bindparam("cover_id", type_=Integer))
+
+_UPDATE_LETTER_FILE_NAME_SQL = text("""
+    UPDATE cover_letter
+    SET file_name = :file_name
+    WHERE cover_id = :cover_id
+""")
+
 
 @router.get("/letter", response_model=Letter)
-async def get_letter(cover_id: int, db: Session = Depends(get_db)):
+def get_letter(cover_id: int, request: Request, db: Session = Depends(get_db)):
     """
     Get a specific cover letter by cover_id.
 
+    The response carries an ETag; a matching If-None-Match gets an empty
+    304 so the letter body is not re-sent.
+
     Args:
         cover_id: The ID of the cover letter to retrieve
+        request: Incoming request
         db: Database session
 
     Returns:
         Cover letter details
     """
     try:
-        query = text("""
-            SELECT cover_id, resume_id, job_id, letter_length, letter_tone,
-                   instruction, letter_content, file_name, letter_created
-            FROM cover_letter
-            WHERE cover_id = :cover_id
-        """)
-
-        result = db.execute(query, {"cover_id": cover_id}).first()
+        result = db.execute(_GET_LETTER_SQL, {"cover_id": cover_id}).first()
 
         if not result:
             raise HTTPException(
@@ -44,7 +156,7 @@ async def get_letter(cover_id: int, db: Session = Depends(get_db)):
                 detail=f"Cover letter with ID {cover_id} not found"
             )
 
-        return {
+        response = ORJSONResponse({
             "cover_id": result.cover_id,
             "resume_id": result.resume_id,
             "job_id": result.job_id,
@@ -54,7 +166,8 @@ async def get_letter(cover_id: int, db: Session = Depends(get_db)):
             "letter_content": result.letter_content,
             "file_name": result.file_name or "",
             "letter_created": result.letter_created
-        }
+        })
+        return etag_response(request, response)
 
     except HTTPException:
         raise
@@ -67,28 +180,37 @@ async def get_letter(cover_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/letter/list", response_model=List[LetterListItem])
-async def get_letter_list(db: Session = Depends(get_db)):
+def get_letter_list(
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Maximum number of letters to return"),
+    before: Optional[datetime] = Query(None, description="letter_created of the last letter on the previous page"),
+    before_id: Optional[int] = Query(None, description="cover_id of the last letter on the previous page"),
+    db: Session = Depends(get_db)
+):
     """
     Get a list of all active cover letters with job information.
 
+    Pages are fetched newest first: pass the letter_created and cover_id
+    of the last letter received as `before` and `before_id` to get the
+    next page. letter_created only has one-second resolution, so cover_id
+    breaks ties; without `before_id` letters created in the same second
+    as `before` are skipped. Without `limit` every active letter is
+    returned.
+
     Args:
+        limit: Maximum number of letters to return
+        before: Keyset cursor; letter_created of the last letter received
+        before_id: Keyset cursor; cover_id of the last letter received
         db: Database session
 
     Returns:
         List of active cover letters with summary information
     """
     try:
-        query = text("""
-            SELECT cl.letter_tone, cl.letter_length, cl.letter_created,
-                   cl.cover_id, cl.file_name, cl.job_id, cl.resume_id,
-                   j.company, j.job_title
-            FROM cover_letter cl
-            JOIN job j ON (cl.job_id = j.job_id)
-            WHERE cl.cover_id > 0 AND cl.letter_active = true
-            ORDER BY cl.letter_created DESC, j.company ASC
-        """)
-
-        results = db.execute(query).fetchall()
+        # LIMIT NULL means no limit in PostgreSQL
+        results = db.execute(
+            _GET_LETTER_LIST_SQL,
+            {"before": before, "before_id": before_id, "limit": limit}
+        ).fetchall()
 
         return [
             {
@@ -114,12 +236,13 @@ async def get_letter_list(db: Session = Depends(get_db)):
 
 
 @router.post("/letter", status_code=status.HTTP_200_OK)
-async def save_letter(letter_data: dict, db: Session = Depends(get_db)):
+def save_letter(letter_data: LetterSave, db: Session = Depends(get_db)):
     """
     Create or update a cover letter.
 
     If cover_id is provided, updates the existing letter.
     If cover_id is not provided, creates a new letter.
+    letter_length and letter_tone are validated by the LetterSave model.
 
     Args:
         letter_data: Cover letter data including all fields
@@ -129,108 +252,30 @@ async def save_letter(letter_data: dict, db: Session = Depends(get_db)):
         Success status with cover_id
     """
     try:
-        cover_id = letter_data.get('cover_id')
-
-        # Validate letter_length
-        valid_lengths = ['short', 'medium', 'long']
-        if letter_data.get('letter_length') not in valid_lengths:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"letter_length must be one of: {', '.join(valid_lengths)}"
-            )
-
-        # Validate letter_tone
-        valid_tones = ['professional', 'casual', 'enthusiastic', 'informational']
-        if letter_data.get('letter_tone') not in valid_tones:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"letter_tone must be one of: {', '.join(valid_tones)}"
-            )
+        cover_id = letter_data.cover_id
+        job_id = letter_data.job_id
 
         if cover_id:
             # Update existing cover letter
-            update_query = text("""
-                UPDATE cover_letter
-                SET resume_id = :resume_id,
-                    job_id = :job_id,
-                    letter_length = :letter_length,
-                    letter_tone = :letter_tone,
-                    instruction = :instruction,
-                    letter_content = :letter_content,
-                    file_name = :file_name
-                WHERE cover_id = :cover_id
-            """)
-
-            db.execute(update_query, {
-                "cover_id": cover_id,
-                "resume_id": letter_data.get('resume_id'),
-                "job_id": letter_data.get('job_id'),
-                "letter_length": letter_data.get('letter_length'),
-                "letter_tone": letter_data.get('letter_tone'),
-                "instruction": letter_data.get('instruction'),
-                "letter_content": letter_data.get('letter_content'),
-                "file_name": letter_data.get('file_name')
-            })
-            db.commit()
+            db.execute(_UPDATE_LETTER_SQL, letter_data.model_dump())
 
-            # Update job activity
-            job_id = letter_data.get('job_id')
+            # Update job activity in the same transaction
             if job_id:
-                try:
-                    update_job_activity(db, job_id)
-                except Exception as e:
-                    logger.warning(f"Failed to update job activity", job_id=job_id, error=str(e))
+                update_job_activity(db, job_id, commit=False)
+
+            db.commit()
 
             logger.info(f"Updated cover letter", cover_id=cover_id)
             return {"status": "success", "cover_id": cover_id}
 
         else:
-            # Insert new cover letter
-            insert_query = text("""
-                INSERT INTO cover_letter (
-                    resume_id, job_id, letter_length, letter_tone,
-                    instruction, letter_content, file_name
-                ) VALUES (
-                    :resume_id, :job_id, :letter_length, :letter_tone,
-                    :instruction, :letter_content, :file_name
-                )
-                RETURNING cover_id
-            """)
-
-            result = db.execute(insert_query, {
-                "resume_id": letter_data.get('resume_id'),
-                "job_id": letter_data.get('job_id'),
-                "letter_length": letter_data.get('letter_length'),
-                "letter_tone": letter_data.get('letter_tone'),
-                "instruction": letter_data.get('instruction'),
-                "letter_content": letter_data.get('letter_content'),
-                "file_name": letter_data.get('file_name')
-            })
-
-            new_cover_id = result.fetchone()[0]
-
-            # Update the job record with the cover_id
-            job_id = letter_data.get('job_id')
-            if job_id:
-                update_job_query = text("""
-                    UPDATE job
-                    SET cover_id = :cover_id
-                    WHERE job_id = :job_id
-                """)
-                db.execute(update_job_query, {
-                    "cover_id": new_cover_id,
-                    "job_id": job_id
-                })
-
+            # Insert the letter, link it to its job and touch last_activity
+            # in one round-trip
+            new_cover_id = db.execute(
+                _INSERT_LETTER_SQL, letter_data.model_dump(exclude={'cover_id'})
+            ).scalar_one()
             db.commit()
 
-            # Update job activity
-            if job_id:
-                try:
-                    update_job_activity(db, job_id)
-                except Exception as e:
-                    logger.warning(f"Failed to update job activity", job_id=job_id, error=str(e))
-
             logger.info(f"Created new cover letter", cover_id=new_cover_id, job_id=job_id)
             return {"status": "success", "cover_id": new_cover_id}
 
@@ -245,7 +290,7 @@ async def save_letter(letter_data: dict, db: Session = Depends(get_db)):
 
 
 @router.delete("/letter", status_code=status.HTTP_200_OK)
-async def delete_letter(cover_id: int, db: Session = Depends(get_db)):
+def delete_letter(cover_id: int, db: Session = Depends(get_db)):
     """
     Soft delete a cover letter by setting letter_active to false.
 
@@ -257,27 +302,16 @@ async def delete_letter(cover_id: int, db: Session = Depends(get_db)):
         Success status
     """
     try:
-        # Check if the cover letter exists
-        check_query = text("""
-            SELECT cover_id FROM cover_letter WHERE cover_id = :cover_id
-        """)
-
-        result = db.execute(check_query, {"cover_id": cover_id}).first()
+        # Soft delete by setting letter_active to false; no row back means
+        # the letter does not exist
+        found_id = db.execute(_DEACTIVATE_LETTER_SQL, {"cover_id": cover_id}).scalar()
 
-        if not result:
+        if found_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Cover letter with ID {cover_id} not found"
             )
 
-        # Soft delete by setting letter_active to false
-        delete_query = text("""
-            UPDATE cover_letter
-            SET letter_active = false
-            WHERE cover_id = :cover_id
-        """)
-
-        db.execute(delete_query, {"cover_id": cover_id})
         db.commit()
 
         logger.info(f"Soft deleted cover letter", cover_id=cover_id)
@@ -294,19 +328,19 @@ async def delete_letter(cover_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/letter/write", status_code=status.HTTP_200_OK)
-async def write_cover_letter(request_data: dict, db: Session = Depends(get_db)):
+def write_cover_letter(request_data: LetterWriteRequest, db: Session = Depends(get_db)):
     """
     Generate a cover letter using AI and update the database.
 
     Args:
-        request_data: Dictionary containing cover_id
+        request_data: Request containing cover_id
         db: Database session
 
     Returns:
         Dictionary containing the generated letter_content
     """
     try:
-        cover_id = request_data.get('cover_id')
+        cover_id = request_data.cover_id
 
         if not cover_id:
             raise HTTPException(
@@ -315,20 +349,7 @@ async def write_cover_letter(request_data: dict, db: Session = Depends(get_db)):
             )
 
         # Query for all required data
-        query = text("""
-            SELECT cl.letter_tone, cl.letter_length, cl.instruction, jd.job_desc,
-                   j.company, j.job_title, rd.resume_md_rewrite,
-                   p.first_name, p.last_name, p.city, p.state, p.email, p.phone
-            FROM cover_letter cl
-            JOIN job j ON (cl.job_id = j.job_id)
-            JOIN job_detail jd ON (j.job_id = jd.job_id)
-            JOIN resume r ON (cl.resume_id = r.resume_id)
-            JOIN resume_detail rd ON (r.resume_id = rd.resume_id),
-            personal p
-            WHERE cl.cover_id = :cover_id
-        """)
-
-        result = db.execute(query, {"cover_id": cover_id}).first()
+        result = db.execute(_GET_LETTER_PROMPT_DATA_SQL, {"cover_id": cover_id}).first()
 
         if not result:
             raise HTTPException(
@@ -377,13 +398,7 @@ async def write_cover_letter(request_data: dict, db: Session = Depends(get_db)):
             raise ValueError("AI did not return letter_content")
 
         # Update the cover_letter record with the generated content
-        update_query = text("""
-            UPDATE cover_letter
-            SET letter_content = :letter_content
-            WHERE cover_id = :cover_id
-        """)
-
-        db.execute(update_query, {
+        db.execute(_UPDATE_LETTER_CONTENT_SQL, {
             "cover_id": cover_id,
             "letter_content": letter_content
         })
@@ -409,21 +424,51 @@ async def write_cover_letter(request_data: dict, db: Session = Depends(get_db)):
         )
 
 
+def _get_letter_convert_data(db: Session, cover_id: int):
+    """
+    Fetch the letter content and job names needed to convert a cover letter.
+
+    Args:
+        db: Database session
+        cover_id: The ID of the cover letter
+
+    Returns:
+        Row with letter_content, file_name, company and job_title, or None
+    """
+    return db.execute(_GET_LETTER_CONVERT_DATA_SQL, {"cover_id": cover_id}).first()
+
+
+def _save_letter_file_name(db: Session, cover_id: int, file_name: str) -> None:
+    """
+    Record the generated DOCX file name on a cover letter and commit.
+
+    Args:
+        db: Database session
+        cover_id: The ID of the cover letter
+        file_name: Name of the generated DOCX file
+    """
+    db.execute(_UPDATE_LETTER_FILE_NAME_SQL, {
+        "cover_id": cover_id,
+        "file_name": file_name
+    })
+    db.commit()
+
+
 @router.post("/letter/convert", status_code=status.HTTP_200_OK)
-async def convert_cover_letter(request_data: dict, db: Session = Depends(get_db)):
+async def convert_cover_letter(request_data: LetterConvertRequest, db: Session = Depends(get_db)):
     """
     Convert a cover letter (HTML format) to DOCX format.
 
     Args:
-        request_data: Dictionary containing cover_id and format
+        request_data: Request containing cover_id and format
         db: Database session
 
     Returns:
         Dictionary containing the generated file_name
     """
     try:
-        cover_id = request_data.get('cover_id')
-        output_format = request_data.get('format', 'docx')
+        cover_id = request_data.cover_id
+        output_format = request_data.format
 
         if not cover_id:
             raise HTTPException(
@@ -439,14 +484,9 @@ async def convert_cover_letter(request_data: dict, db: Session = Depends(get_db)
             )
 
         # Query for cover letter data
-        query = text("""
-            SELECT cl.letter_content, cl.file_name, j.company, j.job_title
-            FROM cover_letter cl
-            JOIN job j ON (cl.job_id = j.job_id)
-            WHERE cl.cover_id = :cover_id
-        """)
-
-        result = db.execute(query, {"cover_id": cover_id}).first()
+        # This handler stays async for the pandoc subprocess, so its blocking
+        # database calls are pushed to the threadpool
+        result = await run_in_threadpool(_get_letter_convert_data, db, cover_id)
 
         if not result:
             raise HTTPException(
@@ -465,63 +505,36 @@ async def convert_cover_letter(request_data: dict, db: Session = Depends(get_db)
                 detail="Cover letter content is empty. Generate content first using /letter/write"
             )
 
-        # Create filename: <company>-<job_title>.docx with spaces replaced by underscores, lowercase
-        # Remove invalid filesystem characters
-        import re
-        file_name = f"{company}-{job_title}.docx"
-        # Replace invalid characters with underscore
-        file_name = re.sub(r'[/\\:*?"<>|]', '_', file_name)
-        # Replace spaces with underscores and convert to lowercase
-        file_name = file_name.replace(" ", "_").lower()
+        # Create filename: <company>-<job_title>.docx with invalid filesystem
+        # characters and spaces replaced by underscores, lowercase
+        file_name = _FILE_NAME_INVALID_CHARS.sub('_', f"{company}-{job_title}.docx").lower()
 
         logger.info(f"Converting cover letter to DOCX", cover_id=cover_id, file_name=file_name)
 
-        # Convert HTML to DOCX using a new standalone method
-        import subprocess
-        import tempfile
-        from pathlib import Path
-
-        # Create temporary HTML file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_html:
-            temp_html.write(letter_content)
-            temp_html_path = temp_html.name
-
         # Output path for docx
         output_path = Path(settings.cover_letter_dir) / file_name
 
         # Ensure the cover letter directory exists
         os.makedirs(settings.cover_letter_dir, exist_ok=True)
 
-        try:
-            # Convert HTML to DOCX using pandoc
-            result = subprocess.run(
-                ['pandoc', temp_html_path, '-f', 'html', '-t', 'docx', '-o', str(output_path)],
-                capture_output=True,
-                text=True,
-                check=True
+        # Convert HTML to DOCX with pandoc, feeding the HTML on stdin. pandoc
+        # writes the DOCX straight to its final path, so the only disk write is
+        # the output file. The subprocess is awaited so the event loop keeps
+        # serving other requests
+        async with _pandoc_slots:
+            proc = await asyncio.create_subprocess_exec(
+                'pandoc', '-f', 'html', '-t', 'docx', '-o', str(output_path),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
             )
+            _, stderr = await proc.communicate(letter_content.encode('utf-8'))
 
-            # Clean up temporary file
-            os.unlink(temp_html_path)
-
-        except subprocess.CalledProcessError as e:
-            # Clean up temporary file on error
-            if os.path.exists(temp_html_path):
-                os.unlink(temp_html_path)
-            raise Exception(f"Pandoc conversion to DOCX failed: {e.stderr}")
+        if proc.returncode != 0:
+            raise Exception(f"Pandoc conversion to DOCX failed: {stderr.decode('utf-8', errors='replace')}")
 
         # Update the cover_letter record with the filename
-        update_query = text("""
-            UPDATE cover_letter
-            SET file_name = :file_name
-            WHERE cover_id = :cover_id
-        """)
-
-        db.execute(update_query, {
-            "cover_id": cover_id,
-            "file_name": file_name
-        })
-        db.commit()
+        await run_in_threadpool(_save_letter_file_name, db, cover_id, file_name)
 
         logger.info(f"Cover letter converted to DOCX", cover_id=cover_id, file_name=file_name)
 
@@ -1,38 +1,58 @@
+from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, update, insert, select, bindparam, Integer, DateTime
+from sqlalchemy.exc import IntegrityError
 
 from ..core.database import get_db
-from ..models.models import Note, Job
+from ..models.models import Note
 from ..schemas.note import Note as NoteSchema, NoteCreate, NoteUpdate
-from ..utils.job_helpers import update_job_activity
+from ..utils.job_helpers import update_job_activity, is_missing_job_error
 from ..utils.logger import logger
 
 router = APIRouter()
 
+_GET_NOTES_SQL = text("""
+    SELECT n.*, j.company, j.job_title
+    FROM note n
+    JOIN job j ON (n.job_id = j.job_id)
+    WHERE n.note_active = true
+      AND (:job_id IS NULL OR n.job_id = :job_id)
+      AND (:before IS NULL OR (n.note_created, n.note_id) < (:before, :before_id))
+    ORDER BY n.note_created DESC, n.note_id DESC
+    LIMIT :limit
+""").bindparams(
+    bindparam("job_id", type_=Integer),
+    bindparam("before", type_=DateTime),
+    bindparam("before_id", type_=Integer),
+    bindparam("limit", type_=Integer)
+)
+
 
 @router.get("/notes", response_model=List[NoteSchema])
-async def get_notes(job_id: Optional[int] = Query(None), db: Session = Depends(get_db)):
+def get_notes(
+    job_id: Optional[int] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Maximum number of notes to return"),
+    before: Optional[datetime] = Query(None, description="note_created of the last note on the previous page"),
+    before_id: Optional[int] = Query(None, description="note_id of the last note on the previous page"),
+    db: Session = Depends(get_db)
+):
     """
     Get all notes, optionally filtered by job_id.
-    """
-    query = """
-        SELECT n.*, j.company, j.job_title
-        FROM note n
-        JOIN job j ON (n.job_id = j.job_id)
-        WHERE n.note_active = true
-    """
-
-    params = {}
 
-    if job_id:
-        query += " AND n.job_id = :job_id"
-        params["job_id"] = job_id
-
-    query += " ORDER BY n.note_created DESC"
-
-    result = db.execute(text(query), params)
+    Pages are fetched newest first: pass the note_created and note_id of
+    the last note received as `before` and `before_id` to get the next
+    page. note_created only has one-second resolution, so note_id breaks
+    ties. Without `limit` every active note is returned.
+    """
+    # LIMIT NULL means no limit in PostgreSQL
+    result = db.execute(_GET_NOTES_SQL, {
+        "job_id": job_id or None,
+        "before": before,
+        "before_id": before_id,
+        "limit": limit
+    })
 
     return [
         NoteSchema(
@@ -48,7 +68,7 @@ async def get_notes(job_id: Optional[int] = Query(None), db: Session = Depends(g
     ]
 
 
-async def _create_or_update_note(note_data: NoteUpdate, db: Session):
+def _create_or_update_note(note_data: NoteUpdate, db: Session):
     """
     Internal function to create or update a note.
     """
@@ -63,60 +83,68 @@ async def _create_or_update_note(note_data: NoteUpdate, db: Session):
                 detail="job_id and note_title are required for new notes"
             )
 
-    # Verify job exists
-    if note_data.job_id:
-        job = db.query(Job).filter(Job.job_id == note_data.job_id).first()
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-
     if note_data.note_id:
-        # Update existing note
-        note = db.query(Note).filter(Note.note_id == note_data.note_id).first()
-        if not note:
-            raise HTTPException(status_code=404, detail="Note not found")
-
-        # Update fields that are provided
-        update_data = note_data.dict(exclude_unset=True, exclude={'note_id'})
-        for field, value in update_data.items():
-            setattr(note, field, value)
+        # Update the provided fields and read back the keys in one statement
+        update_data = note_data.model_dump(exclude_unset=True, exclude={'note_id'})
+        if update_data:
+            stmt = (
+                update(Note)
+                .where(Note.note_id == note_data.note_id)
+                .values(**update_data)
+                .returning(Note.note_id, Note.job_id)
+            )
+        else:
+            stmt = select(Note.note_id, Note.job_id).where(Note.note_id == note_data.note_id)
 
     else:
         # Create new note
-        note_dict = note_data.dict(exclude={'note_id'}, exclude_unset=True)
-        note = Note(**note_dict)
-        db.add(note)
+        note_dict = note_data.model_dump(exclude={'note_id'}, exclude_unset=True)
+        stmt = insert(Note).values(**note_dict).returning(Note.note_id, Note.job_id)
+
+    # The job_id foreign key verifies the job exists, so there is no separate
+    # lookup before the write
+    try:
+        note = db.execute(stmt).first()
+    except IntegrityError as e:
+        db.rollback()
+        if not is_missing_job_error(e):
+            raise
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    db.commit()
-    db.refresh(note)
+    if not note:
+        raise HTTPException(status_code=404, detail="Note not found")
 
-    # Update job activity
+    # Update job activity in the same transaction, so both writes share one commit
     if note.job_id:
         try:
-            update_job_activity(db, note.job_id)
+            update_job_activity(db, note.job_id, commit=False)
         except Exception as e:
-            logger.warning(f"Failed to update job activity", job_id=note.job_id, error=str(e))
+            logger.error(f"Failed to update job activity", job_id=note.job_id, error=str(e))
+            raise HTTPException(status_code=500, detail=f"Error saving note: {str(e)}")
+
+    db.commit()
 
     return {"status": "success", "note_id": note.note_id}
 
 
 @router.post("/note")
-async def create_or_update_note(note_data: NoteUpdate, db: Session = Depends(get_db)):
+def create_or_update_note(note_data: NoteUpdate, db: Session = Depends(get_db)):
     """
     Create a new note or update an existing one.
     """
-    return await _create_or_update_note(note_data, db)
+    return _create_or_update_note(note_data, db)
 
 
 @router.post("/notes")
-async def create_or_update_note_plural(note_data: NoteUpdate, db: Session = Depends(get_db)):
+def create_or_update_note_plural(note_data: NoteUpdate, db: Session = Depends(get_db)):
     """
     Create a new note or update an existing one (plural route for compatibility).
     """
-    return await _create_or_update_note(note_data, db)
+    return _create_or_update_note(note_data, db)
 
 
 @router.delete("/note/{note_id}")
-async def delete_note(note_id: int, db: Session = Depends(get_db)):
+def delete_note(note_id: int, db: Session = Depends(get_db)):
     """
     Soft delete a note by setting note_active to false.
     """
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from fastapi import APIRouter, HTTPException, status
 import httpx
 from typing import List
@@ -6,6 +8,110 @@ from ..utils.logger import logger
 
 router = APIRouter()
 
+# Seconds the OpenAI model list is served from memory; the list rarely changes
+OPENAI_MODELS_CACHE_TTL = 3600
+
+# Model IDs last fetched, the credentials they were fetched with and expiry (monotonic)
+_models_cache = {"models": None, "credentials": None, "expires": 0.0}
+_models_lock = asyncio.Lock()
+
+# Running stale-while-revalidate refresh, if any
+_refresh_task = None
+
+# Shared client so calls to api.openai.com reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake each time. Created on first use and
+# closed from the application lifespan.
+_http_client = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared OpenAI HTTP client, creating it if needed.
+
+    Returns:
+        httpx.AsyncClient with connection pooling
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared OpenAI HTTP client and its pooled connections.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _get_cached_models():
+    """
+    Get the cached model list if it was fetched with the current credentials.
+
+    Returns:
+        Tuple of (model IDs, fresh). Model IDs is None on a miss; fresh is
+        False once OPENAI_MODELS_CACHE_TTL has passed
+    """
+    credentials = (settings.openai_api_key, settings.openai_project)
+    if _models_cache["models"] is None or _models_cache["credentials"] != credentials:
+        return None, False
+    return _models_cache["models"], time.monotonic() < _models_cache["expires"]
+
+
+def invalidate_models_cache() -> None:
+    """
+    Drop the cached OpenAI model list so the next request refetches it.
+    """
+    _models_cache.update(models=None, credentials=None, expires=0.0)
+
+
+async def _refresh_models() -> List[str]:
+    """
+    Fetch the model list from OpenAI and store it in the cache.
+    Callers hold _models_lock.
+
+    Returns:
+        List[str]: List of model IDs sorted by creation date (newest first)
+    """
+    credentials = (settings.openai_api_key, settings.openai_project)
+    model_ids = await _fetch_llm_models()
+    _models_cache.update(
+        models=model_ids,
+        credentials=credentials,
+        expires=time.monotonic() + OPENAI_MODELS_CACHE_TTL,
+    )
+    return model_ids
+
+
+async def _refresh_models_in_background() -> None:
+    """
+    Refresh an expired model list without blocking the request that noticed it.
+    On failure the stale list keeps being served and the next request retries.
+    """
+    async with _models_lock:
+        _, fresh = _get_cached_models()
+        if fresh:
+            return
+        try:
+            await _refresh_models()
+        except HTTPException as e:
+            logger.warning(f"Background refresh of OpenAI models failed, serving stale list", detail=e.detail)
+
+
+def _schedule_models_refresh() -> None:
+    """
+    Start a background refresh of the model list unless one is already running.
+    """
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_refresh_models_in_background())
+
 
 @router.get("/openai/llm", response_model=List[str])
 async def get_llm_models():
@@ -14,7 +120,32 @@ async def get_llm_models():
 
     Makes a call to OpenAI API to retrieve available models,
     sorts them by creation date (descending), and returns
-    a list of model IDs.
+    a list of model IDs. The list is cached in memory for
+    OPENAI_MODELS_CACHE_TTL seconds, and concurrent misses
+    share a single upstream call. Once expired, the stale list
+    is returned while a background task fetches a new one.
+
+    Returns:
+        List[str]: List of model IDs sorted by creation date (newest first)
+    """
+    model_ids, fresh = _get_cached_models()
+    if model_ids is not None:
+        if not fresh:
+            _schedule_models_refresh()
+        return model_ids
+
+    async with _models_lock:
+        # Another request may have filled the cache while we waited
+        model_ids, _ = _get_cached_models()
+        if model_ids is not None:
+            return model_ids
+
+        return await _refresh_models()
+
+
+async def _fetch_llm_models() -> List[str]:
+    """
+    Fetch the model list from the OpenAI API.
 
     Returns:
         List[str]: List of model IDs sorted by creation date (newest first)
@@ -22,37 +153,36 @@ async def get_llm_models():
     logger.info("Fetching LLM models from OpenAI API")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.openai.com/v1/models",
-                headers={
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "OpenAI-Project": settings.openai_project
-                },
-                timeout=30.0
-            )
-
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract models from response
-            models = data.get("data", [])
-
-            # Sort by created field in descending order (newest first)
-            sorted_models = sorted(models, key=lambda x: x.get("created", 0), reverse=True)
-
-            # Extract model IDs and remove duplicates while preserving order
-            model_ids = []
-            seen = set()
-            for model in sorted_models:
-                model_id = model.get("id")
-                if model_id and model_id not in seen:
-                    seen.add(model_id)
-                    model_ids.append(model_id)
-
-            logger.info(f"Retrieved {len(model_ids)} LLM models from OpenAI")
+        client = _get_http_client()
+        response = await client.get(
+            "https://api.openai.com/v1/models",
+            headers={
+                "Authorization": f"Bearer {settings.openai_api_key}",
+                "OpenAI-Project": settings.openai_project
+            }
+        )
 
-            return model_ids
+        response.raise_for_status()
+        data = response.json()
+
+        # Extract models from response
+        models = data.get("data", [])
+
+        # Sort by created field in descending order (newest first)
+        sorted_models = sorted(models, key=lambda x: x.get("created", 0), reverse=True)
+
+        # Extract model IDs and remove duplicates while preserving order
+        model_ids = []
+        seen = set()
+        for model in sorted_models:
+            model_id = model.get("id")
+            if model_id and model_id not in seen:
+                seen.add(model_id)
+                model_ids.append(model_id)
+
+        logger.info(f"Retrieved {len(model_ids)} LLM models from OpenAI")
+
+        return model_ids
 
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching OpenAI models", status_code=e.response.status_code, error=str(e))
@@ -1,33 +1,71 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy import text, bindparam, Integer
 from pydantic import BaseModel
-from ..core.database import get_db
+from ..core.database import get_db, SessionLocal
 from ..utils.logger import logger
-from ..models.models import Process
 from ..schemas.process import ProcessBase, PollResponse
 
 router = APIRouter()
 
+_POLL_PROCESS_SQL = text("""
+    SELECT failed, confirmed, completed
+    FROM process
+    WHERE process_id = :process_id
+""").bindparams(bindparam("process_id", type_=Integer))
+
+# Guarded so a process that failed or was already confirmed is left alone
+_CONFIRM_PROCESS_SQL = text("""
+    UPDATE process
+    SET confirmed = true
+    WHERE process_id = :process_id
+      AND completed IS NOT NULL
+      AND confirmed = false
+      AND failed = false
+""").bindparams(bindparam("process_id", type_=Integer))
+
+
+def _confirm_process(process_id: int) -> None:
+    """
+    Mark a completed process as confirmed.
+
+    Runs as a background task after the poll response has been sent, so it
+    uses its own session rather than the request-scoped one.
+
+    Args:
+        process_id: The ID of the process to confirm
+    """
+    db = SessionLocal()
+    try:
+        db.execute(_CONFIRM_PROCESS_SQL, {"process_id": process_id})
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Failed to confirm process", process_id=process_id, error=str(e))
+    finally:
+        db.close()
+
 
 class PollRequest(BaseModel):
     process_id: int
 
 
 @router.get("/poll/{process_id}", response_model=PollResponse)
-async def poll_status(process_id: int, db: Session = Depends(get_db)):
+def poll_status(process_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """
     Get the current state of a process based on the process_id
 
     Args:
-        request: PollRequest with process_id
+        process_id: The ID of the process to poll
+        background_tasks: FastAPI background tasks
         db: Database session
 
     Returns:
         PollResponse with process_state: string (running, complete, confirmed, failed)
     """
 
-    process = db.query(Process).filter(Process.process_id == process_id).first()
+    process = db.execute(_POLL_PROCESS_SQL, {"process_id": process_id}).first()
     if not process:
         logger.warning(f"Process not found", process_id=process_id)
         raise HTTPException(status_code=404, detail="Process not found")
@@ -43,10 +81,10 @@ async def poll_status(process_id: int, db: Session = Depends(get_db)):
     else:
         process_state = "running"
 
-    # If process just completed, mark as confirmed for next poll
-    if process_state == "complete" and not process.confirmed:
-        process.confirmed = True
-        db.commit()
+    # If process just completed, mark as confirmed for next poll once the
+    # response has been sent
+    if process_state == "complete":
+        background_tasks.add_task(_confirm_process, process_id)
 
     return PollResponse(process_state=process_state)
 
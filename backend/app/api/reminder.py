@@ -1,18 +1,93 @@
+import csv
+import io
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import text, bindparam, insert, Integer, Date
 from typing import List
-from datetime import timedelta
 
-from ..core.database import get_db
-from ..schemas.reminder import ReminderCreate, ReminderListRequest, ReminderListResponse
+from ..core.database import get_db, get_autocommit_connection
+from ..models.models import Reminder
+from ..schemas.reminder import DurationType, ReminderCreate, ReminderListRequest, ReminderListResponse
+from ..utils.job_helpers import is_missing_job_error
 from ..utils.logger import logger
 
 router = APIRouter()
 
+# Batches larger than this are loaded with COPY instead of multi-row INSERT
+REMINDER_COPY_THRESHOLD = 5000
+
+_SAVE_REMINDER_SQL = text("""
+    WITH updated AS (
+        UPDATE reminder
+        SET reminder_date = :reminder_date,
+            reminder_time = :reminder_time,
+            reminder_message = :reminder_message,
+            reminder_dismissed = :reminder_dismissed,
+            job_id = :job_id,
+            reminder_updated = CURRENT_TIMESTAMP
+        WHERE reminder_id = :reminder_id
+        RETURNING reminder_id
+    ), inserted AS (
+        INSERT INTO reminder (
+            reminder_date,
+            reminder_time,
+            reminder_message,
+            reminder_dismissed,
+            job_id
+        )
+        SELECT :reminder_date, :reminder_time, :reminder_message, :reminder_dismissed, :job_id
+        WHERE :reminder_id IS NULL
+        RETURNING reminder_id
+    )
+    SELECT reminder_id FROM updated
+    UNION ALL
+    SELECT reminder_id FROM inserted
+""").bindparams(
+    bindparam("reminder_id", type_=Integer),
+    bindparam("job_id", type_=Integer)
+)
+
+_DELETE_REMINDER_SQL = text("""
+    DELETE FROM reminder
+    WHERE reminder_id = :reminder_id
+    RETURNING reminder_id
+""").bindparams(bindparam("reminder_id", type_=Integer))
+
+# Ids for a COPY batch are drawn up front, since COPY cannot return them
+_NEXT_REMINDER_IDS_SQL = text("""
+    SELECT nextval(pg_get_serial_sequence('reminder', 'reminder_id'))
+    FROM generate_series(1, :count)
+""").bindparams(bindparam("count", type_=Integer))
+
+# An empty unquoted CSV field is NULL; FORCE_NOT_NULL keeps an empty message as ''
+_COPY_REMINDERS_SQL = """
+    COPY reminder (reminder_id, reminder_date, reminder_time, reminder_message, reminder_dismissed, job_id)
+    FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (reminder_message))
+"""
+
+# Days covered by each list duration, counting start_date
+_LIST_DURATION_DAYS = {DurationType.day: 1, DurationType.week: 7, DurationType.month: 30}
+
+_LIST_REMINDERS_SQL = text("""
+    SELECT reminder_id, reminder_date, reminder_time, reminder_message, job_id
+    FROM reminder
+    WHERE reminder_date >= :start_date
+      AND reminder_date < CAST(:start_date AS date) + :days
+      AND (:job_id IS NULL OR job_id = :job_id)
+      AND reminder_dismissed IS NOT TRUE
+    ORDER BY reminder_date DESC, reminder_time DESC
+""").bindparams(
+    bindparam("start_date", type_=Date),
+    bindparam("days", type_=Integer),
+    bindparam("job_id", type_=Integer)
+)
+
 
 @router.post("/reminder")
-async def create_or_update_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
+def create_or_update_reminder(reminder: ReminderCreate, conn: Connection = Depends(get_autocommit_connection)):
     """
     Create or update a reminder.
 
@@ -21,108 +96,149 @@ async def create_or_update_reminder(reminder: ReminderCreate, db: Session = Depe
 
     Args:
         reminder: Reminder data
-        db: Database session
+        conn: Autocommit database connection
 
     Returns:
         Success status with HTTP 200
     """
     try:
         if reminder.reminder_id:
-            # Update existing reminder
-            logger.info(f"Updating reminder", reminder_id=reminder.reminder_id)
-
-            update_query = text("""
-                UPDATE reminder
-                SET reminder_date = :reminder_date,
-                    reminder_time = :reminder_time,
-                    reminder_message = :reminder_message,
-                    reminder_dismissed = :reminder_dismissed,
-                    job_id = :job_id,
-                    reminder_updated = CURRENT_TIMESTAMP
-                WHERE reminder_id = :reminder_id
-            """)
-
-            db.execute(update_query, {
-                "reminder_date": reminder.reminder_date,
-                "reminder_time": reminder.reminder_time,
-                "reminder_message": reminder.reminder_message,
-                "reminder_dismissed": reminder.reminder_dismissed,
-                "job_id": reminder.job_id,
-                "reminder_id": reminder.reminder_id
-            })
-            db.commit()
+            logger.debug(f"Updating reminder", reminder_id=reminder.reminder_id)
+        else:
+            logger.debug(f"Creating new reminder")
+
+        # One statement for both cases: the UPDATE matches only when an id was
+        # given, the INSERT runs only when it was not
+        saved_reminder_id = conn.execute(_SAVE_REMINDER_SQL, {
+            "reminder_date": reminder.reminder_date,
+            "reminder_time": reminder.reminder_time,
+            "reminder_message": reminder.reminder_message,
+            "reminder_dismissed": reminder.reminder_dismissed,
+            "job_id": reminder.job_id,
+            "reminder_id": reminder.reminder_id or None
+        }).scalar()
 
+        if reminder.reminder_id:
             logger.log_database_operation("UPDATE", "reminder", reminder.reminder_id)
             logger.info(f"Reminder updated successfully", reminder_id=reminder.reminder_id)
-
         else:
-            # Create new reminder
-            logger.info(f"Creating new reminder")
-
-            insert_query = text("""
-                INSERT INTO reminder (
-                    reminder_date,
-                    reminder_time,
-                    reminder_message,
-                    reminder_dismissed,
-                    job_id
-                )
-                VALUES (
-                    :reminder_date,
-                    :reminder_time,
-                    :reminder_message,
-                    :reminder_dismissed,
-                    :job_id
-                )
-                RETURNING reminder_id
-            """)
-
-            result = db.execute(insert_query, {
-                "reminder_date": reminder.reminder_date,
-                "reminder_time": reminder.reminder_time,
-                "reminder_message": reminder.reminder_message,
-                "reminder_dismissed": reminder.reminder_dismissed,
-                "job_id": reminder.job_id
-            })
-
-            new_reminder_id = result.scalar()
-            db.commit()
-
-            logger.log_database_operation("INSERT", "reminder", new_reminder_id)
-            logger.info(f"Reminder created successfully", reminder_id=new_reminder_id)
+            logger.log_database_operation("INSERT", "reminder", saved_reminder_id)
+            logger.info(f"Reminder created successfully", reminder_id=saved_reminder_id)
 
         return {"status": "success"}
 
     except Exception as e:
         logger.error(f"Error creating/updating reminder", error=str(e))
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Error saving reminder: {str(e)}")
 
 
+def _copy_reminders(db: Session, reminders: List[ReminderCreate]) -> List[int]:
+    """
+    Insert reminders with COPY in the session's transaction.
+
+    Args:
+        db: Database session
+        reminders: Reminder data
+
+    Returns:
+        The new reminder IDs, in request order
+    """
+    reminder_ids = db.execute(_NEXT_REMINDER_IDS_SQL, {"count": len(reminders)}).scalars().all()
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for reminder_id, reminder in zip(reminder_ids, reminders):
+        writer.writerow((
+            reminder_id,
+            reminder.reminder_date,
+            reminder.reminder_time,
+            reminder.reminder_message,
+            reminder.reminder_dismissed,
+            reminder.job_id
+        ))
+    buffer.seek(0)
+
+    # COPY goes through the raw psycopg2 cursor, so its errors are not wrapped
+    dbapi_connection = db.connection().connection
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(_COPY_REMINDERS_SQL, buffer)
+    except dbapi_connection.IntegrityError as e:
+        raise IntegrityError(_COPY_REMINDERS_SQL, None, e)
+    finally:
+        cursor.close()
+
+    return reminder_ids
+
+
+@router.post("/reminder/batch")
+def create_reminders(reminders: List[ReminderCreate], db: Session = Depends(get_db)):
+    """
+    Create several reminders at once.
+
+    All reminders are inserted in one transaction using multi-row INSERT
+    statements, or COPY above REMINDER_COPY_THRESHOLD reminders. reminder_id
+    is ignored; every reminder is created new.
+
+    Args:
+        reminders: Reminder data
+        db: Database session
+
+    Returns:
+        Success status with the new reminder IDs, in request order
+    """
+    if not reminders:
+        return {"status": "success", "reminder_ids": []}
+
+    try:
+        logger.debug(f"Creating reminders", count=len(reminders))
+
+        if len(reminders) > REMINDER_COPY_THRESHOLD:
+            reminder_ids = _copy_reminders(db, reminders)
+        else:
+            rows = [reminder.model_dump(exclude={"reminder_id"}) for reminder in reminders]
+            result = db.execute(
+                insert(Reminder.__table__).returning(Reminder.reminder_id, sort_by_parameter_order=True),
+                rows
+            )
+            reminder_ids = result.scalars().all()
+        db.commit()
+
+        logger.log_database_operation("INSERT", "reminder")
+        logger.info(f"Reminders created successfully", count=len(reminder_ids))
+
+        return {"status": "success", "reminder_ids": reminder_ids}
+
+    except IntegrityError as e:
+        db.rollback()
+        if is_missing_job_error(e):
+            raise HTTPException(status_code=404, detail="Job not found")
+        logger.error(f"Error creating reminders", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Error saving reminders: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error creating reminders", error=str(e))
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Error saving reminders: {str(e)}")
+
+
 @router.delete("/reminder")
-async def delete_reminder(reminder_id: int, db: Session = Depends(get_db)):
+def delete_reminder(reminder_id: int, conn: Connection = Depends(get_autocommit_connection)):
     """
     Delete a reminder by ID.
 
     Args:
         reminder_id: ID of the reminder to delete
-        db: Database session
+        conn: Autocommit database connection
 
     Returns:
         Success status with HTTP 200
     """
     try:
-        logger.info(f"Deleting reminder", reminder_id=reminder_id)
+        logger.debug(f"Deleting reminder", reminder_id=reminder_id)
 
-        delete_query = text("""
-            DELETE FROM reminder
-            WHERE reminder_id = :reminder_id
-        """)
+        deleted = conn.execute(_DELETE_REMINDER_SQL, {"reminder_id": reminder_id}).scalar_one_or_none()
 
-        result = db.execute(delete_query, {"reminder_id": reminder_id})
-        db.commit()
-
-        if result.rowcount == 0:
+        if deleted is None:
             logger.warning(f"Reminder not found for deletion", reminder_id=reminder_id)
             raise HTTPException(status_code=404, detail="Reminder not found")
 
@@ -135,12 +251,11 @@ async def delete_reminder(reminder_id: int, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Error deleting reminder", reminder_id=reminder_id, error=str(e))
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Error deleting reminder: {str(e)}")
 
 
 @router.post("/reminder/list", response_model=List[ReminderListResponse])
-async def list_reminders(request: ReminderListRequest, db: Session = Depends(get_db)):
+def list_reminders(request: ReminderListRequest, conn: Connection = Depends(get_autocommit_connection)):
     """
     Get a list of reminders based on duration and optional job_id filter.
 
@@ -151,66 +266,26 @@ async def list_reminders(request: ReminderListRequest, db: Session = Depends(get
 
     Args:
         request: List request with duration, start_date, and optional job_id
-        db: Database session
+        conn: Autocommit database connection
 
     Returns:
         List of reminders matching the criteria
     """
     try:
-        logger.info(f"Listing reminders", duration=request.duration, start_date=request.start_date, job_id=request.job_id)
-
-        # Calculate end date based on duration
-        if request.duration == "day":
-            end_date = request.start_date
-        elif request.duration == "week":
-            end_date = request.start_date + timedelta(days=6)
-        else:  # month
-            end_date = request.start_date + timedelta(days=29)
-
-        # Build query based on whether job_id is provided
-        if request.job_id is not None:
-            query = text("""
-                SELECT reminder_id, reminder_date, reminder_time, reminder_message, job_id
-                FROM reminder
-                WHERE reminder_date BETWEEN :start_date AND :end_date
-                  AND job_id = :job_id
-                  AND (reminder_dismissed IS NULL OR reminder_dismissed = FALSE)
-                ORDER BY reminder_date DESC, reminder_time DESC
-            """)
-
-            result = db.execute(query, {
-                "start_date": request.start_date,
-                "end_date": end_date,
-                "job_id": request.job_id
-            })
-        else:
-            query = text("""
-                SELECT reminder_id, reminder_date, reminder_time, reminder_message, job_id
-                FROM reminder
-                WHERE reminder_date BETWEEN :start_date AND :end_date
-                  AND (reminder_dismissed IS NULL OR reminder_dismissed = FALSE)
-                ORDER BY reminder_date DESC, reminder_time DESC
-            """)
-
-            result = db.execute(query, {
-                "start_date": request.start_date,
-                "end_date": end_date
-            })
-
-        reminders = []
-        for row in result:
-            reminders.append({
-                "reminder_id": row.reminder_id,
-                "reminder_date": row.reminder_date,
-                "reminder_time": row.reminder_time,
-                "reminder_message": row.reminder_message,
-                "job_id": row.job_id
-            })
+        logger.debug(f"Listing reminders", duration=request.duration, start_date=request.start_date, job_id=request.job_id)
+
+        reminders = conn.execute(_LIST_REMINDERS_SQL, {
+            "start_date": request.start_date,
+            "days": _LIST_DURATION_DAYS[request.duration],
+            "job_id": request.job_id
+        }).mappings().all()
 
         logger.log_database_operation("SELECT", "reminder")
-        logger.info(f"Retrieved reminders", count=len(reminders), duration=request.duration)
+        logger.debug(f"Retrieved reminders", count=len(reminders), duration=request.duration)
 
-        return reminders
+        # Returned as a Response so the already-typed columns skip
+        # ReminderListResponse validation; response_model is kept for the OpenAPI schema
+        return ORJSONResponse([dict(reminder) for reminder in reminders])
 
     except Exception as e:
         logger.error(f"Error listing reminders", error=str(e))
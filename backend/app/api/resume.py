@@ -2,6 +2,7 @@ import os
 import re
 import shutil
 import difflib
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
@@ -37,6 +38,42 @@ from ..utils.logger import logger
 
 router = APIRouter()
 
+# Bytes of an uploaded file held in memory at a time while saving it
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Upload extensions accepted as resume formats, and the list shown when one is not
+_VALID_FORMATS = frozenset(e.value for e in FileFormat)
+_VALID_FORMATS_STR = ', '.join(e.value for e in FileFormat)
+
+# Characters dropped from, and separators collapsed in, generated filenames
+_FILENAME_STRIP_RE = re.compile(r'[^\w\s-]')
+_FILENAME_JOIN_RE = re.compile(r'[-\s]+')
+
+# " (n)" counter appended to duplicate resume titles, as a Python and a
+# Postgres regex. re.escape() output is read literally by both engines.
+_COUNTER_SUFFIX_PATTERN = r' \(([1-9][0-9]*)\)'
+_COUNTER_SUFFIX_SQL_PATTERN = r' \([1-9][0-9]*\)$'
+
+_TAKEN_RESUME_TITLES_SQL = text("""
+	SELECT resume_title
+	FROM resume
+	WHERE resume_title = :base_title OR resume_title ~ :pattern
+""")
+
+# Whether the plain -copy name is taken, and the highest numbered copy
+_COPY_NUMBERS_SQL = text("""
+	SELECT COALESCE(bool_or(file_name = :copy_name), false) AS has_copy,
+		COALESCE(MAX(CAST(substring(file_name FROM :number_pattern) AS bigint)), 0) AS highest
+	FROM resume
+	WHERE file_name ~ :pattern
+""")
+
+_TAKEN_FILE_NAMES_SQL = text("""
+	SELECT file_name
+	FROM resume
+	WHERE file_name IN (:base_filename, :timestamped_name) OR file_name ~ :pattern
+""")
+
 
 def _convert_to_markdown(file_name: str, file_format: str) -> str:
 	"""
@@ -67,14 +104,27 @@ def _convert_to_markdown(file_name: str, file_format: str) -> str:
 		raise ValueError(f"Unsupported file format: {file_format}")
 
 
+async def _save_upload(upload_file: UploadFile, file_path: Path) -> None:
+	"""
+	Write an uploaded file to disk in chunks rather than reading it whole.
+
+	Args:
+		upload_file: Uploaded file
+		file_path: Destination path
+	"""
+	with open(file_path, "wb") as f:
+		while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+			f.write(chunk)
+
+
 def clean_filename_part(text: str) -> str:
 	"""
 	Clean text for use in filename: lowercase, replace spaces with underscores.
 	"""
 	# Remove special characters except spaces and hyphens
-	cleaned = re.sub(r'[^\w\s-]', '', text).strip()
+	cleaned = _FILENAME_STRIP_RE.sub('', text).strip()
 	# Replace spaces and hyphens with underscores
-	cleaned = re.sub(r'[-\s]+', '_', cleaned)
+	cleaned = _FILENAME_JOIN_RE.sub('_', cleaned)
 	# Convert to lowercase
 	return cleaned.lower()
 
@@ -110,6 +160,34 @@ def generate_text_diff(original_text: str, rewritten_text: str) -> List[str]:
 	return []
 
 
+@lru_cache(maxsize=4096)
+def _compile_keyword(keyword: str) -> re.Pattern:
+	"""
+	Compile a case-insensitive whole-word pattern for a keyword.
+
+	Job keyword lists are scored repeatedly, so patterns are kept in a
+	bounded process-wide cache rather than recompiled on every call.
+	"""
+	return re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _compile_keyword_set(keywords: tuple) -> re.Pattern:
+	"""
+	Compile one pattern that finds every keyword of a set in a single scan.
+
+	The alternation sits in a lookahead so matches do not consume text and
+	overlapping keywords ("machine learning", "learning") are all seen.
+	Longer keywords come first; a shorter keyword starting at the same
+	place is re-checked by calculate_keyword_score.
+
+	Args:
+		keywords: Distinct lowercased keywords
+	"""
+	alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+	return re.compile(r'(?=\b(' + alternation + r')\b)', re.IGNORECASE)
+
+
 def calculate_keyword_score(keywords: list, text: str) -> int:
 	"""
 	Calculate the percentage of keywords found in text using regex matching.
@@ -124,12 +202,19 @@ def calculate_keyword_score(keywords: list, text: str) -> int:
 	if not keywords or not text:
 		return 0
 
-	matched_count = 0
-	for keyword in keywords:
-		# Case-insensitive regex search for whole keyword
-		pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-		if pattern.search(text):
-			matched_count += 1
+	lowered = [keyword.lower() for keyword in keywords]
+	distinct = tuple(sorted(set(lowered)))
+
+	# Case-insensitive whole-word search for all keywords in one pass
+	found = {match.group(1).lower() for match in _compile_keyword_set(distinct).finditer(text)}
+
+	# A keyword that is a prefix of one found at the same position is hidden by it
+	for keyword in distinct:
+		if keyword not in found and any(other.startswith(keyword) for other in found):
+			if _compile_keyword(keyword).search(text):
+				found.add(keyword)
+
+	matched_count = sum(1 for keyword in lowered if keyword in found)
 
 	total_count = len(keywords)
 	if total_count > 0:
@@ -157,14 +242,23 @@ def validate_file_format(extension: str) -> str:
 	"""
 	Validate that the file extension is a valid FileFormat enum value.
 	"""
-	valid_formats = [e.value for e in FileFormat]
-	if extension not in valid_formats:
+	if extension not in _VALID_FORMATS:
 		raise HTTPException(
 			status_code=400,
-			detail=f"Invalid file format '{extension}'. Allowed formats: {', '.join(valid_formats)}"
+			detail=f"Invalid file format '{extension}'. Allowed formats: {_VALID_FORMATS_STR}"
 		)
 	return extension
 
+def _first_free_counter(used: set) -> int:
+	"""
+	Return the lowest counter, starting at 1, that is not already used.
+	"""
+	counter = 1
+	while counter in used:
+		counter += 1
+	return counter
+
+
 def make_unique_resume_title(base_title: str, db: Session) -> str:
 	"""
 	Ensure resume title is unique by appending an incrementing number if needed.
@@ -179,26 +273,18 @@ def make_unique_resume_title(base_title: str, db: Session) -> str:
 	if not base_title:
 		return base_title
 
-	# Check if base title already exists
-	existing = db.query(Resume).filter(Resume.resume_title == base_title).first()
+	# Fetch the base title and all of its numbered variants in one query
+	taken = db.execute(_TAKEN_RESUME_TITLES_SQL, {
+		"base_title": base_title,
+		"pattern": '^' + re.escape(base_title) + _COUNTER_SUFFIX_SQL_PATTERN
+	}).scalars().all()
 
-	if not existing:
+	if base_title not in taken:
 		return base_title
 
-	# Try incrementing numbers until we find a unique title
-	counter = 1
-	while True:
-		new_title = f"{base_title} ({counter})"
-		existing = db.query(Resume).filter(Resume.resume_title == new_title).first()
-
-		if not existing:
-			return new_title
-
-		counter += 1
-
-		# Safety check to prevent infinite loop
-		if counter > 1000:
-			raise ValueError(f"Could not generate unique resume title after {counter} attempts")
+	suffix = re.compile(re.escape(base_title) + _COUNTER_SUFFIX_PATTERN)
+	used = {int(match.group(1)) for match in map(suffix.fullmatch, taken) if match}
+	return f"{base_title} ({_first_free_counter(used)})"
 
 
 def make_unique_filename(base_filename: str, db: Session) -> str:
@@ -212,12 +298,6 @@ def make_unique_filename(base_filename: str, db: Session) -> str:
 	Returns:
 		Unique filename that doesn't exist in the database
 	"""
-	# Check if base filename already exists
-	existing = db.query(Resume).filter(Resume.file_name == base_filename).first()
-
-	if not existing:
-		return base_filename
-
 	# Split into base and extension
 	parts = base_filename.rsplit('.', 1)
 	if len(parts) == 2:
@@ -226,23 +306,29 @@ def make_unique_filename(base_filename: str, db: Session) -> str:
 		base_name = base_filename
 		extension = ""
 
-	# Try adding date
-	from datetime import datetime
 	date_stamp = datetime.utcnow().strftime('%Y_%m_%d')
 	timestamped_name = f"{base_name}_{date_stamp}.{extension}" if extension else f"{base_name}_{date_stamp}"
 
-	existing = db.query(Resume).filter(Resume.file_name == timestamped_name).first()
-	if not existing:
+	# Fetch the filename, its dated form and the numbered dated forms in one query
+	numbered_prefix = re.escape(f"{base_name}_{date_stamp}_")
+	numbered_suffix = re.escape(f".{extension}") if extension else ""
+	taken = set(db.execute(_TAKEN_FILE_NAMES_SQL, {
+		"base_filename": base_filename,
+		"timestamped_name": timestamped_name,
+		"pattern": '^' + numbered_prefix + '[1-9][0-9]*' + numbered_suffix + '$'
+	}).scalars())
+
+	if base_filename not in taken:
+		return base_filename
+
+	if timestamped_name not in taken:
 		return timestamped_name
 
 	# If date also exists (unlikely), add incrementing number
-	counter = 1
-	while True:
-		numbered_name = f"{base_name}_{date_stamp}_{counter}.{extension}" if extension else f"{base_name}_{date_stamp}_{counter}"
-		existing = db.query(Resume).filter(Resume.file_name == numbered_name).first()
-		if not existing:
-			return numbered_name
-		counter += 1
+	numbered = re.compile(numbered_prefix + '([1-9][0-9]*)' + numbered_suffix)
+	used = {int(match.group(1)) for match in map(numbered.fullmatch, taken) if match}
+	counter = _first_free_counter(used)
+	return f"{base_name}_{date_stamp}_{counter}.{extension}" if extension else f"{base_name}_{date_stamp}_{counter}"
 
 
 @router.get("/resume/baseline")
@@ -455,9 +541,9 @@ async def create_or_update_resume(
 	else:
 		is_baseline = True
 
-	# Verify job exists if job_id is provided
+	# Verify job exists if job_id is provided, keeping the fields used for file_name
 	if job_id:
-		job = db.query(Job).filter(Job.job_id == job_id).first()
+		job = db.query(Job.company, Job.job_title).filter(Job.job_id == job_id).first()
 		if not job:
 			raise HTTPException(status_code=404, detail="Job not found")
 
@@ -469,11 +555,9 @@ async def create_or_update_resume(
 			calculated_file_name = f"{clean_filename_part(resume_title)}.{original_format}"
 		else:
 			# Use company-job_title for job-specific resumes
-			job = db.query(Job).filter(Job.job_id == job_id).first()
-			if job:
-				company_part = clean_filename_part(job.company) if job.company else "unknown"
-				job_title_part = clean_filename_part(job.job_title) if job.job_title else "unknown"
-				calculated_file_name = f"{company_part}-{job_title_part}.{original_format}"
+			company_part = clean_filename_part(job.company) if job.company else "unknown"
+			job_title_part = clean_filename_part(job.job_title) if job.job_title else "unknown"
+			calculated_file_name = f"{company_part}-{job_title_part}.{original_format}"
 
 	# Ensure filename is unique (only for new resumes)
 	if not is_update and calculated_file_name:
@@ -520,10 +604,7 @@ async def create_or_update_resume(
 
 			file_path = base_path / calculated_file_name
 
-			# Write file
-			with open(file_path, "wb") as f:
-				content = await upload_file.read()
-				f.write(content)
+			await _save_upload(upload_file, file_path)
 
 			'''
 			# Convert to markdown and create/update resume_detail
@@ -579,10 +660,7 @@ async def create_or_update_resume(
 
 			file_path = base_path / calculated_file_name
 
-			# Write file
-			with open(file_path, "wb") as f:
-				content = await upload_file.read()
-				f.write(content)
+			await _save_upload(upload_file, file_path)
 
 			'''
 			# Convert to markdown and create resume_detail
@@ -787,6 +865,34 @@ async def delete_resume(
 	return {"status": "success", "message": "Resume deleted"}
 
 
+def _next_copy_suffix(base_name: str, extension: str, db: Session) -> str:
+	"""
+	Get the suffix for the next copy of a resume file.
+
+	The first copy is "-copy", later ones "-copy1", "-copy2", ... one past
+	the highest number in use.
+
+	Args:
+		base_name: File name without extension
+		extension: File extension without the dot, or ""
+		db: Database session
+
+	Returns:
+		Suffix to append to base_name
+	"""
+	name = re.escape(f"{base_name}-copy")
+	ext = re.escape(f".{extension}") if extension else ""
+	row = db.execute(_COPY_NUMBERS_SQL, {
+		"copy_name": f"{base_name}-copy.{extension}" if extension else f"{base_name}-copy",
+		"pattern": f"^{name}[0-9]*{ext}$",
+		"number_pattern": f"^{name}([0-9]+){ext}$"
+	}).one()
+
+	if not row.has_copy:
+		return "-copy"
+	return f"-copy{row.highest + 1}"
+
+
 @router.post("/resume/clone")
 async def clone_resume(
 	clone_request: ResumeCloneRequest,
@@ -821,63 +927,10 @@ async def clone_resume(
 		base_name = original_file_name
 		extension = ""
 
-	# Check if a simple -copy already exists
-	test_file_name = f"{base_name}-copy.{extension}" if extension else f"{base_name}-copy"
-
-	existing = db.query(Resume).filter(Resume.file_name == test_file_name).first()
-
-	if existing:
-		# Need to find the highest numbered copy
-		# Use regex to find all copies with numbers
-		pattern = f"{re.escape(base_name)}-copy\\d*"
-
-		query = text("""
-			SELECT file_name FROM resume
-			WHERE file_name ~ :pattern
-			ORDER BY file_name DESC
-			LIMIT 1
-		""")
-
-		result = db.execute(query, {"pattern": pattern}).first()
-
-		if result:
-			# Extract the number from the highest match
-			highest_file_name = result[0]
-			# Pattern to extract number after -copy
-			match = re.search(r'-copy(\d+)', highest_file_name)
-			if match:
-				next_num = int(match.group(1)) + 1
-			else:
-				# Existing is -copy without number, so start at 1
-				next_num = 1
-
-			new_file_name = f"{base_name}-copy{next_num}.{extension}" if extension else f"{base_name}-copy{next_num}"
-		else:
-			# Shouldn't happen, but fallback to -copy1
-			new_file_name = f"{base_name}-copy1.{extension}" if extension else f"{base_name}-copy1"
-	else:
-		# Simple -copy is available
-		new_file_name = test_file_name
-
-	# Determine suffix for resume_title (use same logic as file_name)
-	if original_resume.resume_title:
-		if "-copy1" in new_file_name or "-copy2" in new_file_name or "-copy" in new_file_name:
-			# Extract the suffix used for file_name
-			if "-copy" in new_file_name:
-				match = re.search(r'-copy(\d*)', new_file_name)
-				if match.group(1):
-					# Has number
-					suffix = f"-copy{match.group(1)}"
-				else:
-					# Just -copy
-					suffix = "-copy"
-				new_resume_title = f"{original_resume.resume_title}{suffix}"
-			else:
-				new_resume_title = f"{original_resume.resume_title}-copy"
-		else:
-			new_resume_title = f"{original_resume.resume_title}-copy"
-	else:
-		new_resume_title = None
+	# Pick the next -copy suffix and use it for both file_name and resume_title
+	suffix = _next_copy_suffix(base_name, extension, db)
+	new_file_name = f"{base_name}{suffix}.{extension}" if extension else f"{base_name}{suffix}"
+	new_resume_title = f"{original_resume.resume_title}{suffix}" if original_resume.resume_title else None
 
 	# Ensure resume_title is unique
 	unique_resume_title = make_unique_resume_title(new_resume_title, db) if new_resume_title else new_resume_title
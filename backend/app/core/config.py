@@ -23,6 +23,17 @@ class Settings(BaseSettings):
 	postgres_db: str
 	postgres_port: int = 5432
 
+	# Connection pool sizing (per worker process). Keep
+	# workers * (db_pool_size + db_max_overflow) below Postgres max_connections.
+	db_pool_size: int = 20
+	db_max_overflow: int = 40
+	db_pool_timeout: int = 30
+	db_pool_recycle: int = 1800
+
+	# Threads available to sync (def) endpoints per worker. Kept at
+	# db_pool_size + db_max_overflow so threads don't queue on the pool.
+	thread_pool_size: int = 60
+
 	# File storage configuration
 	base_job_file_path: str
 	resume_dir: str
@@ -4,6 +4,8 @@ from sqlalchemy.orm import sessionmaker
 from .config import settings
 
 # Create engine with proper connection pool configuration
+# The engine (and its pool) is created once per worker process and shared by
+# every request; sizes come from settings so they can be tuned per deployment.
 # pool_size: Number of connections to maintain in the pool
 # max_overflow: Number of connections that can be created beyond pool_size
 # pool_timeout: Seconds to wait before giving up on getting a connection
@@ -11,10 +13,10 @@ from .config import settings
 # pool_pre_ping: Verify connections are alive before using them
 engine = create_engine(
     settings.database_url,
-    pool_size=20,           # Increased from default 5
-    max_overflow=40,        # Increased from default 10
-    pool_timeout=30,        # Wait up to 30 seconds for a connection
-    pool_recycle=3600,      # Recycle connections after 1 hour
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,     # Test connections before use
     echo=False              # Set to True for SQL debugging
 )
@@ -33,4 +35,31 @@ def get_db():
         raise
     finally:
         # Always close the session to return connection to pool
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_connection():
+    """
+    Yield a plain Core connection for read-only, raw SQL endpoints.
+
+    Skips the ORM Session (identity map, flush and begin/commit bookkeeping)
+    and streams results through a server-side cursor by default.
+    """
+    with engine.connect().execution_options(stream_results=True) as conn:
+        yield conn
+
+
+# Shares engine's pool; connections checked out through it commit each
+# statement on its own, so single-statement writes skip the COMMIT round-trip
+autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+def get_autocommit_connection():
+    """
+    Yield an autocommit Core connection for single-statement endpoints.
+
+    Every statement is its own transaction, so handlers must not depend on
+    several statements committing or rolling back together.
+    """
+    with autocommit_engine.connect() as conn:
+        yield conn
@@ -1,18 +1,39 @@
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .core.config import settings
+from .core.database import engine
 from .api import jobs, contacts, calendar, notes, resume, convert, personal, letter, files, reminder, export, process, company, openai_api
 from .middleware import LoggingMiddleware
 from .utils.logger import logger
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	"""
+	Application lifespan.
+	Sizes the threadpool used by sync endpoints on startup and closes
+	pooled database and HTTP connections when the worker shuts down.
+	"""
+	anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+	yield
+	await openai_api.close_http_client()
+	engine.dispose()
+	logger.info("Database connection pool disposed")
+
+
 app = FastAPI(
 	title=settings.app_name,
 	version=settings.app_version,
-	debug=settings.debug
+	debug=settings.debug,
+	lifespan=lifespan,
+	# orjson renders the large job list payloads several times faster than stdlib json
+	default_response_class=ORJSONResponse
 )
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, Date, Time, DateTime, SmallInteger, Numeric, ForeignKey, Enum as SQLEnum, ARRAY
+from sqlalchemy import Column, Integer, String, Text, Boolean, Date, Time, DateTime, SmallInteger, Numeric, ForeignKey, Index, Enum as SQLEnum, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -153,6 +153,17 @@ class Job(Base):
     documents = relationship("Document", back_populates="job")
     detail = relationship("JobDetail", back_populates="job", uselist=False)
 
+    __table_args__ = (
+        # Partial covering index for the active job list and dropdown ordering
+        Index(
+            "job_active_last_activity_idx",
+            last_activity.desc(),
+            date_applied.desc(),
+            postgresql_include=["company", "job_title"],
+            postgresql_where=(job_active == True),
+        ),
+    )
+
 
 class JobDetail(Base):
     __tablename__ = "job_detail"
@@ -209,6 +220,23 @@ class Note(Base):
     # Relationships
     job = relationship("Job", back_populates="notes")
 
+    __table_args__ = (
+        # Partial indexes for the note list, with and without job_id
+        Index(
+            "note_active_created_idx",
+            note_created.desc(),
+            note_id.desc(),
+            postgresql_where=(note_active == True),
+        ),
+        Index(
+            "note_active_job_created_idx",
+            job_id,
+            note_created.desc(),
+            note_id.desc(),
+            postgresql_where=(note_active == True),
+        ),
+    )
+
 
 class Calendar(Base):
     __tablename__ = "calendar"
@@ -232,6 +260,38 @@ class Calendar(Base):
     job = relationship("Job", back_populates="calendar_events")
 
 
+class Reminder(Base):
+    __tablename__ = "reminder"
+
+    reminder_id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("job.job_id", ondelete="CASCADE"))
+    reminder_date = Column(Date, nullable=False)
+    reminder_time = Column(Time)
+    reminder_message = Column(Text, nullable=False)
+    reminder_dismissed = Column(Boolean, nullable=False, default=False)
+    reminder_created = Column(DateTime(timezone=False), server_default=func.current_timestamp())
+    reminder_updated = Column(DateTime(timezone=False))
+
+    __table_args__ = (
+        # Partial covering indexes for the reminder list, with and without job_id
+        Index(
+            "reminder_active_date_idx",
+            reminder_date.desc(),
+            reminder_time.desc(),
+            postgresql_include=["reminder_id", "reminder_message", "job_id"],
+            postgresql_where=reminder_dismissed.isnot(True),
+        ),
+        Index(
+            "reminder_active_job_date_idx",
+            job_id,
+            reminder_date.desc(),
+            reminder_time.desc(),
+            postgresql_include=["reminder_id", "reminder_message"],
+            postgresql_where=reminder_dismissed.isnot(True),
+        ),
+    )
+
+
 class Communication(Base):
     __tablename__ = "communication"
 
@@ -68,6 +68,10 @@ class Job(JobBase):
     calendar_id: Optional[int] = None
     start_date: Optional[date] = None
     start_time: Optional[time] = None
+    # job_detail fields, only present when requested
+    job_desc: Optional[str] = None
+    job_qualification: Optional[str] = None
+    job_keyword: Optional[List[str]] = None
 
     class Config:
         from_attributes = True
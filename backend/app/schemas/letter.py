@@ -1,7 +1,11 @@
-from typing import Optional
+from typing import Optional, Literal
 from datetime import datetime
 from pydantic import BaseModel
 
+# Allowed values of the content_length and content_tone database enums
+LetterLengthValue = Literal['short', 'medium', 'long']
+LetterToneValue = Literal['professional', 'casual', 'enthusiastic', 'informational']
+
 
 class LetterBase(BaseModel):
     resume_id: int
@@ -21,6 +25,17 @@ class LetterUpdate(LetterBase):
     cover_id: int
 
 
+class LetterSave(BaseModel):
+    cover_id: Optional[int] = None
+    resume_id: int
+    job_id: int
+    letter_length: LetterLengthValue
+    letter_tone: LetterToneValue
+    instruction: Optional[str] = None
+    letter_content: Optional[str] = None
+    file_name: Optional[str] = None
+
+
 class Letter(LetterBase):
     cover_id: int
     letter_created: Optional[datetime] = None
@@ -42,3 +57,14 @@ class LetterListItem(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Cover letter generation/conversion request schemas. cover_id stays optional
+# so a missing id is reported by the handler as a 400, as before.
+class LetterWriteRequest(BaseModel):
+    cover_id: Optional[int] = None
+
+
+class LetterConvertRequest(BaseModel):
+    cover_id: Optional[int] = None
+    format: str = 'docx'
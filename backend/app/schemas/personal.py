@@ -65,3 +65,35 @@ class PersonalUpdate(PersonalBase):
 class Personal(PersonalBase):
     class Config:
         from_attributes = True
+
+
+class PersonalResponse(BaseModel):
+    first_name: str = ""
+    last_name: str = ""
+    email: str = ""
+    phone: str = ""
+    linkedin_url: str = ""
+    github_url: str = ""
+    website_url: str = ""
+    portfolio_url: str = ""
+    address_1: str = ""
+    address_2: str = ""
+    city: str = ""
+    state: str = ""
+    zip: str = ""
+    country: str = ""
+    no_response_week: Optional[int] = 4
+    resume_extract_llm: str = "gpt-4.1-mini"
+    job_extract_llm: str = "gpt-4.1-mini"
+    rewrite_llm: str = "gpt-4.1-mini"
+    cover_llm: str = "gpt-4.1-mini"
+    company_llm: str = "gpt-4.1-mini"
+    openai_api_key: str = ""
+    tinymce_api_key: str = ""
+    convertapi_key: str = ""
+    docx2html: str = "docx-parser-converter"
+    odt2html: str = "pandoc"
+    pdf2html: str = "markitdown"
+    html2docx: str = "html4docx"
+    html2odt: str = "pandoc"
+    html2pdf: str = "weasyprint"
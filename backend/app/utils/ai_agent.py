@@ -833,6 +833,34 @@ class AiAgent:
 		finally:
 			db.close()
 
+	def job_extraction_process(self, job_id: int, process_id: int) -> None:
+		"""
+		Background process to extract job qualifications and keywords using AI.
+
+		Runs job_extraction (which saves the result to job_detail) and marks
+		the process as completed or failed.
+
+		Args:
+			job_id: ID of the job to analyze
+			process_id: The primary key for the process DB record
+		"""
+		try:
+			logger.info(f"Starting background job extraction process", job_id=job_id, process_id=process_id)
+
+			result = self.job_extraction(job_id)
+
+			update_process_query = text("UPDATE process SET completed = CURRENT_TIMESTAMP WHERE process_id = :process_id")
+			self.db.execute(update_process_query, {"process_id": process_id})
+			self.db.commit()
+
+			logger.info(f"Job extraction process completed successfully", job_id=job_id, process_id=process_id,
+						keyword_count=len(result['keywords']))
+
+		except Exception as e:
+			logger.error(f"Error in job extraction process", job_id=job_id, process_id=process_id, error=str(e))
+			self.db.rollback()
+			self._mark_process_failed(self.db, process_id, str(e))
+
 	def _mark_process_failed(self, db: Session, process_id: int, error_message: str) -> None:
 		"""Mark a process as failed in the database."""
 		try:
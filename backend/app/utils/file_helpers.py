@@ -1,10 +1,21 @@
 import os
 import shutil
 import mimetypes
+from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from .logger import logger
 
+# Mime types for logo images, keyed by lowercase file extension
+LOGO_MIME_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'svg': 'image/svg+xml',
+    'webp': 'image/webp'
+}
+
 
 def get_personal_name(db: Session) -> tuple[str, str]:
     """
@@ -113,3 +124,26 @@ def create_standardized_download_file(
     mime_type = get_mime_type(source_file_path)
 
     return (tmp_file_path, download_filename, mime_type)
+
+
+def get_logo_info(file_path: str) -> Optional[tuple[os.stat_result, str]]:
+    """
+    Get the stat result and mime type for a logo file.
+
+    The file is stat'ed on every call so a logo overwritten in place, by
+    any worker, is served with its current size and ETag. The one stat
+    result is passed on to FileResponse so it does not stat again.
+
+    Args:
+        file_path: Path to the logo file
+
+    Returns:
+        Tuple of (stat_result, mime_type), or None if the file does not exist
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return None
+
+    extension = file_path.split('.')[-1].lower()
+    return (stat_result, LOGO_MIME_TYPES.get(extension, 'image/png'))
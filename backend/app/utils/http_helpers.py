@@ -0,0 +1,57 @@
+"""
+Helper functions for HTTP response handling.
+"""
+import hashlib
+import re
+
+from fastapi import Request, Response
+
+# Clients may store responses but must revalidate (If-None-Match) before reuse
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+# Entity tags in an If-None-Match list, without any W/ weak prefix
+_ENTITY_TAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check a request's If-None-Match header against the current ETag.
+
+    Follows RFC 9110: the header is a comma-separated list or "*", and
+    tags are compared weakly, so a W/ prefix is ignored.
+
+    Args:
+        request: Incoming request carrying the If-None-Match header
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return etag in _ENTITY_TAG_RE.findall(if_none_match)
+
+
+def etag_response(request: Request, response: Response, cache_control: str = DEFAULT_CACHE_CONTROL) -> Response:
+    """
+    Add an ETag (hash of the body) to a JSON response, or swap it for a
+    304 Not Modified when the client already holds the same body.
+
+    Args:
+        request: Incoming request carrying the If-None-Match header
+        response: Fully rendered response
+        cache_control: Cache-Control header value to send
+
+    Returns:
+        The response with ETag/Cache-Control headers, or an empty 304
+    """
+    etag = f'"{hashlib.md5(response.body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
@@ -3,10 +3,14 @@ Helper functions for job-related operations.
 """
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from .logger import logger
 
+# SQLSTATE of a foreign key violation
+_FOREIGN_KEY_VIOLATION = "23503"
 
-def update_job_activity(db: Session, job_id: int) -> None:
+
+def update_job_activity(db: Session, job_id: int, commit: bool = True) -> None:
     """
     Update the last_activity field for a job to the current date.
 
@@ -16,6 +20,8 @@ def update_job_activity(db: Session, job_id: int) -> None:
     Args:
         db: Database session
         job_id: The ID of the job to update
+        commit: Commit after the update; pass False to leave it in the
+            caller's transaction
 
     Returns:
         None
@@ -31,7 +37,8 @@ def update_job_activity(db: Session, job_id: int) -> None:
         """)
 
         db.execute(query, {"job_id": job_id})
-        db.commit()
+        if commit:
+            db.commit()
 
         logger.debug(f"Updated last_activity for job", job_id=job_id)
 
@@ -41,7 +48,7 @@ def update_job_activity(db: Session, job_id: int) -> None:
         raise
 
 
-def calc_avg_score(db: Session, job_id: int) -> None:
+def calc_avg_score(db: Session, job_id: int, commit: bool = True) -> None:
     """
     Calculate and update the average score for a job.
 
@@ -51,6 +58,7 @@ def calc_avg_score(db: Session, job_id: int) -> None:
     Args:
         db: Database session
         job_id: The ID of the job to calculate average score for
+        commit: Commit after the update; pass False to leave it in the caller's transaction
 
     Returns:
         None
@@ -69,7 +77,8 @@ def calc_avg_score(db: Session, job_id: int) -> None:
         """)
 
         db.execute(query, {"job_id": job_id, "job_id2": job_id, "job_id3": job_id})
-        db.commit()
+        if commit:
+            db.commit()
 
         logger.debug(f"Updated average_score for job", job_id=job_id)
 
@@ -77,3 +86,24 @@ def calc_avg_score(db: Session, job_id: int) -> None:
         db.rollback()
         logger.error(f"Error calculating average score", job_id=job_id, error=str(e))
         raise
+
+
+def is_missing_job_error(exc: IntegrityError) -> bool:
+    """
+    Check whether an integrity error means the referenced job does not exist.
+
+    Every job_id column references job (job_id) through a constraint named
+    <table>_job_id_fkey. NOT NULL, check and other key violations return
+    False so callers can re-raise them instead of reporting a missing job.
+
+    Args:
+        exc: Integrity error raised by a write
+
+    Returns:
+        True if the job_id foreign key was violated
+    """
+    orig = exc.orig
+    if getattr(orig, "pgcode", None) != _FOREIGN_KEY_VIOLATION:
+        return False
+    constraint_name = getattr(getattr(orig, "diag", None), "constraint_name", None) or ""
+    return constraint_name.endswith("_job_id_fkey")
@@ -1,6 +1,8 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from ..core.config import settings
 
@@ -50,29 +52,39 @@ class APILogger:
         console_handler.setFormatter(formatter)
         console_handler.setLevel(log_level)
 
-        # Add handlers to logger
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        # Records are queued by the calling thread and written to the file and
+        # console by a listener thread, so request handlers never block on log I/O
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     def debug(self, message: str, **kwargs):
         """Log debug message"""
-        self._logger.debug(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_message(message, **kwargs))
 
     def info(self, message: str, **kwargs):
         """Log info message"""
-        self._logger.info(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format_message(message, **kwargs))
 
     def warning(self, message: str, **kwargs):
         """Log warning message"""
-        self._logger.warning(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format_message(message, **kwargs))
 
     def error(self, message: str, **kwargs):
         """Log error message"""
-        self._logger.error(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(self._format_message(message, **kwargs))
 
     def critical(self, message: str, **kwargs):
         """Log critical message"""
-        self._logger.critical(self._format_message(message, **kwargs))
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(self._format_message(message, **kwargs))
 
     def log_request(self, method: str, path: str, client_ip: str = None, user_id: int = None):
         """Log API request"""
@@ -93,6 +105,8 @@ class APILogger:
 
     def log_database_operation(self, operation: str, table: str, record_id: int = None):
         """Log database operations"""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         record_info = f" ID: {record_id}" if record_id else ""
         self.debug(f"Database {operation}: {table}{record_info}")
 
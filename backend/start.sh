@@ -6,5 +6,12 @@ nginx
 # Wait a moment for nginx to start
 sleep 2
 
+# Fixed worker count rather than one per CPU: each worker opens its own DB pool
+# (up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections) and keeps its own caches.
+# Keep UVICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below max_connections.
+WORKERS=${UVICORN_WORKERS:-4}
+LIMIT_CONCURRENCY=${UVICORN_LIMIT_CONCURRENCY:-200}
+BACKLOG=${UVICORN_BACKLOG:-2048}
+
 # Start uvicorn
-exec python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4 --timeout-graceful-shutdown 200 --timeout-keep-alive 200
+exec python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS" --limit-concurrency "$LIMIT_CONCURRENCY" --backlog "$BACKLOG" --timeout-graceful-shutdown 200 --timeout-keep-alive 200
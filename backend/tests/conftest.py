@@ -3,7 +3,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from app.main import app
-from app.core.database import get_db
+from app.core.database import get_db, get_connection, get_autocommit_connection
 import tempfile
 import os
 from pathlib import Path
@@ -86,7 +86,12 @@ def client(test_db):
         finally:
             pass
 
+    def override_get_connection():
+        yield test_db.connection()
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_connection] = override_get_connection
+    app.dependency_overrides[get_autocommit_connection] = override_get_connection
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -436,6 +436,46 @@ class TestJobExtraction:
             agent.job_extraction(1)
 
 
+class TestJobExtractionProcess:
+    """Test suite for job_extraction_process method."""
+
+    @patch('app.utils.ai_agent.settings')
+    @patch('app.utils.ai_agent.OpenAI')
+    def test_job_extraction_process_completed(self, mock_openai, mock_settings):
+        """Test that a successful extraction marks the process completed."""
+        mock_db = Mock()
+        mock_settings.openai_api_key = "test-key"
+        mock_settings.openai_project = None
+
+        agent = AiAgent(mock_db)
+
+        with patch.object(agent, 'job_extraction', return_value={'job_qualification': 'Python', 'keywords': ['Python']}), \
+             patch.object(agent, '_mark_process_failed') as mock_failed:
+            agent.job_extraction_process(1, 42)
+
+        update_sql = str(mock_db.execute.call_args[0][0])
+        assert "SET completed = CURRENT_TIMESTAMP" in update_sql
+        assert mock_db.execute.call_args[0][1] == {"process_id": 42}
+        mock_db.commit.assert_called_once()
+        mock_failed.assert_not_called()
+
+    @patch('app.utils.ai_agent.settings')
+    @patch('app.utils.ai_agent.OpenAI')
+    def test_job_extraction_process_failed(self, mock_openai, mock_settings):
+        """Test that an extraction error marks the process failed."""
+        mock_db = Mock()
+        mock_settings.openai_api_key = "test-key"
+        mock_settings.openai_project = None
+
+        agent = AiAgent(mock_db)
+
+        with patch.object(agent, 'job_extraction', side_effect=ValueError("Job description is empty")), \
+             patch.object(agent, '_mark_process_failed') as mock_failed:
+            agent.job_extraction_process(1, 42)
+
+        mock_failed.assert_called_once_with(mock_db, 42, "Job description is empty")
+
+
 class TestWriteCoverLetter:
     """Test suite for write_cover_letter method."""
 
@@ -129,6 +129,19 @@ class TestBase:
         assert hasattr(Base, 'metadata')
         assert Base.metadata is not None
 
+    def test_job_active_list_index(self):
+        """Test that the active job list index matches docs/schema.sql."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+        from app.models.models import Job
+
+        indexes = {index.name: index for index in Job.__table__.indexes}
+        ddl = str(CreateIndex(indexes['job_active_last_activity_idx']).compile(dialect=postgresql.dialect()))
+
+        assert "(last_activity DESC, date_applied DESC)" in ddl
+        assert "INCLUDE (company, job_title)" in ddl
+        assert "WHERE job_active = true" in ddl
+
 
 class TestGetDbDependency:
     """Test suite for get_db dependency."""
@@ -391,6 +404,35 @@ class TestGetDbUsagePattern:
             pass
 
 
+class TestGetConnectionDependency:
+    """Test suite for get_connection dependency."""
+
+    def test_get_connection_is_generator(self):
+        """Test that get_connection is a generator function."""
+        from app.core.database import get_connection
+        import inspect
+
+        assert inspect.isgeneratorfunction(get_connection)
+
+    @patch('app.core.database.engine')
+    def test_get_connection_streams_results(self, mock_engine):
+        """Test that get_connection yields a streaming connection and closes it."""
+        from app.core.database import get_connection
+
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.execution_options.return_value = mock_conn
+
+        generator = get_connection()
+        conn = next(generator)
+
+        assert conn is mock_conn.__enter__.return_value
+        mock_engine.connect.return_value.execution_options.assert_called_once_with(stream_results=True)
+
+        with pytest.raises(StopIteration):
+            next(generator)
+        mock_conn.__exit__.assert_called_once()
+
+
 class TestDatabaseErrorHandling:
     """Test suite for database error handling."""
 
@@ -328,3 +328,107 @@ class TestExportResumes:
             # Find the resume we just created
             test_resume = [r for r in rows if r['resume_id'] == '102']
             assert len(test_resume) == 1
+
+
+class TestWriteCsv:
+    """Test suite for the shared CSV writer used by all export endpoints."""
+
+    def test_write_csv_formats_values(self, temp_dir):
+        """Test that arrays are joined, None values become empty strings and all partitions are written."""
+        from app.api.export import _write_csv
+
+        file_path = temp_dir / "export.csv"
+        partitions = [
+            [(1, 'Company A', ['Python', 'React'], None)],
+            [(2, 'Company B', [], 'remote')],
+        ]
+
+        row_count = _write_csv(str(file_path), ['job_id', 'company', 'job_keyword', 'location'], partitions)
+
+        assert row_count == 2
+
+        with open(file_path, 'r', encoding='utf-8') as csvfile:
+            result = list(csv.DictReader(csvfile))
+
+        assert len(result) == 2
+        assert result[0]['job_keyword'] == 'Python, React'
+        assert result[0]['location'] == ''
+        assert result[1]['job_keyword'] == ''
+        assert result[1]['location'] == 'remote'
+
+
+class TestExportDate:
+    """Test suite for the cached export date stamp."""
+
+    def test_export_date_matches_today(self):
+        """Test that the export date is today's local date."""
+        from app.api.export import _export_date
+
+        assert _export_date() == datetime.now().strftime("%Y-%m-%d")
+
+    @patch('app.api.export.datetime')
+    def test_export_date_cached_within_day(self, mock_datetime):
+        """Test that the date is only reformatted once the day rolls over."""
+        from app.api import export
+
+        mock_datetime.now.return_value = datetime(2025, 1, 10, 23, 59, 0)
+        mock_datetime.combine.side_effect = datetime.combine
+        mock_datetime.min = datetime.min
+        export._export_date_cache[:] = ["", 0.0]
+
+        with patch('app.api.export.time.time', return_value=datetime(2025, 1, 10, 23, 59, 0).timestamp()):
+            assert export._export_date() == "2025-01-10"
+            assert export._export_date() == "2025-01-10"
+        assert mock_datetime.now.call_count == 1
+
+        mock_datetime.now.return_value = datetime(2025, 1, 11, 0, 0, 1)
+        with patch('app.api.export.time.time', return_value=datetime(2025, 1, 11, 0, 0, 1).timestamp()):
+            assert export._export_date() == "2025-01-11"
+        assert mock_datetime.now.call_count == 2
+
+        export._export_date_cache[:] = ["", 0.0]
+
+
+class TestExportQueryToCsv:
+    """Test suite for the shared query-to-CSV export helper."""
+
+    @pytest.fixture
+    def sqlite_conn(self):
+        """Provide an in-memory SQLite connection with a small table."""
+        from sqlalchemy import create_engine
+
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE item (item_id INTEGER, item_name TEXT)"))
+            yield conn
+        engine.dispose()
+
+    @patch('app.api.export.EXPORT_BATCH_SIZE', 2)
+    @patch('app.api.export.settings')
+    def test_export_query_to_csv_writes_all_batches(self, mock_settings, sqlite_conn, temp_dir):
+        """Test that every partition of the result ends up in the file."""
+        from app.api.export import _export_query_to_csv
+
+        mock_settings.export_dir = str(temp_dir)
+        sqlite_conn.execute(text("INSERT INTO item VALUES (1, 'a'), (2, 'b'), (3, NULL)"))
+
+        export_dir, filename, row_count = _export_query_to_csv(
+            sqlite_conn, text("SELECT * FROM item ORDER BY item_id"), "item_export"
+        )
+
+        assert export_dir == str(temp_dir)
+        assert filename.startswith('item_export-') and filename.endswith('.csv')
+        assert row_count == 3
+        with open(os.path.join(export_dir, filename), 'r', encoding='utf-8') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        assert [row['item_name'] for row in rows] == ['a', 'b', '']
+
+    @patch('app.api.export.settings')
+    def test_export_query_to_csv_no_rows(self, mock_settings, sqlite_conn, temp_dir):
+        """Test that an empty result returns None and writes no file."""
+        from app.api.export import _export_query_to_csv
+
+        mock_settings.export_dir = str(temp_dir)
+
+        assert _export_query_to_csv(sqlite_conn, text("SELECT * FROM item"), "item_export") is None
+        assert os.listdir(temp_dir) == []
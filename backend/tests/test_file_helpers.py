@@ -8,7 +8,8 @@ from app.utils.file_helpers import (
     get_personal_name,
     get_file_extension,
     get_mime_type,
-    create_standardized_download_file
+    create_standardized_download_file,
+    get_logo_info
 )
 
 
@@ -456,3 +457,31 @@ class TestCreateStandardizedDownloadFile:
             finally:
                 if os.path.exists(src_path):
                     os.unlink(src_path)
+
+
+class TestGetLogoInfo:
+    """Test suite for get_logo_info and invalidate_logo_cache functions."""
+
+    def test_get_logo_info_mime_type(self, temp_dir):
+        """Test that logo metadata includes size and mime type."""
+        logo_path = str(temp_dir / "acme.JPG")
+        Path(logo_path).write_bytes(b"jpeg data")
+
+        stat_result, mime_type = get_logo_info(logo_path)
+
+        assert stat_result.st_size == 9
+        assert mime_type == 'image/jpeg'
+
+    def test_get_logo_info_missing_file(self, temp_dir):
+        """Test that a missing logo returns None."""
+        assert get_logo_info(str(temp_dir / "missing.png")) is None
+
+    def test_get_logo_info_sees_overwritten_file(self, temp_dir):
+        """Test that a logo overwritten in place is reported with its new size."""
+        logo_path = str(temp_dir / "acme.png")
+        Path(logo_path).write_bytes(b"old")
+        get_logo_info(logo_path)
+
+        Path(logo_path).write_bytes(b"new logo")
+        stat_result, _ = get_logo_info(logo_path)
+        assert stat_result.st_size == 8
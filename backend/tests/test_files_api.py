@@ -247,3 +247,47 @@ class TestFileResponseMetadata:
 
         assert response.status_code == 200
         # The actual FileResponse would set content-type header to text/csv
+
+
+class TestConditionalDownload:
+    """Test suite for ETag / If-None-Match handling on file downloads."""
+
+    @patch('app.api.files.settings')
+    def test_logo_response_has_etag(self, mock_settings, client, test_db, temp_dir):
+        """Test that logo responses carry ETag and Cache-Control headers."""
+        logo_file = temp_dir / "acme.png"
+        logo_file.write_bytes(b"\x89PNG test")
+        mock_settings.logo_dir = str(temp_dir)
+
+        response = client.get("/v1/files/logos/acme.png")
+
+        assert response.status_code == 200
+        assert response.headers['etag']
+        assert response.headers['cache-control'] == "private, no-cache"
+
+    @patch('app.api.files.settings')
+    def test_logo_not_modified(self, mock_settings, client, test_db, temp_dir):
+        """Test that a matching If-None-Match returns 304 with no body."""
+        logo_file = temp_dir / "acme.png"
+        logo_file.write_bytes(b"\x89PNG test")
+        mock_settings.logo_dir = str(temp_dir)
+
+        etag = client.get("/v1/files/logos/acme.png").headers['etag']
+        response = client.get("/v1/files/logos/acme.png", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @patch('app.api.files.settings')
+    def test_export_modified_after_change(self, mock_settings, client, test_db, temp_dir):
+        """Test that a stale ETag gets the full file again."""
+        export_file = temp_dir / "job_export-2025-01-10.csv"
+        export_file.write_text("company\nTest Co")
+        mock_settings.export_dir = str(temp_dir)
+
+        etag = client.get("/v1/files/exports/job_export-2025-01-10.csv").headers['etag']
+        export_file.write_text("company\nTest Co\nOther Co")
+        response = client.get("/v1/files/exports/job_export-2025-01-10.csv", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
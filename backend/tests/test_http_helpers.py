@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import Mock
+from fastapi import Response
+from app.utils.http_helpers import etag_response, etag_matches
+
+
+def _request(if_none_match=None):
+    request = Mock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+    return request
+
+
+class TestEtagResponse:
+    """Test suite for etag_response function."""
+
+    def test_adds_etag_and_cache_control(self):
+        """Test that the response gets a quoted body-hash ETag."""
+        response = etag_response(_request(), Response(content=b'{"a":1}', media_type="application/json"))
+
+        assert response.status_code == 200
+        assert response.headers['etag'].startswith('"') and response.headers['etag'].endswith('"')
+        assert response.headers['cache-control'] == "no-cache"
+
+    def test_same_body_same_etag(self):
+        """Test that the ETag depends only on the body."""
+        first = etag_response(_request(), Response(content=b'{"a":1}'))
+        second = etag_response(_request(), Response(content=b'{"a":1}'))
+        other = etag_response(_request(), Response(content=b'{"a":2}'))
+
+        assert first.headers['etag'] == second.headers['etag']
+        assert first.headers['etag'] != other.headers['etag']
+
+    def test_matching_if_none_match_returns_304(self):
+        """Test that a matching If-None-Match yields an empty 304."""
+        etag = etag_response(_request(), Response(content=b'{"a":1}')).headers['etag']
+
+        response = etag_response(_request(etag), Response(content=b'{"a":1}'))
+
+        assert response.status_code == 304
+        assert response.body == b''
+        assert response.headers['etag'] == etag
+
+    def test_custom_cache_control(self):
+        """Test that the Cache-Control value can be overridden."""
+        response = etag_response(_request(), Response(content=b'{}'), cache_control="private, max-age=60")
+
+        assert response.headers['cache-control'] == "private, max-age=60"
+
+
+class TestEtagMatches:
+    """Test suite for etag_matches function."""
+
+    def test_exact_match(self):
+        """Test that a single identical tag matches."""
+        assert etag_matches(_request('"abc"'), '"abc"')
+        assert not etag_matches(_request('"abd"'), '"abc"')
+        assert not etag_matches(_request(), '"abc"')
+
+    def test_tag_list(self):
+        """Test that any tag in a comma-separated list matches."""
+        assert etag_matches(_request('"x", "abc" ,"y"'), '"abc"')
+        assert not etag_matches(_request('"x", "y"'), '"abc"')
+
+    def test_wildcard(self):
+        """Test that * matches any current representation."""
+        assert etag_matches(_request('*'), '"abc"')
+
+    def test_weak_comparison(self):
+        """Test that the W/ prefix is ignored on either side."""
+        assert etag_matches(_request('W/"abc"'), '"abc"')
+        assert etag_matches(_request('"abc"'), 'W/"abc"')
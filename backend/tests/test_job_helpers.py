@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import Mock, patch
+from app.utils.job_helpers import (
+    update_job_activity,
+    calc_avg_score,
+    is_missing_job_error
+)
+
+
+class TestUpdateJobActivity:
+    """Test suite for update_job_activity function."""
+
+    def test_update_job_activity_commits(self):
+        """Test that the update is committed by default."""
+        mock_db = Mock()
+
+        update_job_activity(mock_db, 1)
+
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    def test_update_job_activity_in_caller_transaction(self):
+        """Test that commit=False leaves the transaction to the caller."""
+        mock_db = Mock()
+
+        update_job_activity(mock_db, 1, commit=False)
+
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_not_called()
+
+
+class TestCalcAvgScore:
+    """Test suite for calc_avg_score function."""
+
+    def test_calc_avg_score_commits(self):
+        """Test that the update is committed by default."""
+        mock_db = Mock()
+
+        calc_avg_score(mock_db, 1)
+
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    def test_calc_avg_score_in_caller_transaction(self):
+        """Test that commit=False leaves the transaction open."""
+        mock_db = Mock()
+
+        calc_avg_score(mock_db, 1, commit=False)
+
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_not_called()
+
+
+class TestIsMissingJobError:
+    """Test suite for is_missing_job_error function."""
+
+    @staticmethod
+    def _error(pgcode, constraint_name):
+        from sqlalchemy.exc import IntegrityError
+        return IntegrityError("INSERT", {}, Mock(pgcode=pgcode, diag=Mock(constraint_name=constraint_name)))
+
+    def test_job_foreign_key_violation(self):
+        """Test that a job_id foreign key violation is a missing job."""
+        assert is_missing_job_error(self._error("23503", "note_job_id_fkey"))
+
+    def test_other_violations(self):
+        """Test that other constraint violations are not a missing job."""
+        assert not is_missing_job_error(self._error("23502", None))
+        assert not is_missing_job_error(self._error("23503", "resume_baseline_resume_id_fkey"))
+        assert not is_missing_job_error(self._error("23505", "job_detail_pkey"))
+
+    def test_non_postgres_error(self):
+        """Test that an error without a SQLSTATE is not a missing job."""
+        from sqlalchemy.exc import IntegrityError
+        assert not is_missing_job_error(IntegrityError("INSERT", {}, Exception("fk")))
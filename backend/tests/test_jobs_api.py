@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import Mock, patch
 from sqlalchemy import text
@@ -40,6 +41,29 @@ class TestGetAllJobs:
         assert 'start_date' in jobs[0]
         assert 'start_time' in jobs[0]
 
+    def test_get_all_jobs_include_detail(self, client, test_db):
+        """Test that job_detail fields are only returned when requested."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory, average_score, interest_level)
+            VALUES (1, 'Detail Co', 'Engineer', 'applied', true, 'detail_co_engineer', 5, 5)
+        """))
+        test_db.execute(text("""
+            INSERT INTO job_detail (job_id, job_desc, job_qualification, job_keyword)
+            VALUES (1, 'Build things', 'BS required', ARRAY['Python', 'SQL'])
+        """))
+        test_db.commit()
+
+        response = client.get("/v1/jobs")
+        assert response.status_code == 200
+        assert 'job_desc' not in response.json()[0]
+
+        response = client.get("/v1/jobs?include_detail=true")
+        assert response.status_code == 200
+        job = response.json()[0]
+        assert job['job_desc'] == 'Build things'
+        assert job['job_qualification'] == 'BS required'
+        assert job['job_keyword'] == ['Python', 'SQL']
+
     def test_get_all_jobs_excludes_inactive(self, client, test_db):
         """Test that inactive jobs are not returned."""
         # Create active and inactive jobs
@@ -96,6 +120,86 @@ class TestGetAllJobs:
         assert job_no_appt['start_time'] is None
 
 
+class TestStreamJobs:
+    """Test suite for the job list streaming helper."""
+
+    @pytest.fixture
+    def sqlite_engine(self, tmp_path):
+        """Provide a pooled SQLite engine with a minimal job table."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import QueuePool
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", poolclass=QueuePool)
+        with engine.begin() as conn:
+            conn.execute(text("""
+                CREATE TABLE job (job_id INTEGER, company TEXT, job_title TEXT,
+                                  job_status TEXT, job_created TIMESTAMP)
+            """))
+        yield engine
+        engine.dispose()
+
+    def _stream(self, engine, query="SELECT * FROM job ORDER BY job_id"):
+        from app.api.jobs import _stream_jobs
+
+        return b"".join(_stream_jobs(engine, text(query)))
+
+    @patch('app.api.jobs.JOB_STREAM_BATCH_SIZE', 2)
+    def test_stream_jobs_joins_partitions(self, sqlite_engine):
+        """Test that partitions are joined into a single JSON array."""
+        with sqlite_engine.begin() as conn:
+            conn.execute(text("""
+                INSERT INTO job VALUES
+                    (1, 'A', 'Dev', 'applied', '2025-01-01 09:00:00'),
+                    (2, 'B', 'Dev', 'applied', '2025-01-02 09:00:00'),
+                    (3, 'C', 'Dev', 'rejected', '2025-01-03 09:00:00')
+            """))
+
+        jobs = json.loads(self._stream(sqlite_engine))
+
+        assert [job['job_id'] for job in jobs] == [1, 2, 3]
+        assert jobs[2]['job_status'] == 'rejected'
+        assert jobs[0]['job_created'] == '2025-01-01T09:00:00'
+        # Columns that were not selected are left out, as with response_model_exclude_unset
+        assert 'job_desc' not in jobs[0]
+
+    def test_stream_jobs_empty(self, sqlite_engine):
+        """Test that an empty result streams an empty array."""
+        assert json.loads(self._stream(sqlite_engine)) == []
+
+    def test_stream_jobs_releases_connection(self, sqlite_engine):
+        """Test that the stream returns its connection once the body is sent."""
+        self._stream(sqlite_engine)
+
+        assert sqlite_engine.pool.checkedout() == 0
+
+    def test_stream_jobs_error_aborts(self, sqlite_engine):
+        """Test that a database error is raised rather than ending the body cleanly."""
+        from sqlalchemy.exc import OperationalError
+
+        with pytest.raises(OperationalError):
+            self._stream(sqlite_engine, "SELECT * FROM missing_table")
+
+        assert sqlite_engine.pool.checkedout() == 0
+
+
+class TestJsonDefault:
+    """Test suite for the orjson fallback serializer."""
+
+    def test_json_default_decimal(self):
+        """Test that numeric columns serialize as floats."""
+        from decimal import Decimal
+        from app.api.jobs import _json_default
+
+        assert _json_default(Decimal('4.500')) == 4.5
+
+    def test_json_default_unsupported(self):
+        """Test that unknown types still raise TypeError."""
+        from app.api.jobs import _json_default
+
+        with pytest.raises(TypeError):
+            _json_default(object())
+
+
 class TestDeleteJob:
     """Test suite for DELETE /v1/job/{job_id} endpoint."""
 
@@ -124,6 +228,21 @@ class TestDeleteJob:
         assert response.status_code == 404
         assert "Job not found" in response.json()['detail']
 
+    def test_delete_job_unknown_id_single_statement(self):
+        """Test that an unknown id is reported from the UPDATE ... RETURNING alone."""
+        from fastapi import HTTPException
+        from app.api.jobs import delete_job
+
+        mock_db = Mock()
+        mock_db.execute.return_value.first.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            delete_job(999, mock_db)
+
+        assert exc_info.value.status_code == 404
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_not_called()
+
 
 class TestGetJobList:
     """Test suite for GET /v1/job/list endpoint."""
@@ -176,6 +295,27 @@ class TestGetJobList:
         assert len(jobs) == 1
         assert jobs[0]['company'] == 'Active Corp'
 
+    def test_get_job_list_not_modified(self, client, test_db):
+        """Test that a matching If-None-Match returns 304 until the list changes."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Apple', 'iOS Developer', 'applied', true, 'apple_ios_developer')
+        """))
+        test_db.commit()
+
+        response = client.get("/v1/job/list")
+        etag = response.headers['etag']
+        assert response.headers['cache-control'] == 'no-cache'
+
+        response = client.get("/v1/job/list", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b''
+
+        client.delete("/v1/job/1")
+        response = client.get("/v1/job/list", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == []
+
 
 class TestGetJob:
     """Test suite for GET /v1/job/{job_id} endpoint."""
@@ -232,6 +372,25 @@ class TestGetJob:
 
         assert response.status_code == 404
 
+    def test_get_job_not_modified(self, client, test_db):
+        """Test that a matching If-None-Match returns 304."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Tesla', 'Software Engineer', 'applied', true, 'tesla_software_engineer')
+        """))
+        test_db.commit()
+
+        response = client.get("/v1/job/1")
+        assert response.status_code == 200
+        etag = response.headers['etag']
+
+        response = client.get("/v1/job/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = client.get("/v1/job/1", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.headers['etag'] == etag
+
 
 class TestCreateOrUpdateJob:
     """Test suite for POST /v1/job endpoint."""
@@ -305,6 +464,23 @@ class TestCreateOrUpdateJob:
         assert job.job_status == "interviewing"
         assert job.interest_level == 10
 
+    @patch('app.api.jobs.calc_avg_score')
+    def test_update_job_skips_avg_score_without_interest_level(self, mock_calc_avg, client, test_db):
+        """Test that the average score is only recalculated when interest_level changes."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Score Co', 'Engineer', 'applied', true, 'score_co_engineer')
+        """))
+        test_db.commit()
+
+        response = client.post("/v1/job", json={"job_id": 1, "job_status": "interviewing"})
+        assert response.status_code == 200
+        mock_calc_avg.assert_not_called()
+
+        response = client.post("/v1/job", json={"job_id": 1, "interest_level": 7})
+        assert response.status_code == 200
+        mock_calc_avg.assert_called_once()
+
     def test_create_job_missing_required_fields(self, client, test_db):
         """Test creating job with missing required fields."""
         job_data = {
@@ -392,6 +568,56 @@ class TestExtractJobData:
         assert "Job not found" in response.json()['detail']
 
 
+class TestExtractJobDataProcess:
+    """Test suite for POST /v1/job/extract/process endpoint."""
+
+    @patch('app.api.jobs.threading.Thread')
+    def test_extract_process_started(self, mock_thread, client, test_db):
+        """Test that extraction is started in the background with a process_id."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Airbnb', 'Backend Engineer', 'applied', true, 'airbnb_backend_engineer')
+        """))
+        test_db.execute(text("""
+            INSERT INTO job_detail (job_id, job_desc)
+            VALUES (1, 'We are looking for a backend engineer with Python and AWS experience.')
+        """))
+        test_db.commit()
+
+        response = client.post("/v1/job/extract/process", json={"job_id": 1})
+
+        assert response.status_code == 202
+        assert response.json()['process_id'] > 0
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch('app.api.jobs.threading.Thread')
+    def test_extract_process_cached(self, mock_thread, client, test_db):
+        """Test that already extracted jobs complete without a background thread."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Cached Co', 'Engineer', 'applied', true, 'cached_co_engineer')
+        """))
+        test_db.execute(text("""
+            INSERT INTO job_detail (job_id, job_desc, job_qualification, job_keyword)
+            VALUES (1, 'Description', 'Cached qualification', ARRAY['Cached', 'Keywords'])
+        """))
+        test_db.commit()
+
+        response = client.post("/v1/job/extract/process", json={"job_id": 1})
+
+        assert response.status_code == 202
+        mock_thread.assert_not_called()
+
+        poll = client.get(f"/v1/poll/{response.json()['process_id']}")
+        assert poll.json()['process_state'] == 'complete'
+
+    def test_extract_process_job_not_found(self, client, test_db):
+        """Test extraction process with non-existent job."""
+        response = client.post("/v1/job/extract/process", json={"job_id": 999})
+
+        assert response.status_code == 404
+
+
 class TestCreateOrUpdateJobDetail:
     """Test suite for POST /v1/job/detail endpoint."""
 
@@ -465,3 +691,77 @@ class TestCreateOrUpdateJobDetail:
 
         assert response.status_code == 404
         assert "Job not found" in response.json()['detail']
+
+    def test_upsert_job_detail_keeps_one_row(self, client, test_db):
+        """Test that saving twice updates the row the first save inserted."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Upsert Co', 'Engineer', 'applied', true, 'upsert_co_engineer')
+        """))
+        test_db.commit()
+
+        response = client.post("/v1/job/detail", json={
+            "job_id": 1, "job_desc": "First description", "job_qualification": "Degree"
+        })
+        assert response.status_code == 200
+
+        response = client.post("/v1/job/detail", json={"job_id": 1, "job_desc": "Second description"})
+        assert response.status_code == 200
+
+        rows = test_db.execute(text("SELECT job_desc, job_qualification FROM job_detail WHERE job_id = 1")).all()
+        assert len(rows) == 1
+        assert rows[0].job_desc == "Second description"
+        # Fields left out of the second request are not overwritten
+        assert rows[0].job_qualification == "Degree"
+
+    def test_upsert_job_detail_single_statement(self):
+        """Test that the save is one INSERT ... ON CONFLICT updating only the given fields."""
+        from sqlalchemy.dialects import postgresql
+        from app.api.jobs import create_or_update_job_detail
+        from app.schemas.job import JobDetailCreate
+
+        mock_db = Mock()
+
+        result = create_or_update_job_detail(JobDetailCreate(job_id=1, job_desc="Description"), mock_db)
+
+        assert result == {"status": "success", "job_id": 1}
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+        sql = str(mock_db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO job_detail")
+        assert "ON CONFLICT (job_id) DO UPDATE SET job_desc = excluded.job_desc" in sql
+        assert "job_qualification = " not in sql
+
+    def test_create_job_detail_missing_job_maps_to_404(self):
+        """Test that the job foreign key violation is reported as 404."""
+        from fastapi import HTTPException
+        from sqlalchemy.exc import IntegrityError
+        from app.api.jobs import create_or_update_job_detail
+        from app.schemas.job import JobDetailCreate
+
+        mock_db = Mock()
+        orig = Mock(pgcode="23503", diag=Mock(constraint_name="job_detail_job_id_fkey"))
+        mock_db.execute.side_effect = IntegrityError("INSERT", {}, orig)
+
+        with pytest.raises(HTTPException) as exc_info:
+            create_or_update_job_detail(JobDetailCreate(job_id=999, job_desc="Description"), mock_db)
+
+        assert exc_info.value.status_code == 404
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
+
+    def test_create_job_detail_other_integrity_error_reraised(self):
+        """Test that integrity errors other than the job foreign key are not reported as 404."""
+        from sqlalchemy.exc import IntegrityError
+        from app.api.jobs import create_or_update_job_detail
+        from app.schemas.job import JobDetailCreate
+
+        mock_db = Mock()
+        orig = Mock(pgcode="23514", diag=Mock(constraint_name="job_detail_check"))
+        mock_db.execute.side_effect = IntegrityError("INSERT", {}, orig)
+
+        with pytest.raises(IntegrityError):
+            create_or_update_job_detail(JobDetailCreate(job_id=1, job_desc="Description"), mock_db)
+
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
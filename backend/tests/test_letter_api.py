@@ -1,6 +1,7 @@
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
 from sqlalchemy import text
+from datetime import date
 
 
 class TestGetLetter:
@@ -35,6 +36,37 @@ class TestGetLetter:
         assert data['instruction'] == 'Focus on technical skills'
         assert data['file_name'] == 'cover.docx'
 
+    def test_get_letter_not_modified(self, client, test_db):
+        """Test that a matching If-None-Match returns 304."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory, average_score)
+            VALUES (1, 'Tech Corp', 'Engineer', 'applied', true, 'tech_corp_engineer', 0.0)
+        """))
+        test_db.execute(text("""
+            INSERT INTO resume (resume_id, resume_title, file_name, original_format, is_baseline, is_default, is_active)
+            VALUES (1, 'Main Resume', 'resume.pdf', 'pdf', true, true, true)
+        """))
+        test_db.execute(text("""
+            INSERT INTO cover_letter (cover_id, resume_id, job_id, letter_length, letter_tone, instruction, letter_content, file_name)
+            VALUES (1, 1, 1, 'medium', 'professional', 'Focus on technical skills', '<p>Dear Hiring Manager,</p>', 'cover.docx')
+        """))
+        test_db.commit()
+
+        response = client.get("/v1/letter?cover_id=1")
+        assert response.status_code == 200
+        etag = response.headers['etag']
+
+        response = client.get("/v1/letter?cover_id=1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        # Editing the letter changes the ETag
+        test_db.execute(text("UPDATE cover_letter SET letter_content = '<p>Edited</p>' WHERE cover_id = 1"))
+        test_db.commit()
+
+        response = client.get("/v1/letter?cover_id=1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+
     def test_get_letter_not_found(self, client, test_db):
         """Test getting non-existent cover letter."""
         response = client.get("/v1/letter?cover_id=999")
@@ -107,6 +139,41 @@ class TestGetLetterList:
         assert all('company' in letter for letter in letters)
         assert all('job_title' in letter for letter in letters)
 
+    def test_get_letter_list_keyset_pagination(self, client, test_db):
+        """Test paging through letters with limit and before."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory, average_score)
+            VALUES (1, 'Test Co', 'Engineer', 'applied', true, 'test_co_engineer', 0.0)
+        """))
+        test_db.execute(text("""
+            INSERT INTO resume (resume_id, resume_title, file_name, original_format, is_baseline, is_default, is_active)
+            VALUES (1, 'Resume', 'resume.pdf', 'pdf', true, true, true)
+        """))
+        test_db.execute(text("""
+            INSERT INTO cover_letter (cover_id, resume_id, job_id, letter_length, letter_tone, instruction, letter_content, letter_active, letter_created)
+            VALUES
+                (1, 1, 1, 'medium', 'professional', '', '', true, '2024-01-01 09:00:00'),
+                (2, 1, 1, 'medium', 'professional', '', '', true, '2024-01-02 09:00:00'),
+                (3, 1, 1, 'medium', 'professional', '', '', true, '2024-01-02 09:00:00'),
+                (4, 1, 1, 'medium', 'professional', '', '', true, '2024-01-03 09:00:00')
+        """))
+        test_db.commit()
+
+        response = client.get("/v1/letter/list?limit=2")
+
+        assert response.status_code == 200
+        first_page = response.json()
+        assert [letter['cover_id'] for letter in first_page] == [4, 3]
+
+        # Letter 2 shares letter_created with the last letter of the first page
+        last = first_page[-1]
+        response = client.get("/v1/letter/list", params={
+            "limit": 2, "before": last['letter_created'], "before_id": last['cover_id']
+        })
+
+        assert response.status_code == 200
+        assert [letter['cover_id'] for letter in response.json()] == [2, 1]
+
     def test_get_letter_list_excludes_inactive(self, client, test_db):
         """Test that inactive letters are excluded from list."""
         # Create test data
@@ -174,11 +241,12 @@ class TestSaveLetter:
         assert letter.letter_length == 'medium'
         assert letter.letter_tone == 'professional'
 
-        # Verify job was updated with cover_id
-        job = test_db.execute(text("SELECT cover_id FROM job WHERE job_id = 1")).first()
+        # Verify job was updated with cover_id and activity in the same statement
+        job = test_db.execute(text("SELECT cover_id, last_activity FROM job WHERE job_id = 1")).first()
         assert job.cover_id == data['cover_id']
+        assert job.last_activity == date.today()
 
-        mock_update_activity.assert_called_once_with(test_db, 1)
+        mock_update_activity.assert_not_called()
 
     @patch('app.api.letter.update_job_activity')
     def test_update_letter_success(self, mock_update_activity, client, test_db):
@@ -231,8 +299,8 @@ class TestSaveLetter:
 
         response = client.post("/v1/letter", json=letter_data)
 
-        assert response.status_code == 400
-        assert "letter_length must be one of" in response.json()['detail']
+        assert response.status_code == 422
+        assert response.json()['detail'][0]['loc'] == ['body', 'letter_length']
 
     def test_create_letter_invalid_tone(self, client, test_db):
         """Test creating letter with invalid letter_tone."""
@@ -245,8 +313,8 @@ class TestSaveLetter:
 
         response = client.post("/v1/letter", json=letter_data)
 
-        assert response.status_code == 400
-        assert "letter_tone must be one of" in response.json()['detail']
+        assert response.status_code == 422
+        assert response.json()['detail'][0]['loc'] == ['body', 'letter_tone']
 
 
 class TestDeleteLetter:
@@ -392,10 +460,17 @@ class TestWriteCoverLetter:
         assert "AI processing error" in response.json()['detail']
 
 
+def _mock_pandoc_process(returncode=0, stderr=b''):
+    """Build a mock asyncio pandoc subprocess."""
+    proc = MagicMock(returncode=returncode)
+    proc.communicate = AsyncMock(return_value=(b'', stderr))
+    return proc
+
+
 class TestConvertCoverLetter:
     """Test suite for POST /v1/letter/convert endpoint."""
 
-    @patch('app.api.letter.subprocess.run')
+    @patch('app.api.letter.asyncio.create_subprocess_exec')
     @patch('app.api.letter.os.makedirs')
     @patch('app.api.letter.settings')
     def test_convert_cover_letter_success(self, mock_settings, mock_makedirs, mock_subprocess, client, test_db):
@@ -418,7 +493,7 @@ class TestConvertCoverLetter:
         test_db.commit()
 
         # Mock successful pandoc conversion
-        mock_subprocess.return_value = MagicMock(returncode=0)
+        mock_subprocess.return_value = _mock_pandoc_process()
 
         response = client.post("/v1/letter/convert", json={
             "cover_id": 1,
@@ -430,8 +505,10 @@ class TestConvertCoverLetter:
         assert 'file_name' in data
         assert data['file_name'] == 'tech_corp-software_engineer.docx'
 
-        # Verify pandoc was called
+        # Verify pandoc was called with the HTML on stdin
         mock_subprocess.assert_called_once()
+        assert mock_subprocess.call_args[0][:5] == ('pandoc', '-f', 'html', '-t', 'docx')
+        mock_subprocess.return_value.communicate.assert_awaited_once_with(b'<p>Cover letter HTML content</p>')
 
         # Verify database was updated
         letter = test_db.execute(text("SELECT file_name FROM cover_letter WHERE cover_id = 1")).first()
@@ -489,7 +566,7 @@ class TestConvertCoverLetter:
         assert response.status_code == 400
         assert "Cover letter content is empty" in response.json()['detail']
 
-    @patch('app.api.letter.subprocess.run')
+    @patch('app.api.letter.asyncio.create_subprocess_exec')
     @patch('app.api.letter.os.makedirs')
     @patch('app.api.letter.settings')
     def test_convert_cover_letter_filename_sanitization(self, mock_settings, mock_makedirs, mock_subprocess, client, test_db):
@@ -511,7 +588,7 @@ class TestConvertCoverLetter:
         """))
         test_db.commit()
 
-        mock_subprocess.return_value = MagicMock(returncode=0)
+        mock_subprocess.return_value = _mock_pandoc_process()
 
         response = client.post("/v1/letter/convert", json={
             "cover_id": 1,
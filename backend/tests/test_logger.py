@@ -464,3 +464,52 @@ class TestAPILoggerEdgeCases:
         logger._logger.info.assert_called_once()
         call_args = logger._logger.info.call_args[0][0]
         assert "你好世界" in call_args or "Test message" in call_args
+
+
+class TestAPILoggerLevelGuard:
+    """Test suite for skipping message formatting below the log level."""
+
+    def setup_mock_logger(self, enabled):
+        """Helper to setup a mock logger with a fixed isEnabledFor result."""
+        logger = APILogger()
+        logger._logger = Mock()
+        logger._logger.isEnabledFor.return_value = enabled
+        return logger
+
+    def test_disabled_level_skips_formatting(self):
+        """Test that disabled levels neither format nor emit the message."""
+        logger = self.setup_mock_logger(enabled=False)
+
+        with patch.object(logger, '_format_message') as mock_format:
+            logger.debug("Hot path message", count=1000)
+            mock_format.assert_not_called()
+
+        logger._logger.debug.assert_not_called()
+
+    def test_disabled_level_skips_database_operation(self):
+        """Test that database operation logging is skipped when debug is off."""
+        logger = self.setup_mock_logger(enabled=False)
+
+        logger.log_database_operation("SELECT", "jobs")
+
+        logger._logger.debug.assert_not_called()
+
+    def test_enabled_level_emits(self):
+        """Test that enabled levels emit the formatted message."""
+        logger = self.setup_mock_logger(enabled=True)
+
+        logger.info("Test message", user_id=1)
+
+        logger._logger.isEnabledFor.assert_called_with(logging.INFO)
+        assert logger._logger.info.call_args[0][0] == "Test message | user_id=1"
+
+
+class TestAPILoggerQueueHandler:
+    """Test suite for the background log writer."""
+
+    def test_logger_uses_queue_handler(self):
+        """Test that records are handed to a QueueHandler instead of written inline."""
+        logger = logging.getLogger('job_tracker_api')
+
+        assert any(isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers)
+        assert not any(isinstance(handler, logging.handlers.RotatingFileHandler) for handler in logger.handlers)
@@ -30,6 +30,13 @@ class TestMainApp:
         # Check that exception handlers are configured
         assert len(client.app.exception_handlers) > 0
 
+    def test_app_uses_orjson_responses(self, client):
+        """Test that routes default to ORJSONResponse."""
+        from fastapi.responses import ORJSONResponse
+
+        routes = {route.path: route for route in client.app.routes}
+        assert routes["/v1/jobs"].response_class is ORJSONResponse
+
 
 class TestRootEndpoint:
     """Test suite for root endpoint."""
@@ -1,6 +1,8 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import patch, Mock, MagicMock
+from fastapi import HTTPException
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
 
 class TestGetNotes:
@@ -123,6 +125,56 @@ class TestGetNotes:
         assert notes[1]['note_title'] == 'Middle'
         assert notes[2]['note_title'] == 'Oldest'
 
+    def test_get_notes_keyset_pagination(self, client, test_db):
+        """Test paging through notes with limit and before."""
+        test_db.execute(text("""
+            INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
+            VALUES (1, 'Test Co', 'Engineer', 'applied', true, 'test_co_engineer')
+        """))
+        test_db.execute(text("""
+            INSERT INTO note (note_id, job_id, note_title, note_active, note_created)
+            VALUES
+                (1, 1, 'First', true, '2025-01-10 10:00:00'),
+                (2, 1, 'Second', true, '2025-01-15 10:00:00'),
+                (3, 1, 'Third', true, '2025-01-15 10:00:00'),
+                (4, 1, 'Fourth', true, '2025-01-20 10:00:00')
+        """))
+        test_db.commit()
+
+        response = client.get("/v1/notes?limit=2")
+
+        assert response.status_code == 200
+        first_page = response.json()
+        assert [note['note_id'] for note in first_page] == [4, 3]
+
+        # Note 2 shares note_created with the last note of the first page
+        last = first_page[-1]
+        response = client.get("/v1/notes", params={
+            "limit": 2, "before": last['note_created'], "before_id": last['note_id']
+        })
+
+        assert response.status_code == 200
+        assert [note['note_id'] for note in response.json()] == [2, 1]
+
+    def test_get_notes_single_statement(self):
+        """Test that filters and the keyset cursor are bound into one statement."""
+        from datetime import datetime
+        from app.api.notes import get_notes, _GET_NOTES_SQL
+
+        mock_db = Mock()
+        mock_db.execute.return_value = []
+
+        get_notes(job_id=1, limit=2, before=datetime(2025, 1, 15, 10, 0), before_id=3, db=mock_db)
+        get_notes(job_id=None, limit=None, before=None, before_id=None, db=mock_db)
+
+        assert [call.args[0] for call in mock_db.execute.call_args_list] == [_GET_NOTES_SQL, _GET_NOTES_SQL]
+        assert mock_db.execute.call_args_list[0].args[1] == {
+            "job_id": 1, "limit": 2, "before": datetime(2025, 1, 15, 10, 0), "before_id": 3
+        }
+        assert mock_db.execute.call_args_list[1].args[1] == {
+            "job_id": None, "limit": None, "before": None, "before_id": None
+        }
+
 
 class TestCreateOrUpdateNote:
     """Test suite for POST /v1/note and POST /v1/notes endpoints."""
@@ -157,7 +209,7 @@ class TestCreateOrUpdateNote:
         assert note.note_content == "They asked about Python experience"
         assert note.note_active == True
 
-        mock_update_activity.assert_called_once_with(test_db, 1)
+        mock_update_activity.assert_called_once_with(test_db, 1, commit=False)
 
     @patch('app.api.notes.update_job_activity')
     def test_create_note_plural_route(self, mock_update_activity, client, test_db):
@@ -255,7 +307,7 @@ class TestCreateOrUpdateNote:
         assert note.note_title == "Updated Title"
         assert note.note_content == "Updated content"
 
-        mock_update_activity.assert_called_once_with(test_db, 1)
+        mock_update_activity.assert_called_once_with(test_db, 1, commit=False)
 
     @patch('app.api.notes.update_job_activity')
     def test_update_note_partial_fields(self, mock_update_activity, client, test_db):
@@ -324,8 +376,8 @@ class TestCreateOrUpdateNote:
         assert note.note_content is None
 
     @patch('app.api.notes.update_job_activity')
-    def test_update_job_activity_failure_doesnt_break_note_creation(self, mock_update_activity, client, test_db):
-        """Test that note creation succeeds even if update_job_activity fails."""
+    def test_update_job_activity_failure_rolls_back_note(self, mock_update_activity, client, test_db):
+        """Test that the note is not saved if the job activity update fails."""
         # Create test job
         test_db.execute(text("""
             INSERT INTO job (job_id, company, job_title, job_status, job_active, job_directory)
@@ -344,11 +396,96 @@ class TestCreateOrUpdateNote:
 
         response = client.post("/v1/note", json=note_data)
 
-        # Note should still be created successfully
-        assert response.status_code == 200
-        data = response.json()
-        assert data['status'] == 'success'
-        assert 'note_id' in data
+        # The note and the activity update share one transaction
+        assert response.status_code == 500
+        assert "Activity update failed" in response.json()['detail']
+        test_db.rollback()
+        count = test_db.execute(text("SELECT count(*) FROM note WHERE job_id = 1")).scalar()
+        assert count == 0
+
+
+class TestCreateOrUpdateNoteQueries:
+    """Test suite for the queries issued by _create_or_update_note."""
+
+    @patch('app.api.notes.update_job_activity')
+    def test_create_note_skips_job_lookup(self, mock_update_activity):
+        """Test that the job is verified by the foreign key, not a SELECT."""
+        from app.api.notes import _create_or_update_note
+        from app.schemas.note import NoteUpdate
+
+        mock_db = MagicMock()
+
+        _create_or_update_note(NoteUpdate(job_id=1, note_title="Title"), mock_db)
+
+        mock_db.query.assert_not_called()
+        # A single INSERT ... RETURNING, with no refresh afterwards
+        mock_db.execute.assert_called_once()
+        mock_db.refresh.assert_not_called()
+        mock_db.commit.assert_called_once()
+
+    @patch('app.api.notes.update_job_activity')
+    def test_update_note_single_statement(self, mock_update_activity):
+        """Test that an update is one UPDATE ... RETURNING with no preliminary SELECT."""
+        from app.api.notes import _create_or_update_note
+        from app.schemas.note import NoteUpdate
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.first.return_value = MagicMock(note_id=1, job_id=1)
+
+        result = _create_or_update_note(NoteUpdate(note_id=1, note_content="New"), mock_db)
+
+        assert result == {"status": "success", "note_id": 1}
+        mock_db.get.assert_not_called()
+        mock_db.execute.assert_called_once()
+        assert "RETURNING" in str(mock_db.execute.call_args[0][0])
+        mock_db.refresh.assert_not_called()
+
+    def test_update_note_missing_returns_404(self):
+        """Test that an UPDATE matching no row is reported as a missing note."""
+        from app.api.notes import _create_or_update_note
+        from app.schemas.note import NoteUpdate
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.first.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            _create_or_update_note(NoteUpdate(note_id=999, note_content="New"), mock_db)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Note not found"
+        mock_db.commit.assert_not_called()
+
+    def test_create_note_missing_job_from_foreign_key(self):
+        """Test that a foreign key violation is reported as a missing job."""
+        from app.api.notes import _create_or_update_note
+        from app.schemas.note import NoteUpdate
+
+        mock_db = MagicMock()
+        orig = Mock(pgcode="23503", diag=Mock(constraint_name="note_job_id_fkey"))
+        mock_db.execute.side_effect = IntegrityError("INSERT", {}, orig)
+
+        with pytest.raises(HTTPException) as exc_info:
+            _create_or_update_note(NoteUpdate(job_id=999, note_title="Title"), mock_db)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Job not found"
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
+
+    def test_create_note_other_integrity_error_reraised(self):
+        """Test that integrity errors other than the job foreign key are not reported as 404."""
+        from app.api.notes import _create_or_update_note
+        from app.schemas.note import NoteUpdate
+
+        mock_db = MagicMock()
+        orig = Mock(pgcode="23502", diag=Mock(constraint_name=None))
+        mock_db.execute.side_effect = IntegrityError("INSERT", {}, orig)
+
+        with pytest.raises(IntegrityError):
+            _create_or_update_note(NoteUpdate(job_id=1, note_title="Title"), mock_db)
+
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
 
 
 class TestDeleteNote:
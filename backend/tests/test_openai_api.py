@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from app.api import openai_api
+from app.api.openai_api import get_llm_models, invalidate_models_cache
+
+
+class TestGetLlmModels:
+    """Test suite for GET /v1/openai/llm model list caching."""
+
+    def setup_method(self):
+        invalidate_models_cache()
+
+    def teardown_method(self):
+        invalidate_models_cache()
+
+    def test_models_cached_between_requests(self):
+        """Test that the upstream list is fetched once per TTL window."""
+        with patch.object(openai_api, '_fetch_llm_models', new=AsyncMock(return_value=['gpt-b', 'gpt-a'])) as mock_fetch:
+            assert asyncio.run(get_llm_models()) == ['gpt-b', 'gpt-a']
+            assert asyncio.run(get_llm_models()) == ['gpt-b', 'gpt-a']
+
+        mock_fetch.assert_awaited_once()
+
+    def test_concurrent_misses_share_one_fetch(self):
+        """Test that concurrent cache misses wait for a single upstream call."""
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return ['gpt-a']
+
+        async def run_concurrently():
+            return await asyncio.gather(*(get_llm_models() for _ in range(5)))
+
+        with patch.object(openai_api, '_fetch_llm_models', new=AsyncMock(side_effect=slow_fetch)) as mock_fetch:
+            results = asyncio.run(run_concurrently())
+
+        assert results == [['gpt-a']] * 5
+        assert mock_fetch.await_count == 1
+
+    def test_expired_cache_served_while_revalidating(self):
+        """Test that an expired list is returned at once and refreshed in the background."""
+        async def expire_and_fetch():
+            first = await get_llm_models()
+            with patch('app.api.openai_api.time.monotonic', return_value=float('inf')):
+                stale = await get_llm_models()
+                await openai_api._refresh_task
+            return first, stale, await get_llm_models()
+
+        with patch.object(openai_api, '_fetch_llm_models', new=AsyncMock(side_effect=[['gpt-a'], ['gpt-b']])) as mock_fetch:
+            first, stale, refreshed = asyncio.run(expire_and_fetch())
+
+        assert first == ['gpt-a']
+        assert stale == ['gpt-a']
+        assert refreshed == ['gpt-b']
+        assert mock_fetch.await_count == 2
+
+    def test_failed_revalidation_keeps_stale_list(self):
+        """Test that a failed background refresh keeps serving the stale list."""
+        from fastapi import HTTPException
+
+        async def expire_and_fetch():
+            await get_llm_models()
+            with patch('app.api.openai_api.time.monotonic', return_value=float('inf')):
+                await get_llm_models()
+                await openai_api._refresh_task
+                return await get_llm_models()
+
+        side_effect = [['gpt-a'], HTTPException(status_code=502, detail="upstream"), ['gpt-b']]
+        with patch.object(openai_api, '_fetch_llm_models', new=AsyncMock(side_effect=side_effect)):
+            result = asyncio.run(expire_and_fetch())
+
+        assert result == ['gpt-a']
+
+    def test_cache_keyed_on_credentials(self):
+        """Test that changing the API key bypasses the cached list."""
+        with patch.object(openai_api, '_fetch_llm_models', new=AsyncMock(return_value=['gpt-a'])) as mock_fetch, \
+             patch.object(openai_api.settings, 'openai_api_key', 'key-1'):
+            asyncio.run(get_llm_models())
+            with patch.object(openai_api.settings, 'openai_api_key', 'key-2'):
+                asyncio.run(get_llm_models())
+
+        assert mock_fetch.await_count == 2
+
+
+class TestOpenAiHttpClient:
+    """Test suite for the shared OpenAI HTTP client."""
+
+    def teardown_method(self):
+        asyncio.run(openai_api.close_http_client())
+
+    def test_client_reused(self):
+        """Test that the same pooled client is returned across calls."""
+        assert openai_api._get_http_client() is openai_api._get_http_client()
+
+    def test_client_recreated_after_close(self):
+        """Test that a closed client is replaced on next use."""
+        client = openai_api._get_http_client()
+        asyncio.run(openai_api.close_http_client())
+
+        assert client.is_closed
+        assert openai_api._get_http_client() is not client
@@ -346,3 +346,91 @@ class TestSavePersonalInfo:
         result = test_db.execute(text("SELECT * FROM personal")).first()
         assert result.first_name == "Min"
         assert result.last_name == "User"
+
+
+class TestGetPersonalInfoQueries:
+    """Test suite for the query issued by get_personal_info."""
+
+    def test_get_reads_row_each_request(self):
+        """Test that every GET reads the row, so a save is seen by all workers."""
+        from unittest.mock import MagicMock
+        from app.api.personal import get_personal_info
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.first.return_value = None
+
+        first = get_personal_info(mock_db)
+        get_personal_info(mock_db)
+
+        assert first.no_response_week == 4
+        assert mock_db.execute.call_count == 2
+
+    def test_get_fills_empty_columns(self):
+        """Test that empty columns fall back to blanks or the converter defaults."""
+        from unittest.mock import MagicMock
+        from app.api.personal import get_personal_info
+        from app.schemas.personal import PersonalResponse
+
+        columns = dict.fromkeys(PersonalResponse.model_fields)
+        columns.update(first_name="Jane", no_response_week=6, html2docx="python-docx")
+        mock_db = MagicMock()
+        mock_db.execute.return_value.first.return_value = MagicMock(_mapping=columns, no_response_week=6)
+
+        data = get_personal_info(mock_db)
+
+        assert data.first_name == 'Jane'
+        assert data.email == ''
+        assert data.cover_llm == ''
+        assert data.no_response_week == 6
+        assert data.html2docx == 'python-docx'
+        assert data.pdf2html == 'markitdown'
+
+
+class TestSavePersonalInfoQueries:
+    """Test suite for the queries issued by save_personal_info."""
+
+    def test_save_single_round_trip(self):
+        """Test that a save is one upsert statement with no preliminary SELECT."""
+        from unittest.mock import MagicMock
+        from app.api.personal import save_personal_info
+        from app.schemas.personal import PersonalCreate
+
+        mock_db = MagicMock()
+
+        result = save_personal_info(PersonalCreate(first_name="Jane", last_name="Smith"), mock_db)
+
+        assert result == {"status": "success"}
+        mock_db.execute.assert_called_once()
+        params = mock_db.execute.call_args[0][1]
+        assert params["first_name"] == "Jane"
+        assert "old_first_name" not in params
+        mock_db.commit.assert_called_once()
+
+
+class TestFormatPhoneNumber:
+    """Test suite for format_phone_number function."""
+
+    def test_format_ten_digits(self):
+        """Test that a 10-digit number is formatted."""
+        from app.api.personal import format_phone_number
+
+        assert format_phone_number("415.555.1234") == "(415) 555-1234"
+
+    def test_format_with_country_code(self):
+        """Test that an 11-digit US number keeps its country code."""
+        from app.api.personal import format_phone_number
+
+        assert format_phone_number("1-415-555-1234") == "+1 (415) 555-1234"
+
+    def test_format_unicode_separators(self):
+        """Test that non-ASCII separators are stripped too."""
+        from app.api.personal import format_phone_number
+
+        assert format_phone_number("415\u2011555\u00a01234") == "(415) 555-1234"
+
+    def test_non_standard_number_unchanged(self):
+        """Test that a number of another length is returned as-is."""
+        from app.api.personal import format_phone_number
+
+        assert format_phone_number("+44 20 7946 0958") == "+44 20 7946 0958"
+        assert format_phone_number("") == ""
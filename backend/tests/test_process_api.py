@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from fastapi import BackgroundTasks, HTTPException
+from app.api.process import poll_status, _confirm_process
+
+
+class TestPollStatus:
+    """Test suite for GET /v1/poll/{process_id} endpoint."""
+
+    def _poll(self, row, process_id=1):
+        mock_db = MagicMock()
+        mock_db.execute.return_value.first.return_value = row
+        background_tasks = BackgroundTasks()
+        state = poll_status(process_id, background_tasks, mock_db).process_state
+        return state, background_tasks, mock_db
+
+    def _row(self, failed=False, confirmed=False, completed=None):
+        return MagicMock(failed=failed, confirmed=confirmed, completed=completed)
+
+    def test_poll_running(self):
+        """Test that a process without a completed time is running."""
+        state, background_tasks, mock_db = self._poll(self._row())
+
+        assert state == "running"
+        assert background_tasks.tasks == []
+
+    def test_poll_complete_confirms_after_response(self):
+        """Test that the completion poll defers the confirm to a background task."""
+        state, background_tasks, mock_db = self._poll(self._row(completed=datetime(2025, 1, 1, 9, 0)))
+
+        assert state == "complete"
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_not_called()
+        assert len(background_tasks.tasks) == 1
+        assert background_tasks.tasks[0].func is _confirm_process
+        assert background_tasks.tasks[0].args == (1,)
+
+    def test_poll_confirmed(self):
+        """Test that an already confirmed process is not written again."""
+        state, background_tasks, mock_db = self._poll(self._row(confirmed=True, completed=datetime(2025, 1, 1, 9, 0)))
+
+        assert state == "confirmed"
+        assert background_tasks.tasks == []
+
+    def test_poll_failed(self):
+        """Test that failed takes priority over a completed time."""
+        state, background_tasks, mock_db = self._poll(self._row(failed=True, completed=datetime(2025, 1, 1, 9, 0)))
+
+        assert state == "failed"
+        assert background_tasks.tasks == []
+
+    def test_poll_not_found(self):
+        """Test polling an unknown process."""
+        with pytest.raises(HTTPException) as exc_info:
+            self._poll(None, process_id=999)
+
+        assert exc_info.value.status_code == 404
+
+
+class TestConfirmProcess:
+    """Test suite for the _confirm_process background task."""
+
+    @patch('app.api.process.SessionLocal')
+    def test_confirm_commits_own_session(self, mock_session_local):
+        """Test that the confirm runs and commits in a fresh session."""
+        mock_db = mock_session_local.return_value
+
+        _confirm_process(1)
+
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args[0][1] == {"process_id": 1}
+        mock_db.commit.assert_called_once()
+        mock_db.close.assert_called_once()
+
+    @patch('app.api.process.SessionLocal')
+    def test_confirm_failure_logged(self, mock_session_local):
+        """Test that a failed confirm is rolled back without raising."""
+        mock_db = mock_session_local.return_value
+        mock_db.execute.side_effect = Exception("connection lost")
+
+        _confirm_process(1)
+
+        mock_db.rollback.assert_called_once()
+        mock_db.close.assert_called_once()
@@ -1,3 +1,4 @@
+import json
 import pytest
 from sqlalchemy import text
 from datetime import date, time, timedelta
@@ -506,3 +507,178 @@ class TestListReminders:
         assert 'Job 1 reminder' in messages
         assert 'Job 2 reminder' in messages
         assert 'No job reminder' in messages
+
+
+class TestSaveReminderQueries:
+    """Test suite for the queries issued by create_or_update_reminder."""
+
+    def _save(self, **fields):
+        from unittest.mock import MagicMock
+        from app.api.reminder import create_or_update_reminder
+        from app.schemas.reminder import ReminderCreate
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.scalar.return_value = 7
+        reminder = ReminderCreate(reminder_date="2025-01-20", reminder_time="10:00:00",
+                                  reminder_message="Follow up", **fields)
+
+        assert create_or_update_reminder(reminder, mock_db) == {"status": "success"}
+        return mock_db
+
+    def test_create_single_statement(self):
+        """Test that a create is one statement with no reminder_id bound."""
+        mock_db = self._save()
+
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args[0][1]["reminder_id"] is None
+        # Autocommit connection: no separate COMMIT round-trip
+        mock_db.commit.assert_not_called()
+
+    def test_update_single_statement(self):
+        """Test that an update goes through the same statement with its id."""
+        mock_db = self._save(reminder_id=7)
+
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args[0][1]["reminder_id"] == 7
+        mock_db.commit.assert_not_called()
+
+
+class TestDeleteReminderQueries:
+    """Test suite for the query issued by delete_reminder."""
+
+    def test_delete_missing_reminder_single_statement(self):
+        """Test that a missing reminder is detected from RETURNING, not rowcount."""
+        from unittest.mock import MagicMock
+        from fastapi import HTTPException
+        from app.api.reminder import delete_reminder
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            delete_reminder(999, mock_db)
+
+        assert exc_info.value.status_code == 404
+        mock_db.execute.assert_called_once()
+
+
+class TestListRemindersQueries:
+    """Test suite for the query issued by list_reminders."""
+
+    def test_list_single_query_with_optional_job(self):
+        """Test that both list variants use one query and render its rows directly."""
+        from unittest.mock import MagicMock
+        from app.api.reminder import list_reminders
+        from app.schemas.reminder import ReminderListRequest
+
+        rows = [{"reminder_id": 1, "reminder_date": date(2025, 1, 20), "reminder_time": time(10, 0),
+                 "reminder_message": "Follow up", "job_id": None}]
+        mock_db = MagicMock()
+        mock_db.execute.return_value.mappings.return_value.all.return_value = rows
+
+        response = list_reminders(ReminderListRequest(duration="week", start_date="2025-01-20"), mock_db)
+
+        assert json.loads(response.body) == [{"reminder_id": 1, "reminder_date": "2025-01-20", "reminder_time": "10:00:00",
+                                              "reminder_message": "Follow up", "job_id": None}]
+        params = mock_db.execute.call_args[0][1]
+        assert params["job_id"] is None
+        assert params["start_date"] == date(2025, 1, 20)
+        assert params["days"] == 7
+
+
+class TestCreateReminders:
+    """Test suite for POST /v1/reminder/batch endpoint."""
+
+    @pytest.fixture
+    def sqlite_db(self):
+        """Provide an in-memory SQLite session with the reminder table."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from app.models.models import Reminder
+
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE job (job_id INTEGER PRIMARY KEY)"))
+        Reminder.__table__.create(engine)
+        with Session(engine) as session:
+            yield session
+        engine.dispose()
+
+    def test_create_reminders_batch(self, sqlite_db):
+        """Test that a batch is inserted and ids come back in request order."""
+        from app.api.reminder import create_reminders
+        from app.schemas.reminder import ReminderCreate
+
+        reminders = [
+            ReminderCreate(reminder_date=date(2025, 1, 20) + timedelta(days=i), reminder_time=time(9, 0),
+                           reminder_message=f"Reminder {i}", reminder_id=99)
+            for i in range(5)
+        ]
+
+        result = create_reminders(reminders, sqlite_db)
+
+        assert result["status"] == "success"
+        rows = sqlite_db.execute(text("SELECT reminder_id, reminder_message FROM reminder ORDER BY reminder_id")).all()
+        assert [row.reminder_message for row in rows] == [f"Reminder {i}" for i in range(5)]
+        # reminder_id in the payload is ignored
+        assert result["reminder_ids"] == [row.reminder_id for row in rows]
+        assert 99 not in result["reminder_ids"]
+
+    def test_create_reminders_empty(self, sqlite_db):
+        """Test that an empty batch is a no-op."""
+        from app.api.reminder import create_reminders
+
+        assert create_reminders([], sqlite_db) == {"status": "success", "reminder_ids": []}
+
+    def test_large_batch_uses_copy(self):
+        """Test that a batch over the threshold is loaded with COPY."""
+        from unittest.mock import MagicMock, patch
+        from app.api import reminder as reminder_api
+        from app.schemas.reminder import ReminderCreate
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.scalars.return_value.all.return_value = [7, 8, 9]
+        cursor = mock_db.connection.return_value.connection.cursor.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+        reminders = [
+            ReminderCreate(reminder_date="2025-01-20", reminder_time="09:00:00", reminder_message="Call back", job_id=3),
+            ReminderCreate(reminder_date="2025-01-21", reminder_time="08:00:00", reminder_message=""),
+            ReminderCreate(reminder_date="2025-01-22", reminder_time="10:30:00", reminder_message="Say \"hi\", again"),
+        ]
+
+        with patch.object(reminder_api, "REMINDER_COPY_THRESHOLD", 2):
+            result = reminder_api.create_reminders(reminders, mock_db)
+
+        assert result == {"status": "success", "reminder_ids": [7, 8, 9]}
+        assert mock_db.execute.call_args.args[1] == {"count": 3}
+        assert copied == [
+            "7,2025-01-20,09:00:00,Call back,False,3\r\n"
+            "8,2025-01-21,08:00:00,,False,\r\n"
+            "9,2025-01-22,10:30:00,\"Say \"\"hi\"\", again\",False,\r\n"
+        ]
+        cursor.close.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    def test_create_reminders_missing_job(self):
+        """Test that only the job foreign key violation is reported as a missing job."""
+        from unittest.mock import MagicMock, Mock
+        from fastapi import HTTPException
+        from sqlalchemy.exc import IntegrityError
+        from app.api.reminder import create_reminders
+        from app.schemas.reminder import ReminderCreate
+
+        reminders = [ReminderCreate(reminder_date="2025-01-20", reminder_time="09:00:00",
+                                    reminder_message="Follow up", job_id=999)]
+
+        for pgcode, constraint_name, status_code in (("23503", "reminder_job_id_fkey", 404), ("23502", None, 500)):
+            mock_db = MagicMock()
+            orig = Mock(pgcode=pgcode, diag=Mock(constraint_name=constraint_name))
+            mock_db.execute.side_effect = IntegrityError("INSERT", {}, orig)
+
+            with pytest.raises(HTTPException) as exc_info:
+                create_reminders(reminders, mock_db)
+
+            assert exc_info.value.status_code == status_code
+            mock_db.rollback.assert_called_once()
@@ -504,6 +504,30 @@ class TestCloneResume:
         assert response.status_code == 404
 
 
+    def test_next_copy_suffix_first_copy(self):
+        """Test that the first clone gets a plain -copy suffix."""
+        from app.api.resume import _next_copy_suffix
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.one.return_value = Mock(has_copy=False, highest=0)
+
+        assert _next_copy_suffix("original", "pdf", mock_db) == "-copy"
+        params = mock_db.execute.call_args.args[1]
+        assert params["copy_name"] == "original-copy.pdf"
+        assert params["pattern"] == r"^original\-copy[0-9]*\.pdf$"
+
+    def test_next_copy_suffix_numbered(self):
+        """Test that later clones go one past the highest number in one query."""
+        from app.api.resume import _next_copy_suffix
+
+        mock_db = MagicMock()
+        mock_db.execute.return_value.one.return_value = Mock(has_copy=True, highest=10)
+
+        assert _next_copy_suffix("original", "", mock_db) == "-copy11"
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args.args[1]["number_pattern"] == r"^original\-copy([0-9]+)$"
+
+
 class TestResumeExtraction:
     """Test suite for POST /v1/resume/extract endpoint."""
 
@@ -707,3 +731,155 @@ class TestGetRewriteData:
         response = client.get("/v1/resume/rewrite/999")
 
         assert response.status_code == 404
+
+
+class TestCalculateKeywordScore:
+    """Test suite for calculate_keyword_score helper."""
+
+    def test_whole_word_case_insensitive(self):
+        """Test that keywords match whole words regardless of case."""
+        from app.api.resume import calculate_keyword_score
+
+        text_body = "Built REST APIs in Python and SQL on AWS."
+        assert calculate_keyword_score(["python", "sql", "aws", "java"], text_body) == 75
+        assert calculate_keyword_score(["API"], text_body) == 0
+
+    def test_empty_inputs(self):
+        """Test that missing keywords or text score zero."""
+        from app.api.resume import calculate_keyword_score
+
+        assert calculate_keyword_score([], "Python") == 0
+        assert calculate_keyword_score(["Python"], "") == 0
+
+    def test_overlapping_keywords(self):
+        """Test that keywords sharing text are each matched."""
+        from app.api.resume import calculate_keyword_score
+
+        text_body = "Applied machine learning with Python 3."
+        assert calculate_keyword_score(["machine learning", "learning", "Python", "Python 3"], text_body) == 100
+        assert calculate_keyword_score(["Python 3", "Python", "Python 2"], text_body) == 66
+
+    def test_duplicate_keywords_counted(self):
+        """Test that repeated keywords each count toward the score."""
+        from app.api.resume import calculate_keyword_score
+
+        assert calculate_keyword_score(["SQL", "sql", "Java"], "SQL only") == 66
+
+    def test_keyword_set_compiled_once(self):
+        """Test that a repeated keyword list reuses the cached pattern."""
+        from app.api.resume import calculate_keyword_score, _compile_keyword_set
+
+        _compile_keyword_set.cache_clear()
+        calculate_keyword_score(["Python", "SQL"], "Python and SQL")
+        calculate_keyword_score(["sql", "python"], "Python only")
+
+        info = _compile_keyword_set.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestMakeUniqueNames:
+    """Test suite for make_unique_resume_title and make_unique_filename helpers."""
+
+    @staticmethod
+    def _mock_db(taken):
+        mock_db = MagicMock()
+        mock_db.execute.return_value.scalars.return_value = MagicMock(
+            all=Mock(return_value=list(taken)), __iter__=Mock(return_value=iter(taken))
+        )
+        return mock_db
+
+    def test_title_unused(self):
+        """Test that an unused title is returned unchanged."""
+        from app.api.resume import make_unique_resume_title
+
+        assert make_unique_resume_title("Engineer", self._mock_db([])) == "Engineer"
+
+    def test_title_lowest_free_counter(self):
+        """Test that the lowest free counter is used in one query."""
+        from app.api.resume import make_unique_resume_title
+
+        mock_db = self._mock_db(["Engineer (v2)", "Engineer", "Engineer (1)", "Engineer (3)"])
+
+        assert make_unique_resume_title("Engineer (v2)", mock_db) == "Engineer (v2) (1)"
+        mock_db = self._mock_db(["Engineer", "Engineer (1)", "Engineer (3)"])
+        assert make_unique_resume_title("Engineer", mock_db) == "Engineer (2)"
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args.args[1]["pattern"] == r"^Engineer \([1-9][0-9]*\)$"
+
+    def test_filename_unused(self):
+        """Test that an unused filename is returned unchanged."""
+        from app.api.resume import make_unique_filename
+
+        assert make_unique_filename("resume.pdf", self._mock_db([])) == "resume.pdf"
+
+    def test_filename_dated_then_numbered(self):
+        """Test that the dated name is tried before numbered dated names."""
+        from app.api import resume as resume_api
+
+        with patch.object(resume_api, "datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value.strftime.return_value = "2025_01_20"
+
+            assert resume_api.make_unique_filename("resume.pdf", self._mock_db(["resume.pdf"])) == "resume_2025_01_20.pdf"
+
+            mock_db = self._mock_db(["resume.pdf", "resume_2025_01_20.pdf", "resume_2025_01_20_1.pdf"])
+            assert resume_api.make_unique_filename("resume.pdf", mock_db) == "resume_2025_01_20_2.pdf"
+            mock_db.execute.assert_called_once()
+
+            mock_db = self._mock_db(["resume", "resume_2025_01_20"])
+            assert resume_api.make_unique_filename("resume", mock_db) == "resume_2025_01_20_1"
+
+
+class TestSaveUpload:
+    """Test suite for the _save_upload helper."""
+
+    def test_upload_written_in_chunks(self, tmp_path):
+        """Test that an upload is copied to disk chunk by chunk."""
+        import asyncio
+        from fastapi import UploadFile
+        from app.api import resume as resume_api
+
+        payload = b"%PDF" + bytes(range(256)) * 20
+        upload = UploadFile(BytesIO(payload), filename="resume.pdf")
+        file_path = tmp_path / "resume.pdf"
+
+        with patch.object(resume_api, "UPLOAD_CHUNK_SIZE", 1000), \
+             patch.object(upload, "read", wraps=upload.read) as mock_read:
+            asyncio.run(resume_api._save_upload(upload, file_path))
+
+        assert file_path.read_bytes() == payload
+        assert all(call.args == (1000,) for call in mock_read.call_args_list)
+        assert mock_read.call_count == 7
+
+
+class TestCleanFilenamePart:
+    """Test suite for clean_filename_part helper."""
+
+    def test_clean_filename_part(self):
+        """Test that punctuation is dropped and separators become underscores."""
+        from app.api.resume import clean_filename_part
+
+        assert clean_filename_part(" Acme, Inc. - Sr. Engineer (Remote) ") == "acme_inc_sr_engineer_remote"
+        assert clean_filename_part("Data-Science  Lead") == "data_science_lead"
+
+
+class TestValidateFileFormat:
+    """Test suite for validate_file_format helper."""
+
+    def test_valid_format(self):
+        """Test that a known extension is returned."""
+        from app.api.resume import validate_file_format
+
+        assert validate_file_format("pdf") == "pdf"
+
+    def test_invalid_format(self):
+        """Test that an unknown extension is rejected with the allowed list."""
+        from fastapi import HTTPException
+        from app.api.resume import validate_file_format
+        from app.models.models import FileFormat
+
+        with pytest.raises(HTTPException) as exc_info:
+            validate_file_format("exe")
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail.endswith(', '.join(e.value for e in FileFormat))
@@ -43,6 +43,8 @@ CREATE TABLE IF NOT EXISTS job (
 );
 CREATE INDEX IF NOT EXISTS job_job_status_idx ON job (job_status);
 CREATE INDEX IF NOT EXISTS job_last_activity_idx ON job (last_activity);
+-- active job list / dropdown: WHERE job_active ORDER BY last_activity DESC, date_applied DESC
+CREATE INDEX IF NOT EXISTS job_active_last_activity_idx ON job (last_activity DESC, date_applied DESC) INCLUDE (company, job_title) WHERE job_active = true;
 
 CREATE TABLE IF NOT EXISTS job_detail (
 	job_id                  int NOT NULL REFERENCES job (job_id) ON DELETE CASCADE ON UPDATE CASCADE,
@@ -102,6 +104,8 @@ CREATE TABLE IF NOT EXISTS cover_letter (
     letter_created          timestamp(0) without time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (cover_id)
 );
+-- active letter list: WHERE letter_active ORDER BY letter_created DESC, cover_id DESC (keyset on both)
+CREATE INDEX IF NOT EXISTS cover_letter_active_created_idx ON cover_letter (letter_created DESC, cover_id DESC) INCLUDE (job_id, resume_id, file_name, letter_tone, letter_length) WHERE letter_active = true;
 
 CREATE TABLE IF NOT EXISTS contact (
     contact_id              serial NOT NULL,
@@ -135,6 +139,9 @@ CREATE TABLE IF NOT EXISTS note (
     note_created            timestamp(0) without time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (note_id)
 );
+-- active note list: WHERE note_active ORDER BY note_created DESC, note_id DESC (keyset on both)
+CREATE INDEX IF NOT EXISTS note_active_created_idx ON note (note_created DESC, note_id DESC) WHERE note_active = true;
+CREATE INDEX IF NOT EXISTS note_active_job_created_idx ON note (job_id, note_created DESC, note_id DESC) WHERE note_active = true;
 
 CREATE TABLE IF NOT EXISTS calendar (
     calendar_id             serial NOT NULL,
@@ -166,6 +173,8 @@ CREATE TABLE IF NOT EXISTS reminder (
 	reminder_updated        timestamp(0) without time zone DEFAULT NULL,
     PRIMARY KEY (reminder_id)
 );
+CREATE INDEX IF NOT EXISTS reminder_active_date_idx ON reminder (reminder_date DESC, reminder_time DESC) INCLUDE (reminder_id, reminder_message, job_id) WHERE reminder_dismissed IS NOT TRUE;
+CREATE INDEX IF NOT EXISTS reminder_active_job_date_idx ON reminder (job_id, reminder_date DESC, reminder_time DESC) INCLUDE (reminder_id, reminder_message) WHERE reminder_dismissed IS NOT TRUE;
 
 CREATE TABLE IF NOT EXISTS communication (
     communication_id        serial NOT NULL,